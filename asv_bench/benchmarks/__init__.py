@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# Copyright (c) 2011-2023, wradlib developers.
+# Distributed under the MIT License. See LICENSE.txt for more info.
+
+"""
+Benchmarks for wradlib, run with airspeed velocity (asv).
+
+Benchmarks use synthetic data only, so no wradlib-data download is needed.
+"""
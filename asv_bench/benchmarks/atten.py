@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# Copyright (c) 2011-2023, wradlib developers.
+# Distributed under the MIT License. See LICENSE.txt for more info.
+
+import logging
+
+import numpy as np
+from scipy import ndimage
+
+from wradlib import atten
+
+
+def make_volume(nsweeps=10, nrays=360, nbins=1000, *, peak=40.0, seed=42):
+    """Create synthetic reflectivity volume [dBZ] with rain cells."""
+    rng = np.random.default_rng(seed)
+    vol = rng.uniform(-10, 15, (nsweeps, nrays, nbins))
+    ray = np.arange(nrays)[:, None]
+    rbin = np.arange(nbins)[None, :]
+    for _ in range(8):
+        r0 = rng.integers(0, nrays)
+        b0 = rng.integers(0, nbins)
+        dist = np.minimum(np.abs(ray - r0), nrays - np.abs(ray - r0)) ** 2
+        dist = dist + ((rbin - b0) * 360 / nbins) ** 2
+        vol += peak * np.exp(-dist / 200.0)
+    return vol
+
+
+def correct_attenuation_hb_gatewise(gateset, *, mode="nan", thrs=59.0):
+    """Gate by gate correction as done before the recursion engine."""
+    a, b, gate_length = 0.000167, 0.7, 1.0
+    pia = np.empty(gateset.shape)
+    pia[..., 0] = 0.0
+    ksum = 0.0
+    for gate in range(gateset.shape[-1] - 1):
+        k = a * (10.0 ** ((gateset[..., gate] + ksum) / 10.0)) ** b * 2.0 * gate_length
+        ksum += k
+        pia[..., gate + 1] = ksum
+        overflow = (gateset[..., gate + 1] + ksum) > thrs
+        if np.any(overflow):
+            if mode == "nan":
+                pia[..., gate + 1][overflow] = np.nan
+            elif mode == "zero":
+                pia[..., gate + 1][overflow] = 0.0
+    return pia
+
+
+class CorrectAttenuationHB:
+    params = [[1, 10], ["nan", "warn"]]
+    param_names = ["nsweeps", "mode"]
+
+    def setup(self, nsweeps, mode):
+        self.vol = make_volume(nsweeps)
+        logging.getLogger("attcorr").disabled = True
+
+    def teardown(self, nsweeps, mode):
+        logging.getLogger("attcorr").disabled = False
+
+    def time_correct_attenuation_hb(self, nsweeps, mode):
+        atten.correct_attenuation_hb(self.vol, mode=mode)
+
+    def time_correct_attenuation_hb_gatewise(self, nsweeps, mode):
+        correct_attenuation_hb_gatewise(self.vol, mode=mode)
+
+    def time_calc_attenuation_forward(self, nsweeps, mode):
+        atten.calc_attenuation_forward(self.vol)
+
+
+def sector_filter_rowwise(mask, min_sector_size):
+    """Row by row sector filter as done before filtering the whole stack."""
+    kernela = np.ones([1] * (mask.ndim - 1) + [min_sector_size])
+    kernelb = np.ones((min_sector_size,))
+    forward_origin = -(min_sector_size - (min_sector_size // 2)) + min_sector_size % 2
+    backward_origin = (min_sector_size - (min_sector_size // 2)) - 1
+    forward_sum = ndimage.correlate1d(
+        mask.astype(np.int_), kernelb, axis=-1, mode="wrap", origin=forward_origin
+    )
+    backward_sum = ndimage.correlate1d(
+        mask.astype(np.int_), kernelb, axis=-1, mode="wrap", origin=backward_origin
+    )
+    forward_corners = forward_sum == min_sector_size
+    backward_corners = backward_sum == min_sector_size
+    forward_large_sectors = np.zeros_like(mask)
+    backward_large_sectors = np.zeros_like(mask)
+    for iii in range(mask.shape[0]):
+        forward_large_sectors[iii] = ndimage.binary_dilation(
+            forward_corners[iii], kernela[0], origin=forward_origin
+        ).astype(int)
+        backward_large_sectors[iii] = ndimage.binary_dilation(
+            backward_corners[iii], kernela[0], origin=backward_origin
+        ).astype(int)
+    return forward_large_sectors | backward_large_sectors
+
+
+def iterate_constrained_loop(gateset, a_cand, b_cand, constraints, constraint_args):
+    """Candidate by candidate iteration as done before batching candidates."""
+    pia = np.zeros_like(gateset)
+    beams2correct = np.where(np.ones(gateset.shape[:-1], dtype=np.bool_))
+    small_sectors = np.zeros(gateset.shape[:-1], dtype=np.bool_)
+    for a, b in zip(a_cand, b_cand):
+        pia[beams2correct] = atten.calc_attenuation_forward(
+            gateset[beams2correct], a=a, b=b
+        )
+        incorrectbeams = np.zeros(gateset.shape[:-1], dtype=np.bool_)
+        for constraint, constraint_arg in zip(constraints, constraint_args):
+            incorrectbeams |= constraint(gateset, pia, *constraint_arg)
+        large_sectors = sector_filter_rowwise(incorrectbeams, 10)
+        small_sectors |= incorrectbeams & ~large_sectors
+        beams2correct = np.where(large_sectors)
+        if len(pia[beams2correct]) == 0:
+            break
+    return pia, small_sectors
+
+
+class CorrectAttenuationConstrained:
+    """Constrained correction with the settings of Jacobi et al."""
+
+    params = [[40.0, 60.0]]
+    param_names = ["peak"]
+
+    def setup(self, peak):
+        self.vol = make_volume(4, 360, 500, peak=peak)
+        self.kwargs = dict(
+            a_max=1.67e-4,
+            a_min=2.33e-5,
+            n_a=100,
+            b_max=0.7,
+            b_min=0.65,
+            n_b=6,
+            gate_length=1.0,
+            constraints=[atten.constraint_dbz, atten.constraint_pia],
+            constraint_args=[[59.0], [20.0]],
+        )
+        self.b_cand = np.repeat(0.7 - 0.01 * np.arange(6), 100)
+        self.a_cand = np.tile(1.67e-4 - (1.67e-4 - 2.33e-5) / 99 * np.arange(100), 6)
+
+    def time_correct_attenuation_constrained(self, peak):
+        atten.correct_attenuation_constrained(self.vol, **self.kwargs)
+
+    def time_iterate_constrained(self, peak):
+        shape = self.vol.shape[:-1]
+        atten._iterate_attenuation_constrained(
+            self.vol,
+            np.zeros_like(self.vol),
+            np.empty(shape),
+            np.empty(shape),
+            self.a_cand,
+            self.b_cand,
+            constraints=self.kwargs["constraints"],
+            constraint_args=self.kwargs["constraint_args"],
+        )
+
+    def time_iterate_constrained_loop(self, peak):
+        iterate_constrained_loop(
+            self.vol,
+            self.a_cand,
+            self.b_cand,
+            self.kwargs["constraints"],
+            self.kwargs["constraint_args"],
+        )
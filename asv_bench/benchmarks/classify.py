@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# Copyright (c) 2011-2023, wradlib developers.
+# Distributed under the MIT License. See LICENSE.txt for more info.
+
+import numpy as np
+
+from wradlib import classify
+
+from .atten import make_volume
+
+
+def filter_gabella_a_roll(obj, wsize, tr1):
+    """Neighbour count by rolling the full image as done before."""
+    nn = wsize // 2
+    count = -np.ones(obj.shape, dtype=int)
+    for sa in range(-nn, nn + 1):
+        refa = np.roll(obj, sa, axis=0)
+        for sr in range(-nn, nn + 1):
+            refr = np.roll(refa, sr, axis=1)
+            count += (obj - refr) < tr1
+    count[:, 0:nn] = wsize**2
+    count[:, -nn:] = wsize**2
+    return count
+
+
+class FilterGabellaA:
+    params = [[5, 7, 9, 11]]
+    param_names = ["wsize"]
+
+    def setup(self, wsize):
+        self.vol = make_volume(10)
+
+    def time_filter_gabella_a(self, wsize):
+        classify.filter_gabella_a(self.vol[0], wsize, 6.0)
+
+    def time_filter_gabella_a_roll(self, wsize):
+        filter_gabella_a_roll(self.vol[0], wsize, 6.0)
+
+    def time_filter_gabella_a_volume(self, wsize):
+        classify.filter_gabella_a(self.vol, wsize, 6.0)
+
+
+class FilterGabella:
+    def setup(self):
+        self.vol = make_volume(10)
+
+    def time_filter_gabella_volume(self):
+        classify.filter_gabella(self.vol)
+
+    def time_filter_gabella_sweepwise(self):
+        for sweep in self.vol:
+            classify.filter_gabella(sweep)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# Copyright (c) 2011-2023, wradlib developers.
+# Distributed under the MIT License. See LICENSE.txt for more info.
+
+import numpy as np
+
+from wradlib import georef
+
+from .atten import make_volume
+
+
+class MaximumIntensityProjection:
+    params = [[0.0, 45.0]]
+    param_names = ["angle"]
+
+    def setup(self, angle):
+        self.vol = make_volume(10)
+        self.r = np.arange(self.vol.shape[-1], dtype=np.float64) * 250.0
+        self.az = np.arange(self.vol.shape[-2], dtype=np.float64)
+        self.elev = np.linspace(0.5, 20.0, len(self.vol))
+
+    def time_maximum_intensity_projection(self, angle):
+        georef.maximum_intensity_projection(
+            self.vol[0], r=self.r, az=self.az, angle=angle, elev=self.elev[0]
+        )
+
+    def time_maximum_intensity_projection_volume(self, angle):
+        georef.maximum_intensity_projection(
+            self.vol, r=self.r, az=self.az, angle=angle, elev=self.elev
+        )
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# Copyright (c) 2011-2023, wradlib developers.
+# Distributed under the MIT License. See LICENSE.txt for more info.
+
+import io
+
+import numpy as np
+
+from wradlib.io import radolan
+
+
+def make_runlength_buffer(nlines, ncol, *, seed=42):
+    """Create synthetic runlength coded buffer (PG/PC/PZ)."""
+    rng = np.random.default_rng(seed)
+    buf = bytearray()
+    for i in range(nlines):
+        buf.append(i % 200 + 11)
+        offset = int(rng.integers(0, ncol // 2))
+        rem = ncol - offset
+        while offset > 238:
+            buf.append(255)
+            offset -= 239
+        buf.append(offset + 16)
+        while rem > 0:
+            width = min(int(rng.integers(1, 16)), rem)
+            buf.append((width << 4) | int(rng.integers(0, 10)))
+            rem -= width
+        buf.append(10)
+    buf.append(4)
+    return bytes(buf)
+
+
+def make_dx_product(nbeams=360, *, seed=42):
+    """Create synthetic DX product."""
+    rng = np.random.default_rng(seed)
+    words = []
+    for i in range(nbeams):
+        words += [2**13, i * 10, 5]
+        nbin = 0
+        while nbin < 128:
+            if rng.random() < 0.2:
+                nzeros = min(int(rng.integers(1, 20)), 128 - nbin)
+                words.append(4096 | nzeros)
+                nbin += nzeros
+            else:
+                words.append(int(rng.integers(0, 4096)))
+                nbin += 1
+    raw = np.array(words, dtype=np.uint16).tobytes()
+    header = "DX021655109080608BY{:7d}VS 2CO0CD2CS0EP0.30.30.40.50.50.40.40.4MS  0"
+    size = len(header.format(0)) + 1 + len(raw)
+    return (header.format(size) + "\x03").encode() + raw
+
+
+def unpack_dx_beamwise(raw):
+    """Beam by beam unpacking as done before unpacking all beams at once."""
+    newazimuths = np.append(np.where(raw == 2**13)[0], len(raw))
+    beams = [
+        radolan.unpack_dx(raw[newazimuths[i] + 3 : newazimuths[i + 1]])
+        for i in range(newazimuths.size - 1)
+    ]
+    return np.array(beams)
+
+
+def decode_linewise(binarr, attrs):
+    """Line by line decoding as done before whole-buffer decoding."""
+    buf = io.BytesIO(binarr)
+    line = radolan.read_radolan_runlength_line(buf)
+    arr = radolan.decode_radolan_runlength_line(line, attrs)
+    line = radolan.read_radolan_runlength_line(buf)
+    while line is not None:
+        arr = np.vstack((arr, radolan.decode_radolan_runlength_line(line, attrs)))
+        line = radolan.read_radolan_runlength_line(buf)
+    if mh := attrs.get("maxheight", False):
+        arr = arr.reshape(mh, attrs["nrow"], attrs["ncol"])
+    return np.flip(arr, axis=-2)
+
+
+class DecodeRunlength:
+    params = [[False, 12]]
+    param_names = ["maxheight"]
+
+    def setup(self, maxheight):
+        self.attrs = {
+            "ncol": 460,
+            "nrow": 460,
+            "maxheight": maxheight,
+            "nodataflag": 255,
+        }
+        self.binarr = make_runlength_buffer(460 * (maxheight or 1), 460)
+
+    def time_decode_radolan_runlength_array(self, maxheight):
+        radolan.decode_radolan_runlength_array(self.binarr, self.attrs)
+
+    def time_decode_linewise(self, maxheight):
+        decode_linewise(self.binarr, self.attrs)
+
+
+class ReadDX:
+    def setup(self):
+        self.dx = make_dx_product()
+        self.raw = radolan._read_dx_raw(io.BytesIO(self.dx))[0]
+        self.stack = [make_dx_product(seed=seed) for seed in range(24)]
+
+    def time_read_dx(self):
+        radolan.read_dx(io.BytesIO(self.dx))
+
+    def time_decode_dx(self):
+        radolan._decode_dx_raw(self.raw)
+
+    def time_unpack_dx_beamwise(self):
+        unpack_dx_beamwise(self.raw)
+
+    def time_read_dx_stack(self):
+        radolan.read_dx_stack([io.BytesIO(dx) for dx in self.stack])
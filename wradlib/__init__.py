@@ -8,6 +8,7 @@ wradlib
 """
 
 # Make sure that deprecation warnings get printed by default
+import importlib as _importlib
 import warnings as _warnings
 
 _warnings.filterwarnings("always", category=DeprecationWarning, module="wradlib")
@@ -20,24 +21,39 @@ except Exception:
     # Disable minimum version checks on downstream libraries.
     __version__ = "999"
 
-# import subpackages
-from . import adjust  # noqa
-from . import atten  # noqa
-from . import classify  # noqa
-from . import comp  # noqa
-from . import dp  # noqa
-from . import georef  # noqa
-from . import io  # noqa
-from . import ipol  # noqa
-from . import qual  # noqa
-from . import trafo  # noqa
-from . import util  # noqa
-from . import verify  # noqa
-from . import vis  # noqa
-from . import vpr  # noqa
+# register xarray accessors
 from . import xarray  # noqa
-from . import zonalstats  # noqa
-from . import zr  # noqa
-from .util import show_versions  # noqa
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+# subpackages are imported on first access
+_subpackages = [
+    "adjust",
+    "atten",
+    "classify",
+    "comp",
+    "dp",
+    "georef",
+    "io",
+    "ipol",
+    "qual",
+    "trafo",
+    "util",
+    "verify",
+    "vis",
+    "vpr",
+    "zonalstats",
+    "zr",
+]
+
+__all__ = sorted(_subpackages + ["xarray", "show_versions"])
+
+
+def __getattr__(name):
+    if name in _subpackages:
+        return _importlib.import_module(f".{name}", __name__)
+    if name == "show_versions":
+        return _importlib.import_module(".util", __name__).show_versions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -113,7 +113,7 @@ __all__ = [
 __doc__ = __doc__.format("\n   ".join(__all__))
 
 import numpy as np
-from scipy import spatial, stats
+from scipy import stats
 
 from wradlib import ipol, util
 
@@ -185,6 +185,11 @@ class AdjustBase(ipol.IpolBase):
 
     """
 
+    # whether __call__ adjusts elementwise with an interpolated error field,
+    # so that all held-out gages (self.xvalidate) or all time steps with the
+    # same valid gages (self.batch) can be handled in one call
+    _elementwise = False
+
     def __init__(
         self,
         obs_coords,
@@ -236,6 +241,8 @@ class AdjustBase(ipol.IpolBase):
         self.get_raw_at_obs = RawAtObs(
             self.obs_coords, self.raw_coords, nnear=nnear_raws, stat=stat
         )
+        # leave-one-out interpolators of self.xvalidate
+        self._loo_ips = {}
 
     def _checkip(self, ix, targets):
         """INTERNAL: Return a revised instance of the Interpolator class.
@@ -259,7 +266,8 @@ class AdjustBase(ipol.IpolBase):
             observation-radar pairs
         targets : :py:class:`numpy:numpy.ndarray`
             array of floats of shape (number of target points, 2)
-            Target coordinates for the interpolation
+            Target coordinates for the interpolation, or an instance of
+            :class:`wradlib.ipol.IpolBase` which is returned as is
 
         Returns
         -------
@@ -267,13 +275,18 @@ class AdjustBase(ipol.IpolBase):
             an instance of a class that inherited from :class:`wradlib.ipol.IpolBase`
 
         """
+        # interpolator given from self.xvalidate
+        if isinstance(targets, ipol.IpolBase):
+            return targets
         # first, set interpolation targets (default: the radar coordinates)
         targets_default = False
         if targets is None:
             targets = self.raw_coords
             targets_default = True
         # second, compute inverse distance neighbours
-        if (not len(ix) == len(self.obs_coords)) or (not targets_default):
+        if not targets_default:
+            return self.ipclass(self.obs_coords[ix], targets, **self.ipargs)
+        elif not len(ix) == len(self.obs_coords):
             return self.ipclass(self.obs_coords[ix], targets, **self.ipargs)
         else:
             return self.ip
@@ -329,6 +342,78 @@ class AdjustBase(ipol.IpolBase):
         )
         return rawatobs, ix
 
+    def batch(self, obs, raw):
+        """Returns adjusted ``raw`` values for a series of time steps.
+
+        The radar values at the gages are retrieved for all time steps at
+        once. Time steps which share the same set of valid gages are adjusted
+        together, so that interpolators are only created once per set of
+        valid gages.
+
+        Parameters
+        ----------
+        obs : :py:class:`numpy:numpy.ndarray`
+            array of floats of shape (num gauges, num times)
+            gage observations
+        raw : :py:class:`numpy:numpy.ndarray`
+            array of floats of shape (num radar cells, num times)
+            raw (unadjusted) radar values
+
+        Returns
+        -------
+        output : :py:class:`numpy:numpy.ndarray`
+            array of floats of shape (num radar cells, num times)
+            adjusted radar values
+
+        Note
+        ----
+        In contrast to :meth:`~wradlib.adjust.AdjustBase.__call__`, the valid
+        gages are determined separately for each time step.
+        """
+        if obs.ndim != 2 or raw.ndim != 2 or obs.shape[1] != raw.shape[1]:
+            raise ValueError(
+                "`obs` and `raw` must be of shape (num gauges, num times) and "
+                "(num radar cells, num times)."
+            )
+        rawatobs = self.get_raw_at_obs(raw, obs)
+        valid = util._isvalid(obs, minval=self.minval) & util._isvalid(
+            rawatobs, minval=self.minval
+        )
+        patterns, inverse = np.unique(valid.T, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        # interpolators per set of valid gages, only kept for this call
+        ips = {}
+        out = None
+        for i, pattern in enumerate(patterns):
+            ix = np.flatnonzero(pattern)
+            cols = np.flatnonzero(inverse == i)
+            if self._elementwise:
+                key = pattern.tobytes()
+                if key not in ips and len(ix) >= self.mingages:
+                    ips[key] = self._checkip(ix, None)
+                res = self.__call__(
+                    obs[:, cols],
+                    raw[:, cols],
+                    targets=ips.get(key),
+                    rawatobs=rawatobs[:, cols],
+                    ix=ix,
+                )
+            else:
+                res = np.stack(
+                    [
+                        self.__call__(
+                            obs[:, col], raw[:, col], rawatobs=rawatobs[:, col], ix=ix
+                        )
+                        for col in cols
+                    ],
+                    axis=-1,
+                )
+            if out is None:
+                out = np.empty(raw.shape, dtype=np.result_type(res, raw))
+            out[:, cols] = res
+        return out
+
     def xvalidate(self, obs, raw):
         """Leave-One-Out Cross Validation, applicable to all gage adjustment
         classes.
@@ -338,15 +423,22 @@ class AdjustBase(ipol.IpolBase):
         This way, the actual adjustment procedure has only to be defined *once*
         in the :meth:`~wradlib.adjust.AdjustBase.__call__` method.
 
+        For adjustment classes which interpolate an error field with
+        :class:`~wradlib.ipol.Idw` or :class:`~wradlib.ipol.Nearest`, the
+        neighbours of all gages are queried only once (leaving out the gage
+        itself) and all held-out estimates are computed in one pass. Otherwise
+        the adjustment is repeated for each held-out gage.
+
         The output of this method can be evaluated by using the
         `verify.ErrorMetrics` class.
 
         Parameters
         ----------
         obs : :py:class:`numpy:numpy.ndarray`
-            array of floats
+            array of floats, shape (num gauges, ) or (num gauges, num times)
         raw : :py:class:`numpy:numpy.ndarray`
-            array of floats
+            array of floats, shape (num radar cells, ) or
+            (num radar cells, num times)
 
         Returns
         -------
@@ -358,11 +450,22 @@ class AdjustBase(ipol.IpolBase):
             array of floats
             estimated values at the valid observation locations
 
+        Note
+        ----
+        For two-dimensional input, each column is cross validated as a
+        separate time step with its own set of valid gages.
         """
+        if obs.ndim == 2:
+            estatobs = np.full(obs.shape, np.nan)
+            for t in range(obs.shape[1]):
+                estatobs[:, t] = self.xvalidate(obs[:, t], raw[:, t])[1]
+            return obs, estatobs
+
         rawatobs, ix = self._get_valid_pairs(obs, raw)
-        self.get_raws_directly_at_obs = RawAtObs(
-            self.obs_coords, self.raw_coords, nnear=1
-        )
+        if getattr(self, "get_raws_directly_at_obs", None) is None:
+            self.get_raws_directly_at_obs = RawAtObs(
+                self.obs_coords, self.raw_coords, nnear=1
+            )
         raws_directly_at_obs = self.get_raws_directly_at_obs(raw)
         ix = np.intersect1d(ix, util._idvalid(raws_directly_at_obs, minval=self.minval))
         # Container for estimation results at the observation location
@@ -371,19 +474,85 @@ class AdjustBase(ipol.IpolBase):
         if len(ix) <= (self.mingages - 1):
             # not enough gages for cross validation: return empty arrays
             return obs, estatobs
+        # leaving one out, too few gages remain: unadjusted raw values
+        if len(ix) - 1 < self.mingages:
+            estatobs[ix] = raws_directly_at_obs[ix]
+            return obs, estatobs
+        # All held-out gages at once
+        ip = self._get_loo_ip(ix)
+        if ip is not None:
+            estatobs[ix] = self.__call__(
+                obs,
+                raws_directly_at_obs[ix],
+                targets=ip,
+                rawatobs=rawatobs,
+                ix=ix,
+            )
+            return obs, estatobs
         # Now iterate over valid pairs
         for i in ix:
             # Pass all valid pairs except ONE which you pass as target
             ix_adjust = np.setdiff1d(ix, [i])
-            estatobs[i] = self.__call__(
+            estatobs[i : i + 1] = self.__call__(
                 obs,
                 raws_directly_at_obs[i],
-                self.obs_coords[i].reshape((1, -1)),
-                rawatobs,
-                ix_adjust,
+                targets=self.obs_coords[i].reshape((1, -1)),
+                rawatobs=rawatobs,
+                ix=ix_adjust,
             )
         return obs, estatobs
 
+    def _get_loo_ip(self, ix):
+        """INTERNAL: Return a leave-one-out interpolator for the valid gages.
+
+        The interpolator estimates the value at each valid gage from the
+        other valid gages. It is only available for adjustment classes which
+        interpolate elementwise with :class:`~wradlib.ipol.Idw` or
+        :class:`~wradlib.ipol.Nearest`, otherwise None is returned.
+
+        Parameters
+        ----------
+        ix : :py:class:`numpy:numpy.ndarray`
+            array of integers
+            These are the indices of observation points with valid
+            observation-radar pairs
+
+        Returns
+        -------
+        output : :class:`wradlib.ipol.IpolBase` or None
+        """
+        if not (
+            self._elementwise and issubclass(self.ipclass, (ipol.Idw, ipol.Nearest))
+        ):
+            return None
+        key = ix.tobytes()
+        cache = self._loo_ips
+        if key in cache:
+            cache[key] = ip = cache.pop(key)
+            return ip
+
+        coords = self.obs_coords[ix]
+        ipargs = dict(self.ipargs)
+        if issubclass(self.ipclass, ipol.Idw):
+            nnear = min(ipargs.get("nnearest", 4), len(ix) - 1)
+            ipargs.update(nnearest=nnear + 1)
+        else:
+            nnear = min(ipargs.get("remove_missing", 0) + 1, len(ix) - 1)
+            ipargs.update(remove_missing=nnear)
+        ip = self.ipclass(src=coords, trg=coords, **ipargs)
+        # drop the self-match of each gage, or the farthest neighbour
+        # if the gage itself is not amongst its neighbours (duplicates)
+        isself = ip.ix == np.arange(len(ix))[:, np.newaxis]
+        isself[~isself.any(axis=1), -1] = True
+        ip.ix = ip.ix[~isself].reshape(len(ix), nnear)
+        ip.dists = ip.dists[~isself].reshape(len(ix), nnear)
+        ip.nnearest = nnear
+
+        cache[key] = ip
+        if len(cache) > 32:
+            cache.pop(next(iter(cache)))
+        return ip
+
 
 class AdjustAdd(AdjustBase):
     """Gage adjustment using an additive error model.
@@ -416,6 +585,8 @@ class AdjustAdd(AdjustBase):
 
     """
 
+    _elementwise = True
+
     def __call__(self, obs, raw, targets=None, rawatobs=None, ix=None):
         """Returns an array of ``raw`` values that are adjusted by ``obs``.
 
@@ -475,6 +646,8 @@ class AdjustMultiply(AdjustBase):
 
     """
 
+    _elementwise = True
+
     def __call__(self, obs, raw, *, targets=None, rawatobs=None, ix=None):
         """Returns an array of ``raw`` values that are adjusted by ``obs``.
 
@@ -560,6 +733,8 @@ class AdjustMixed(AdjustBase):
 
     """
 
+    _elementwise = True
+
     def __call__(self, obs, raw, *, targets=None, rawatobs=None, ix=None):
         """Returns an array of ``raw`` values that are adjusted by ``obs``.
 
@@ -690,6 +865,8 @@ class AdjustNone(AdjustBase):
 
     """
 
+    _elementwise = True
+
     def __call__(self, obs, raw, *, targets=None, rawatobs=None, ix=None):
         """Returns an array of ``raw`` values that are adjusted by ``obs``.
 
@@ -740,6 +917,8 @@ class GageOnly(AdjustBase):
         array of adjusted radar values
     """
 
+    _elementwise = True
+
     def __call__(self, obs, raw, *, targets=None, rawatobs=None, ix=None):
         """Returns an array of ``raw`` values that are adjusted by ``obs``.
 
@@ -779,7 +958,8 @@ class RawAtObs:
         number of neighbours which should be considered in the vicinity of each
         point in obs
     stat: str
-        function name
+        function name, a numpy function like 'median', 'mean', 'min', 'max'
+        (or their NaN-ignoring variants like 'nanmedian') or 'best'
 
     """
 
@@ -794,8 +974,19 @@ class RawAtObs:
         Parameters
         ----------
         raw : :py:class:`numpy:numpy.ndarray`
-            array of float
+            array of float of shape (num raw points, ) or
+            (num raw points, num times)
             raw values
+        obs : :py:class:`numpy:numpy.ndarray`
+            array of float of shape (num obs points, ) or
+            (num obs points, num times)
+            observations, only needed for stat 'best'
+
+        Returns
+        -------
+        output : :py:class:`numpy:numpy.ndarray`
+            array of float of shape (num obs points, ) or
+            (num obs points, num times)
 
         """
         # get the values of the raw neighbours of obs
@@ -804,7 +995,7 @@ class RawAtObs:
         # by using a statistics option
         # (only needed in case nnear > 1, i.e. multiple neighbours
         # per observation location)
-        if raw_neighbs.ndim > 1:
+        if self.raw_ix.ndim > 1:
             return self.statfunc(obs, raw_neighbs)
         else:
             return raw_neighbs
@@ -826,9 +1017,9 @@ def _get_neighbours_ix(obs_coords, raw_coords, nnear):
 
     """
     # plant a tree
-    tree = spatial.cKDTree(raw_coords)
+    tree = ipol.get_kdtree(raw_coords)
     # return nearest neighbour indices
-    return tree.query(obs_coords, k=nnear)[1]
+    return ipol.query_kdtree(tree, obs_coords, k=nnear)[1]
 
 
 def _get_statfunc(funcname):
@@ -859,40 +1050,46 @@ def _get_statfunc(funcname):
 def best(x, y, /):
     """Find the values of y which corresponds best to x
 
-    If x is an array, the comparison is carried out for each element of x
+    If x is an array, the comparison is carried out for each element of x.
+    NaN values in y are never selected, unless all values are NaN.
 
     Parameters
     ----------
     x : float | :py:class:`numpy:numpy.ndarray`
-        float or 1-d array of float
+        float or array of float of shape (n, ) or (n, ntime)
     y : :py:class:`numpy:numpy.ndarray`
-        array of float
+        array of float of shape (nnear, ), (n, nnear) or (n, nnear, ntime)
 
     Returns
     -------
     output : :py:class:`numpy:numpy.ndarray`
-        1-d array of float with length len(y)
+        array of float of shape (n, ) or (n, ntime)
 
     """
+    if isinstance(y, np.ndarray):
+        if y.ndim > 3:
+            raise ValueError("'y' must be 1-d, 2-d or 3-d array of floats.")
+    else:
+        raise ValueError("`y` must be 1-d, 2-d or 3-d array of floats.")
     if isinstance(x, np.ndarray):
-        if x.ndim != 1:
-            raise ValueError("`x` must be a 1-d array of floats or a float.")
+        if x.ndim != max(y.ndim - 1, 1):
+            raise ValueError(
+                "`x` must be a float or an array with one dimension less than `y`."
+            )
         if len(x) != len(y):
             raise ValueError(
                 f"Length of `x` ({len(x)}) and `y` ({len(y)}) must be equal."
             )
-    if isinstance(y, np.ndarray):
-        if y.ndim > 2:
-            raise ValueError("'y' must be 1-d or 2-d array of floats.")
-    else:
-        raise ValueError("`y` must be 1-d or 2-d array of floats.")
-    x = np.array(x).reshape((-1, 1))
     if y.ndim == 1:
-        y = np.array(y).reshape((1, -1))
-        axis = None
-    else:
-        axis = 1
-    return y[np.arange(len(y)), np.argmin(np.abs(x - y), axis=axis)]
+        y = y.reshape((1, -1))
+    x = np.asarray(x)
+    if x.ndim == 0:
+        x = np.broadcast_to(x, y.shape[:1] + y.shape[2:])
+    x = np.expand_dims(x, axis=1)
+    diff = np.abs(x - y)
+    diff[np.isnan(diff)] = np.inf
+    ix = np.argmin(diff, axis=1, keepdims=True)
+    return np.take_along_axis(y, ix, axis=1).squeeze(axis=1)
 
 
 if __name__ == "__main__":
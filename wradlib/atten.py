@@ -29,7 +29,7 @@ import logging
 from functools import singledispatch
 
 import numpy as np
-from scipy import interpolate, ndimage
+from scipy import ndimage
 from xarray import DataArray, apply_ufunc
 
 from wradlib import trafo, zr
@@ -109,34 +109,21 @@ def correct_attenuation_hb(
     b = coefficients["b"]
     gate_length = coefficients["gate_length"]
 
-    pia = np.empty(gateset.shape)
-    pia[..., 0] = 0.0
-    ksum = 0.0
-
-    # multidimensional version
-    # assumes that iteration is only along the last dimension
-    # (i.e. range gates) all other dimensions are calculated simultaneously
-    # to gain some speed
-    for gate in range(gateset.shape[-1] - 1):
-        # calculate k in dB/km from k-Z relation
-        # c.f. Krämer2008(p. 147)
-        k = a * (10.0 ** ((gateset[..., gate] + ksum) / 10.0)) ** b * 2.0 * gate_length
-        # k = 10**(log10(a)+0.1*bin*b)
-        # dBkn = 10*math.log10(a) + (bin+ksum)*b + 10*math.log10(2*gate_length)
-        ksum += k
-
-        pia[..., gate + 1] = ksum
-        # stop-criterion, if corrected reflectivity is larger than 59 dBZ
-        overflow = (gateset[..., gate + 1] + ksum) > thrs
-        if np.any(overflow):
-            if mode == "warn":
-                logger.warning(f"corrected signal over threshold ({thrs:3.1f})")
-            elif mode == "nan":
-                pia[..., gate + 1][overflow] = np.nan
-            elif mode == "zero":
-                pia[..., gate + 1][overflow] = 0.0
-            else:
-                raise AttenuationOverflowError
+    pia = np.ascontiguousarray(_calc_attenuation_forward(gateset, a, b, gate_length))
+
+    # corrected signal is not fed back into the recursion, so the
+    # stop-criterion can be evaluated for all gates at once
+    # (corrected reflectivity larger than thrs, e.g. 59 dBZ)
+    overflow = (gateset[..., 1:] + pia[..., 1:]) > thrs
+    if np.any(overflow):
+        if mode == "warn":
+            logger.warning(f"corrected signal over threshold ({thrs:3.1f})")
+        elif mode == "nan":
+            pia[..., 1:][overflow] = np.nan
+        elif mode == "zero":
+            pia[..., 1:][overflow] = 0.0
+        else:
+            raise AttenuationOverflowError
 
     return pia
 
@@ -184,16 +171,40 @@ def calc_attenuation_forward(gateset, *, a=1.67e-4, b=0.7, gate_length=1.0):
         Array with the same shape as ``gateset`` containing the calculated path
         integrated attenuation [dB] for each range gate.
     """
-    pia = np.zeros(gateset.shape)
-    for gate in range(gateset.shape[-1] - 1):
-        k = (
-            a
-            * trafo.idecibel(gateset[..., gate] + pia[..., gate]) ** b
-            * 2.0
-            * gate_length
-        )
-        pia[..., gate + 1] = pia[..., gate] + k
-    return pia
+    return np.ascontiguousarray(_calc_attenuation_forward(gateset, a, b, gate_length))
+
+
+def _calc_attenuation_forward(gateset, a, b, gate_length):
+    """Gate-by-Gate forward recursion of path integrated attenuation.
+
+    Evaluates ``pia[g + 1] = pia[g] + a * idecibel(gateset[g] + pia[g]) ** b
+    * 2 * gate_length`` along the last dimension of ``gateset``. The
+    reflectivity part is computed for all gates at once and the recursion
+    runs on a gate-major copy, so that every step works on contiguous memory.
+
+    ``a`` and ``b`` can be scalars or arrays broadcastable against
+    ``gateset.shape[:-1]``, e.g. to evaluate multiple coefficients at once.
+    """
+    gateset = np.asarray(gateset, dtype=np.float64)
+    a = np.asarray(a, dtype=np.float64)
+    beta = np.asarray(b, dtype=np.float64) * (np.log(10.0) / 10.0)
+    shape = np.broadcast_shapes(gateset.shape[:-1], a.shape, beta.shape)
+    ngates = gateset.shape[-1]
+
+    # k-Z relation (k = a * Z ** b), reflectivity part
+    zt = np.moveaxis(gateset[..., :-1], -1, 0)
+    zt = zt.reshape(zt.shape[:1] + (1,) * (len(shape) - zt.ndim + 1) + zt.shape[1:])
+    coef = np.exp(beta * zt)
+    coef *= 2.0 * gate_length * a
+
+    pia = np.zeros((ngates,) + shape)
+    k = np.empty(shape)
+    for gate in range(ngates - 1):
+        np.multiply(pia[gate, ...], beta, out=k)
+        np.exp(k, out=k)
+        k *= coef[gate, ...]
+        np.add(pia[gate, ...], k, out=pia[gate + 1, ...])
+    return np.moveaxis(pia, 0, -1)
 
 
 def bisect_reference_attenuation(
@@ -207,6 +218,7 @@ def bisect_reference_attenuation(
     mode="difference",
     thrs=0.25,
     max_iterations=10,
+    max_bisections=100,
 ):
     """Find the optimal attenuation coefficients for a gateset to achieve a \
     given reference attenuation using the forward correction algorithm in \
@@ -263,6 +275,13 @@ def bisect_reference_attenuation(
         the k-Z relation will be decreased and the bisection starts again.
 
         Per default set to 10.
+    max_bisections : int
+        Maximum overall number of bisection iterations. Beams are finished
+        as soon as the bisection interval has collapsed or if the calculated
+        pia can't be compared with the reference pia (e.g. NaN). Only
+        unfinished beams are recalculated in every iteration.
+
+        Per default set to 100.
 
     Returns
     -------
@@ -276,41 +295,50 @@ def bisect_reference_attenuation(
         Array with the same shape as ``pia_ref`` containing the finally used
         exponential k-Z relation coefficient b for successful pia calculation.
     """
+    if mode not in ["difference", "ratio"]:
+        raise Exception(f"Unknown mode type {mode}.")
     # Prepare arrays of initial k-Z relation coefficients for each beam.
-    a_hi = np.ones(pia_ref.shape) * a_max  # np.repeat(a_max, pia_ref.shape)
-    a_lo = np.ones(pia_ref.shape) * a_min  # np.repeat(a_min, pia_ref.shape)
-    b = np.ones(pia_ref.shape) * b_start  # np.repeat(b_start, pia_ref.shape)
-    pia = np.empty_like(gateset)
-    iteration_count = 0
+    a_hi = np.full(pia_ref.shape, a_max, dtype=np.float64)
+    a_lo = np.full(pia_ref.shape, a_min, dtype=np.float64)
+    a_mid = (a_hi + a_lo) / 2
+    b = np.full(pia_ref.shape, b_start, dtype=np.float64)
+    pia = np.zeros(gateset.shape)
+    # Beams, which are not finished yet.
+    active = np.ones(pia_ref.shape, dtype=np.bool_)
 
     # Iterate until upper and lower bounds of linear k-Z relation coefficients
     # for pia calculation are the same.
-    while not np.all(a_hi == a_lo):
-        a_mid = (a_hi + a_lo) / 2
-        pia = calc_attenuation_forward(gateset, a=a_mid, b=b, gate_length=gate_length)
+    for iteration_count in range(1, max_bisections + 1):
+        idx = np.nonzero(active)
+        a_hi_sub = a_hi[idx]
+        a_lo_sub = a_lo[idx]
+        b_sub = b[idx]
+        a_mid_sub = (a_hi_sub + a_lo_sub) / 2
+        pia_sub = _calc_attenuation_forward(gateset[idx], a_mid_sub, b_sub, gate_length)
+        pia[idx] = pia_sub
+        a_mid[idx] = a_mid_sub
         # Find indices where calculated and reference pia sufficiently match
-        if mode == "difference":
-            overshoot = (pia[..., -1] - pia_ref) > thrs
-            undershoot = (pia[..., -1] - pia_ref) < -thrs
-            hit = (np.abs(pia[..., -1] - pia_ref)) < thrs
-        elif mode == "ratio":
-            overshoot = ((pia[..., -1] - pia_ref) / pia_ref) > thrs
-            undershoot = ((pia[..., -1] - pia_ref) / pia_ref) < -thrs
-            hit = (np.abs(pia[..., -1] - pia_ref) / pia_ref) < thrs
-        else:
-            raise Exception(f"Unknown mode type {mode}.")
+        diff = pia_sub[..., -1] - pia_ref[idx]
+        if mode == "ratio":
+            diff = diff / pia_ref[idx]
+        overshoot = diff > thrs
+        undershoot = diff < -thrs
+        hit = np.abs(diff) < thrs
         # Define new bounds of linear k-Z relation coefficient for over- and
         # undershooting pia calculations.
-        a_hi[overshoot] = a_mid[overshoot]
-        a_lo[undershoot] = a_mid[undershoot]
-        a_hi[hit] = a_mid[hit]
-        a_lo[hit] = a_mid[hit]
-        iteration_count += 1
+        a_hi_sub[overshoot | hit] = a_mid_sub[overshoot | hit]
+        a_lo_sub[undershoot | hit] = a_mid_sub[undershoot | hit]
         # Change exponential k-Z relation coefficient in case of maximum
         # iterations for linear k-Z relation coefficient are reached.
         if iteration_count > max_iterations:
-            b[overshoot] -= 0.01
-            b[undershoot] += 0.01
+            b_sub[overshoot] -= 0.01
+            b_sub[undershoot] += 0.01
+        a_hi[idx] = a_hi_sub
+        a_lo[idx] = a_lo_sub
+        b[idx] = b_sub
+        active[idx] = (a_hi_sub != a_lo_sub) & (overshoot | undershoot | hit)
+        if not np.any(active):
+            break
     return pia, a_mid, b
 
 
@@ -318,8 +346,6 @@ def _sector_filter(mask, min_sector_size):
     """Calculate an array of same shape as mask, which is set to 1 in case of \
     at least min_sector_size adjacent values, otherwise it is set to 0.
     """
-
-    kernela = np.ones([1] * (mask.ndim - 1) + [min_sector_size])
     kernelb = np.ones((min_sector_size,))
     forward_origin = -(min_sector_size - (min_sector_size // 2)) + min_sector_size % 2
     backward_origin = (min_sector_size - (min_sector_size // 2)) - 1
@@ -329,43 +355,133 @@ def _sector_filter(mask, min_sector_size):
     backward_sum = ndimage.correlate1d(
         mask.astype(np.int_), kernelb, axis=-1, mode="wrap", origin=backward_origin
     )
-    forward_corners = forward_sum == min_sector_size
-    backward_corners = backward_sum == min_sector_size
-    forward_large_sectors = np.zeros_like(mask)
-    backward_large_sectors = np.zeros_like(mask)
-    for iii in range(mask.shape[0]):
-        forward_large_sectors[iii] = ndimage.binary_dilation(
-            forward_corners[iii], kernela[0], origin=forward_origin
-        ).astype(int)
-        backward_large_sectors[iii] = ndimage.binary_dilation(
-            backward_corners[iii], kernela[0], origin=backward_origin
-        ).astype(int)
+    forward_large_sectors = forward_sum == min_sector_size
+    backward_large_sectors = backward_sum == min_sector_size
+    if mask.ndim > 1:
+        # dilate corners along the last dimension for all leading dimensions
+        # at once, the structure has size 1 in all other dimensions
+        kernela = np.ones([1] * (mask.ndim - 1) + [min_sector_size], dtype=bool)
+        origin = [0] * (mask.ndim - 1)
+        forward_large_sectors = ndimage.binary_dilation(
+            forward_large_sectors, kernela, origin=origin + [forward_origin]
+        )
+        backward_large_sectors = ndimage.binary_dilation(
+            backward_large_sectors, kernela, origin=origin + [backward_origin]
+        )
 
-    return forward_large_sectors | backward_large_sectors
+    return (forward_large_sectors | backward_large_sectors).astype(mask.dtype)
 
 
 def _interp_atten(pia, invalidbeams):
     """Interpolate reference pia of most distant rangebin of small invalid
     sectors as a prerequisite for the backward calculation of attenuation.
     """
-    # Build a spatial equidistant array for interpolation of the ahead and
-    # behind extended temporary pia-array for handling invalid sectors
-    # overlapping the seam of the radarcircle.
-    x = np.arange(3 * pia.shape[1])
-
-    for i in range(pia.shape[0]):
-        sub_invalid = invalidbeams[i, :]
-        sub_pia = pia[i, :, -1]
-        # Build the extended bool-array with the invalid sectors.
-        extended_invalid = np.concatenate([sub_invalid] * 3)
-        # Build the extended pia-array.
-        extended_pia = np.concatenate([sub_pia] * 3)
-        # Build interpolation class.
-        intp = interpolate.interp1d(
-            x[~extended_invalid], extended_pia[~extended_invalid], kind="linear"
+    n_sweeps, n_az = invalidbeams.shape
+    if np.any(np.all(invalidbeams, axis=-1)):
+        raise ValueError("wradlib: Can't interpolate sweep without valid beams.")
+    # Place all sweeps consecutively on one axis and extend each with the
+    # valid beams ahead and behind for handling invalid sectors overlapping
+    # the seam of the radarcircle. Every sweep is given a range of 3 * n_az.
+    offset = np.arange(n_sweeps)[:, None] * 3 * n_az + n_az
+    x = np.broadcast_to(offset + np.arange(n_az), invalidbeams.shape)
+    valid = ~invalidbeams
+    xv = x[valid]
+    xp = np.stack([xv - n_az, xv, xv + n_az], axis=-1)
+    fp = np.broadcast_to(pia[..., -1][valid][:, None], xp.shape)
+    # sort by position, as sweeps follow each other this is sweep by sweep
+    sort = np.argsort(xp, axis=None, kind="stable")
+    pia[invalidbeams, -1] = np.interp(
+        x[invalidbeams], xp.ravel()[sort], fp.ravel()[sort]
+    )
+
+
+def _iterate_attenuation_constrained(
+    gateset,
+    pia,
+    a_used,
+    b_used,
+    a_cand,
+    b_cand,
+    *,
+    gate_length=1.0,
+    constraints=(),
+    constraint_args=(),
+    sector_thr=10,
+    chunksize=2**22,
+):
+    """Iterate k-Z coefficients for beams breaching the constraints.
+
+    For every candidate pair (``a_cand[k]``, ``b_cand[k]``) the attenuation of
+    all beams within large invalid sectors is recalculated, until no such
+    sectors remain. ``pia``, ``a_used`` and ``b_used`` are filled in place.
+
+    As beams only ever leave the set of beams to correct and the constraints
+    are evaluated per beam, the attenuation of the remaining beams is
+    calculated for multiple subsequent candidates at once (doubling their
+    number each round, limited by ``chunksize`` elements). The sector logic is then replayed candidate by
+    candidate on the precomputed constraint results.
+
+    Returns
+    -------
+    small_sectors : :class:`numpy:numpy.ndarray`
+        beams breaching the constraints within sectors smaller than
+        ``sector_thr``
+    """
+    shape = gateset.shape[:-1]
+    n_rng = gateset.shape[-1]
+    n_cand = len(a_cand)
+
+    beams2correct = np.ones(shape, dtype=np.bool_)
+    incorrectbeams = np.zeros(shape, dtype=np.bool_)
+    small_sectors = np.zeros(shape, dtype=np.bool_)
+
+    k = 0
+    m = 1
+    while k < n_cand and np.any(beams2correct):
+        # beams to correct and their position within the chunk
+        idx = np.nonzero(beams2correct)
+        nbeams = len(idx[0])
+        pos = np.full(shape, -1, dtype=np.intp)
+        pos[idx] = np.arange(nbeams)
+        # number of candidates to calculate at once, grow geometrically
+        # as long as beams remain to limit needless calculations
+        m = min(2 * m if k else m, chunksize // max(nbeams * n_rng, 1))
+        m = max(1, min(m, n_cand - k))
+        sub_gateset = gateset[idx]
+        sub_pia = _calc_attenuation_forward(
+            sub_gateset,
+            a_cand[k : k + m, None],
+            b_cand[k : k + m, None],
+            gate_length,
         )
-        # Interpolate where sectors are invalid.
-        pia[i, sub_invalid, -1] = intp(x[pia.shape[1] : 2 * pia.shape[1]][sub_invalid])
+        # constraints see the attenuation as stored in pia
+        sub_pia = sub_pia.astype(pia.dtype, copy=False)
+        sub_incorrect = np.zeros((m, nbeams), dtype=np.bool_)
+        for constraint, constraint_arg in zip(constraints, constraint_args):
+            sub_incorrect |= constraint(sub_gateset, sub_pia, *constraint_arg)
+        # candidate which was used last for each beam of the chunk
+        last = np.zeros(nbeams, dtype=np.intp)
+        for t in range(m):
+            if t:
+                cols = pos[beams2correct]
+                last[cols] = t
+            else:
+                cols = slice(None)
+            # Indexing threshold exceeding beams
+            incorrectbeams[beams2correct] = sub_incorrect[t, cols]
+            # Determine incorrect sectors larger than sector_thr
+            large_sectors = _sector_filter(incorrectbeams, sector_thr)
+            # Determine incorrect sectors smaller than sector_thr
+            small_sectors |= incorrectbeams & ~large_sectors
+            beams2correct = large_sectors
+            if not np.any(beams2correct):
+                break
+        pia[idx] = sub_pia[last, np.arange(nbeams)]
+        a_used[idx] = a_cand[k + last]
+        b_used[idx] = b_cand[k + last]
+        k += m
+
+    return small_sectors
 
 
 @singledispatch
@@ -434,7 +550,9 @@ def correct_attenuation_constrained(
         List of constraint functions. The signature of these functions has to
         be constraint_function(`gateset`, `k`, `*constr_args`). Their return
         value must be a boolean array of shape `gateset.shape[:-1]` set to True
-        for beams, which do not fulfill the constraint.
+        for beams, which do not fulfill the constraint. The constraints have to
+        be evaluated beam by beam (along the last dimension), as they are
+        called with subsets of beams and stacks of attenuation candidates.
     constraint_args : list
         List of lists, which are to be passed to the individual constraint
         functions using the `*args` mechanism
@@ -497,11 +615,6 @@ def correct_attenuation_constrained(
     a_used = np.empty(tmp_gateset.shape[:-1])
     b_used = np.empty(tmp_gateset.shape[:-1])
 
-    # Calculate attenuation forward.
-    # Indexing all rows of last dimension (radarbeams)
-    beams2correct = np.where(np.ones(tmp_gateset.shape[:-1], dtype=np.bool_))
-    small_sectors = np.zeros(tmp_gateset.shape[:-1], dtype=np.bool_)
-
     if n_a != 1:
         delta_a = (a_max - a_min) / (n_a - 1)
     else:
@@ -511,37 +624,24 @@ def correct_attenuation_constrained(
     else:
         delta_b = 0.0
 
-    # Iterate over possible b-parameters
-    for j in range(n_b):
-        b = b_max - delta_b * j
-        # Iterate over possible a-parameters
-        for i in range(n_a):
-            a = a_max - delta_a * i
-            # Generate subset of beams that have to be corrected
-            sub_gateset = tmp_gateset[beams2correct]
-            sub_pia = calc_attenuation_forward(
-                sub_gateset, a=a, b=b, gate_length=gate_length
-            )
-            pia[beams2correct] = sub_pia
-            a_used[beams2correct] = a
-            b_used[beams2correct] = b
-            # Indexing threshold exceeding beams
-            incorrectbeams = np.zeros(tmp_gateset.shape[:-1], dtype=np.bool_)
-            for constraint, constraint_arg in zip(constraints, constraint_args):
-                incorrectbeams = np.logical_or(
-                    incorrectbeams, constraint(tmp_gateset, pia, *constraint_arg)
-                )
-            # Determine incorrect sectors larger than sector_thr
-            large_sectors = _sector_filter(incorrectbeams, sector_thr)
-            # Determine incorrect sectors smaller than sector_thr
-            small_sectors = np.logical_or(
-                small_sectors, (incorrectbeams & ~large_sectors)
-            )
-            beams2correct = np.where(large_sectors)
-            if len(pia[beams2correct]) == 0:
-                break
-        if len(pia[beams2correct]) == 0:
-            break
+    # All possible (a, b) parameters in order of iteration, a varies fastest
+    b_cand = np.repeat(b_max - delta_b * np.arange(n_b), n_a)
+    a_cand = np.tile(a_max - delta_a * np.arange(n_a), n_b)
+
+    # Calculate attenuation forward, starting with all beams.
+    small_sectors = _iterate_attenuation_constrained(
+        tmp_gateset,
+        pia,
+        a_used,
+        b_used,
+        a_cand,
+        b_cand,
+        gate_length=gate_length,
+        constraints=constraints,
+        constraint_args=constraint_args,
+        sector_thr=sector_thr,
+    )
+
     if np.any(small_sectors):
         # Interpolate reference pia of most distant
         # rangebin of invalid sectors.
@@ -74,7 +74,9 @@ def filter_gabella_a(obj, wsize, tr1, *, cartesian=False, radial=False):
     Parameters
     ----------
     obj : :py:class:`numpy:numpy.ndarray`
-        radar image to which the filter is to be applied
+        radar image to which the filter is to be applied, shape (..., nrays,
+        nbins), leading dimensions (e.g. sweeps or time steps) are filtered
+        independently
     wsize : int
         Size of the window surrounding the central pixel
     tr1 : float
@@ -102,22 +104,36 @@ def filter_gabella_a(obj, wsize, tr1, *, cartesian=False, radial=False):
     See :ref:`/notebooks/classify/clutter_gabella.ipynb`.
 
     """
+    obj = np.asanyarray(obj)
     nn = wsize // 2
-    count = -np.ones(obj.shape, dtype=int)
-    range_shift = range(-nn, nn + 1)
-    azimuth_shift = range(-nn, nn + 1)
-    if radial:
-        azimuth_shift = [0]
-    for sa in azimuth_shift:
-        refa = np.roll(obj, sa, axis=0)
-        for sr in range_shift:
-            refr = np.roll(refa, sr, axis=1)
-            count += (obj - refr) < tr1
-    count[:, 0:nn] = wsize**2
-    count[:, -nn:] = wsize**2
+    na = 0 if radial else nn
+    nrays, nbins = obj.shape[-2:]
+    imgs = obj.reshape((-1, nrays, nbins))
+    # pad periodically, shifted windows are then views into the padded array
+    padded = np.pad(imgs, [(0, 0), (na, na), (nn, nn)], mode="wrap")
+    count = np.empty(imgs.shape, dtype=int)
+    # small counter type and blocks of rays keep the temporaries in cache
+    acc = np.min_scalar_type((2 * na + 1) * (2 * nn + 1))
+    block = max(1, 2**15 // nbins)
+    for img, pimg, cnt in zip(imgs, padded, count):
+        for r0 in range(0, nrays, block):
+            center = img[r0 : r0 + block]
+            diff = np.empty_like(center)
+            less = np.empty(center.shape, dtype=bool)
+            similar = np.zeros(center.shape, dtype=acc)
+            for sa in range(r0, r0 + 2 * na + 1):
+                for sr in range(2 * nn + 1):
+                    ref = pimg[sa : sa + len(center), sr : sr + nbins]
+                    np.subtract(center, ref, out=diff)
+                    np.less(diff, tr1, out=less)
+                    np.add(similar, less, out=similar)
+            cnt[r0 : r0 + block] = similar
+    count = count.reshape(obj.shape) - 1
+    count[..., 0:nn] = wsize**2
+    count[..., -nn:] = wsize**2
     if cartesian:
-        count[0:nn, :] = wsize**2
-        count[-nn:, :] = wsize**2
+        count[..., 0:nn, :] = wsize**2
+        count[..., -nn:, :] = wsize**2
     return count
 
 
@@ -188,6 +204,8 @@ def filter_gabella_b(obj, *, thrs=0.0):
     Parameters
     ----------
     obj : :py:class:`numpy:numpy.ndarray`
+        radar image, shape (..., nrays, nbins), leading dimensions (e.g.
+        sweeps or time steps) are filtered independently
     thrs : float
         Threshold below which the field values will be considered as no rain
 
@@ -210,7 +228,10 @@ def filter_gabella_b(obj, *, thrs=0.0):
     See :ref:`/notebooks/classify/clutter_gabella.ipynb`.
 
     """
-    conn = np.ones((3, 3))
+    obj = np.asanyarray(obj)
+    # 8-connectivity within each image, no connection along leading dimensions
+    conn = np.zeros((3,) * obj.ndim)
+    conn[(1,) * (obj.ndim - 2)] = 1
     # create binary image of the rainfall field
     binimg = obj > thrs
     # label objects (individual rain cells, so to say)
@@ -218,25 +239,26 @@ def filter_gabella_b(obj, *, thrs=0.0):
     # erode the image, thus removing the 'boundary pixels'
     binimg_erode = ndimage.binary_erosion(binimg, structure=conn)
     # determine the size of each object
-    labelhist, edges = np.histogram(
-        labelimg, bins=nlabels + 1, range=(-0.5, labelimg.max() + 0.5)
-    )
+    labelhist = np.bincount(labelimg.ravel(), minlength=nlabels + 1)
     # determine the size of the eroded objects
-    erodelabelhist, edges = np.histogram(
-        np.where(binimg_erode, labelimg, 0),
-        bins=nlabels + 1,
-        range=(-0.5, labelimg.max() + 0.5),
+    erodelabelhist = np.bincount(
+        np.where(binimg_erode, labelimg, 0).ravel(), minlength=nlabels + 1
     )
     # the boundary is the difference between these two
     boundarypixels = labelhist - erodelabelhist
     # now get the ratio between object size and boundary
-    ratio = labelhist.astype(np.float32) / boundarypixels
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = labelhist.astype(np.float32) / boundarypixels
     # assign it back to the objects
-    # first get the indices
-    indices = np.digitize(labelimg.ravel(), edges) - 1
-    # then produce a new field with the ratios in the right place
-    result = ratio[indices.ravel()].reshape(obj.shape)
-
+    result = ratio[labelimg]
+    if obj.ndim > 2:
+        # no rain pixels are assigned the ratio of their own image
+        background = labelimg == 0
+        nbackground = background.sum(axis=(-2, -1))
+        nboundary = (binimg & ~binimg_erode).sum(axis=(-2, -1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = nbackground.astype(np.float32) / -nboundary
+        result = np.where(background, ratio[..., np.newaxis, np.newaxis], result)
     return result
 
 
@@ -303,6 +325,8 @@ def filter_gabella(
     Parameters
     ----------
     obj : :py:class:`numpy:numpy.ndarray`
+        radar image, shape (..., nrays, nbins), leading dimensions (e.g.
+        sweeps or time steps) are filtered independently
     wsize : int, optional
         Size of the window surrounding the central pixel, defaults to 5.
 
@@ -354,7 +378,8 @@ def filter_gabella(
         obj, wsize=wsize, tr1=tr1, cartesian=cartesian, radial=radial
     )
     if not rm_nans:
-        f_good = ndimage.uniform_filter((~bad).astype(float), size=wsize)
+        size = [1] * (obj.ndim - 2) + [wsize, wsize]
+        f_good = ndimage.uniform_filter((~bad).astype(float), size=size)
         f_good[f_good == 0] = 1e-10
         ntr1 = ntr1 / f_good
         ntr1[bad] = n_p
@@ -425,7 +450,14 @@ def _filter_gabella_xarray(obj, **kwargs):
 
 
 @singledispatch
-def histo_cut(obj, *, upper_frequency=0.01, lower_frequency=0.01):
+def histo_cut(
+    obj,
+    *,
+    upper_frequency=0.01,
+    lower_frequency=0.01,
+    fine_bins=None,
+    chunksize=2**22,
+):
     """Histogram based clutter identification.
 
     This identification algorithm uses the histogram of temporal accumulated
@@ -441,14 +473,28 @@ def histo_cut(obj, *, upper_frequency=0.01, lower_frequency=0.01):
     It is suggested to choose a representative time periode for the input precipitation
     accumulation. The recommended time period should cover one year.
 
+    In-memory arrays are sorted once, the histograms of all iterations are then
+    derived by binary search. Memory-mapped and dask arrays (or any input if
+    ``fine_bins`` is given) are read in chunks into a fine-grained histogram,
+    the histograms of all iterations are derived from its counts. Only the
+    values of fine bins containing a class edge are read again, so the result
+    is the same as for in-memory arrays.
+
     Parameters
     ----------
     obj : :py:class:`numpy:numpy.ndarray`
-        spatial array containing rain accumulation
+        spatial array containing rain accumulation, may be memory-mapped or
+        a :py:class:`dask:dask.array.Array`
     upper_frequency : float, optional
         Upper frequency percentage for clutter detection, defaults to 0.01.
     lower_frequency : float, optional
         Lower frequency percentage for shading detection, defaults to 0.01.
+    fine_bins : int, optional
+        Number of bins of the fine-grained histogram, defaults to None
+        (exact for in-memory arrays, 2**16 otherwise).
+    chunksize : int, optional
+        Number of elements read at once from memory-mapped arrays, defaults
+        to 2**22. Dask arrays are read block by block.
 
     Returns
     -------
@@ -456,18 +502,24 @@ def histo_cut(obj, *, upper_frequency=0.01, lower_frequency=0.01):
         uint8 array with pixels identified as clutter set to 1 and shadings set to 2.
         Remaining pixels set to 0. Users strictly relying on a boolean mask might have
         to explicitely cast to boolean (adding `.astype(np.bool)` on the return).
+        For dask input a lazy dask array is returned.
 
     Examples
     --------
 
     See :ref:`/notebooks/classify/histo_cut.ipynb`.
     """
-
-    prec_accum = np.array(obj)
+    if not hasattr(obj, "shape"):
+        obj = np.array(obj)
+    in_memory = isinstance(obj, np.ndarray) and not isinstance(obj, np.memmap)
+    if in_memory and fine_bins is None:
+        stats = _HistoCutSorted(obj)
+    else:
+        stats = _HistoCutFine(obj, fine_bins or 2**16, chunksize)
 
     # initialization of data bounds for clutter and shade definition
     lower_bound = 0
-    upper_bound = prec_accum.max()
+    upper_bound = stats.max
 
     # predefinitions for the first iteration
     lower_bound_before = -51
@@ -478,37 +530,24 @@ def histo_cut(obj, *, upper_frequency=0.01, lower_frequency=0.01):
     while (abs(lower_bound - lower_bound_before) > 1) or (
         abs(upper_bound - upper_bound_before) > 1
     ):
-        # masks for bins with sums over/under the data bounds
-        upper_mask = (prec_accum <= upper_bound).astype(int)
-        lower_mask = (prec_accum >= lower_bound).astype(int)
-        # NaNs in place of masked bins
-        # Kopie der Datenmatrix mit Nans an Stellen,
-        # wo der Threshold erreicht wird
-        prec_accum_masked = np.where((upper_mask * lower_mask) == 0, np.nan, prec_accum)
-
         # generate a histogram of the valid bins with 50 classes
-        (n, bins) = np.histogram(
-            prec_accum_masked[np.isfinite(prec_accum_masked)].ravel(), bins=50
-        )
+        n, bins = stats.histogram(lower_bound, upper_bound, 50)
         # get the class with biggest occurence
-        index = np.where(n == n.max())
-        index = index[0][0]
+        index = np.argmax(n)
         # separated stop criterion check in case one of the bounds
         # is already robust
         if abs(lower_bound - lower_bound_before) > 1:
             # get the index of the class which underscores the occurence of
             # the biggest class by lower_frequency (1%, default), beginning from
             # the class with the biggest occurence to the first class
-            for i in range(index, -1, -1):
-                if n[i] < (n[index] * lower_frequency):
-                    break
+            below = np.flatnonzero(n[: index + 1] < (n[index] * lower_frequency))
+            i = below[-1] if len(below) else 0
         if abs(upper_bound - upper_bound_before) > 1:
             # get the index of the class which underscores the occurence of
             # the biggest class by upper_frequency (1%, default), beginning from
             # the class with the biggest occurence to the last class
-            for j in range(index, len(n)):
-                if n[j] < (n[index] * upper_frequency):
-                    break
+            below = np.flatnonzero(n[index:] < (n[index] * upper_frequency))
+            j = index + below[0] if len(below) else len(n) - 1
 
         lower_bound_before = lower_bound
         upper_bound_before = upper_bound
@@ -516,14 +555,189 @@ def histo_cut(obj, *, upper_frequency=0.01, lower_frequency=0.01):
         lower_bound = bins[i]
         upper_bound = bins[j + 1]
 
-    # create zero array and set clutter as 1 and shading as 2
-    mask = np.zeros(prec_accum.shape, dtype=np.uint8)
-    mask[prec_accum > upper_bound] = 1
-    mask[prec_accum < lower_bound] = 2
+    # create mask and set clutter as 1 and shading as 2
+    if hasattr(obj, "map_blocks"):
+        return obj.map_blocks(_histo_cut_mask, lower_bound, upper_bound, dtype=np.uint8)
+    mask = np.empty(obj.shape, dtype=np.uint8)
+    for sl in _iter_chunks(obj.shape, chunksize):
+        mask[sl] = _histo_cut_mask(np.asarray(obj[sl]), lower_bound, upper_bound)
+    return mask
+
 
+def _histo_cut_mask(data, lower_bound, upper_bound):
+    """Returns uint8 mask with clutter set to 1 and shadings set to 2."""
+    mask = np.zeros(data.shape, dtype=np.uint8)
+    mask[data > upper_bound] = 1
+    mask[data < lower_bound] = 2
     return mask
 
 
+def _iter_chunks(shape, chunksize):
+    """Yields slices of blocks along the first axis with about chunksize
+    elements."""
+    if len(shape) == 0:
+        yield ()
+        return
+    rows = max(1, chunksize // max(1, int(np.prod(shape[1:]))))
+    for start in range(0, shape[0], rows):
+        yield slice(start, start + rows)
+
+
+class _HistoCutSorted:
+    """Exact histograms of value ranges of an in-memory array.
+
+    The finite values are sorted once, histograms of any value range are then
+    derived by binary search and equal those of :func:`numpy:numpy.histogram`.
+    """
+
+    def __init__(self, obj):
+        self.max = obj.max()
+        self.values = np.sort(obj[np.isfinite(obj)], axis=None)
+
+    def histogram(self, lower, upper, bins):
+        values = self.values
+        if np.isnan(lower) or np.isnan(upper):
+            values = values[:0]
+        else:
+            lo = np.searchsorted(values, lower, side="left")
+            hi = np.searchsorted(values, upper, side="right")
+            values = values[lo:hi]
+        edges = np.histogram_bin_edges(values[[0, -1]] if len(values) else values, bins)
+        # bins are half open, the last bin includes its right edge
+        ix = np.searchsorted(values, edges, side="left")
+        ix[-1] = len(values)
+        return np.diff(ix), edges
+
+
+class _HistoCutFine:
+    """Exact histograms of value ranges of memory-mapped or dask arrays.
+
+    The array is read in chunks into a fine-grained histogram, keeping count,
+    minimum and maximum of each fine bin. Histograms of any value range are
+    derived from these, only the values of fine bins which contain a bound or
+    class edge are read again. The histograms equal those of
+    :class:`_HistoCutSorted`.
+    """
+
+    def __init__(self, obj, bins, chunksize):
+        self.obj = obj
+        self.chunksize = chunksize
+        self.dtype = obj.dtype
+        vmax = -np.inf
+        fmin, fmax = np.inf, -np.inf
+        for data in self._iter_data():
+            if not data.size:
+                continue
+            vmax = np.max([vmax, np.max(data)])
+            finite = data[np.isfinite(data)]
+            if len(finite):
+                fmin = min(fmin, finite.min())
+                fmax = max(fmax, finite.max())
+        self.max = vmax
+        if fmin > fmax:
+            fmin, fmax = 0.0, 1.0
+        self.edges = np.linspace(fmin, fmax, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.vmin = np.full(bins, np.inf)
+        self.vmax = np.full(bins, -np.inf)
+        for data in self._iter_data():
+            finite = data[np.isfinite(data)]
+            ix = self._index(finite)
+            self.counts += np.bincount(ix, minlength=bins)
+            np.minimum.at(self.vmin, ix, finite)
+            np.maximum.at(self.vmax, ix, finite)
+        self.cum = np.concatenate([[0], np.cumsum(self.counts)])
+        # sorted values of fine bins, read on demand
+        self.values = {}
+
+    def _iter_data(self):
+        """Yields numpy arrays of dask blocks or of chunks along the first
+        axis."""
+        obj = self.obj
+        if hasattr(obj, "blocks"):
+            for ix in np.ndindex(*obj.numblocks):
+                yield np.asarray(obj.blocks[ix])
+        else:
+            for sl in _iter_chunks(obj.shape, self.chunksize):
+                yield np.asarray(obj[sl])
+
+    def _index(self, values):
+        """Returns fine bin indices, the last bin includes its right edge."""
+        ix = np.searchsorted(self.edges, values, side="right") - 1
+        return np.clip(ix, 0, len(self.counts) - 1)
+
+    def _read(self, bins):
+        """Reads the sorted values of the given fine bins in one pass."""
+        bins = np.setdiff1d(bins, list(self.values)).astype(np.intp)
+        if not len(bins):
+            return
+        values = [np.zeros(0, dtype=self.dtype)]
+        ix = [np.zeros(0, dtype=np.intp)]
+        for data in self._iter_data():
+            finite = data[np.isfinite(data)]
+            fix = self._index(finite)
+            select = np.isin(fix, bins)
+            values.append(finite[select])
+            ix.append(fix[select])
+        values = np.concatenate(values)
+        ix = np.concatenate(ix)
+        order = np.lexsort((values, ix))
+        values, ix = values[order], ix[order]
+        for k, vals in zip(bins, np.split(values, np.searchsorted(ix, bins[1:]))):
+            self.values[k] = vals
+
+    def _locate(self, t, side):
+        """Returns number of values left of t ("left": < t, "right": <= t).
+
+        If the values of the fine bin containing t are needed but not read
+        yet, None and the index of this bin are returned instead.
+        """
+        if t < self.edges[0]:
+            return 0, None
+        if t > self.edges[-1]:
+            return self.cum[-1], None
+        k = self._index(t)
+        if t < self.vmin[k] or (side == "left" and t == self.vmin[k]):
+            return self.cum[k], None
+        if t > self.vmax[k] or (side == "right" and t == self.vmax[k]):
+            return self.cum[k + 1], None
+        if k in self.values:
+            return self.cum[k] + np.searchsorted(self.values[k], t, side=side), None
+        return None, k
+
+    def _count(self, thresholds, side):
+        """Returns number of values left of each threshold."""
+        need = [self._locate(t, s)[1] for t, s in zip(thresholds, side)]
+        self._read([k for k in need if k is not None])
+        return np.array([self._locate(t, s)[0] for t, s in zip(thresholds, side)])
+
+    def _value(self, q):
+        """Returns the q-th smallest finite value."""
+        k = np.searchsorted(self.cum, q, side="right") - 1
+        r = q - self.cum[k]
+        if r == 0:
+            return self.vmin[k]
+        if r == self.counts[k] - 1:
+            return self.vmax[k]
+        self._read([k])
+        return self.values[k][r]
+
+    def histogram(self, lower, upper, bins):
+        if np.isnan(lower) or np.isnan(upper):
+            lo = hi = 0
+        else:
+            lo, hi = self._count([lower, upper], ["left", "right"])
+        if hi > lo:
+            vrange = np.array([self._value(lo), self._value(hi - 1)], dtype=self.dtype)
+        else:
+            vrange = np.zeros(0, dtype=self.dtype)
+        edges = np.histogram_bin_edges(vrange, bins)
+        # bins are half open, the last bin includes its right edge
+        ix = np.clip(self._count(edges, ["left"] * len(edges)), lo, hi) - lo
+        ix[-1] = hi - lo
+        return np.diff(ix), edges
+
+
 @histo_cut.register(xr.DataArray)
 def _histo_cut_xarray(obj, **kwargs):
     """Histogram based clutter identification.
@@ -552,6 +766,12 @@ def _histo_cut_xarray(obj, **kwargs):
         Upper frequency percentage for clutter detection, defaults to 0.01.
     lower_frequency : float
         Lower frequency percentage for shading detection, defaults to 0.01.
+    fine_bins : int
+        Number of bins of the fine-grained histogram, defaults to None
+        (exact for in-memory arrays, 2**16 otherwise).
+    chunksize : int
+        Number of elements read at once from memory-mapped arrays, defaults
+        to 2**22. Dask arrays are read block by block.
 
     Returns
     -------
@@ -571,9 +791,8 @@ def _histo_cut_xarray(obj, **kwargs):
         obj,
         input_core_dims=[[dim0, "range"]],
         output_core_dims=[[dim0, "range"]],
-        dask="parallelized",
+        dask="allowed",
         kwargs=kwargs,
-        dask_gufunc_kwargs=dict(allow_rechunk=True),
     )
     out.name = "histo_cut"
     return out
@@ -14,7 +14,15 @@ Combine data from different radar locations on one common set of locations
 
    {}
 """
-__all__ = ["extract_circle", "togrid", "compose_ko", "compose_weighted", "CompMethods"]
+__all__ = [
+    "extract_circle",
+    "togrid",
+    "GriddingPlan",
+    "CompositeAccumulator",
+    "compose_ko",
+    "compose_weighted",
+    "CompMethods",
+]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
 from functools import singledispatch
@@ -22,6 +30,7 @@ from functools import singledispatch
 import numpy as np
 from xarray import DataArray, Dataset, apply_ufunc, broadcast, concat
 
+from wradlib import ipol
 from wradlib.util import XarrayMethods, docstring
 
 
@@ -45,6 +54,172 @@ def extract_circle(center, radius, coords):
     return np.where(((coords - center) ** 2).sum(axis=-1) < radius**2)[0]
 
 
+class GriddingPlan:
+    """Reusable plan to transfer data from a radar location to the composite \
+    grid or set of locations.
+
+    Holds the indices of the composite points within the radar circle and the
+    interpolator built for these points. For :class:`~wradlib.ipol.Nearest`
+    (without ``remove_missing``) and :class:`~wradlib.ipol.Idw` (without
+    ``remove_missing``) the neighbour indices and weights are extracted, so
+    that applying the plan to new data is a single gather-and-reduce.
+
+    Parameters
+    ----------
+    src : :class:`numpy:numpy.ndarray`
+        array of float of shape (numpoints, ndim),
+        cartesian x / y coordinates of the radar bins
+    trg : :class:`numpy:numpy.ndarray`
+        array of float of shape (numpoints, ndim),
+        cartesian x / y coordinates of the composite
+    radius : float
+        the radius of the radar circle (same units as src and trg)
+    center : :class:`numpy:numpy.ndarray`
+        array of float, the location coordinates of the radar
+    interpol : :class:`~wradlib.ipol.IpolBase`
+        an interpolation class name from :mod:`wradlib.ipol`
+        e.g. :class:`~wradlib.ipol.Nearest` or :class:`~wradlib.ipol.Idw`
+
+    Other Parameters
+    ----------------
+    *args : dict
+        arguments of Interpolator (see class documentation)
+
+    Keyword Arguments
+    -----------------
+    call_kwargs : dict
+        keyword arguments used while calling the interpolator,
+        e.g. dict(maxdist=10)
+    **kwargs : dict
+        keyword arguments of Interpolator (see class documentation)
+
+    Examples
+    --------
+    >>> plan = GriddingPlan(src, trg, radius, center, ipol.Nearest)  # doctest: +SKIP
+    >>> grid1 = plan(data1)  # doctest: +SKIP
+    >>> grid2 = plan(np.stack([data1, data2], axis=-1))  # doctest: +SKIP
+    """
+
+    def __init__(self, src, trg, radius, center, interpol, *args, **kwargs):
+        call_kwargs = kwargs.pop("call_kwargs", {})
+        # get indices to select the subgrid from the composite grid
+        self.ix = extract_circle(center, radius, trg)
+        self.numtargets = len(trg)
+        self.interpolator = interpol(src, trg[self.ix], *args, **kwargs)
+        self.call_kwargs = call_kwargs
+        self.nn_ix = None
+        self.outside = None
+        self.weights = None
+        self.wsum = None
+        self._make_weights()
+
+    def _make_weights(self):
+        ip = self.interpolator
+        maxdist = self.call_kwargs.get("maxdist", None)
+        if set(self.call_kwargs) - {"maxdist"}:
+            return
+        if type(ip) is ipol.Nearest and ip.nnearest == 1:
+            self.nn_ix = ip.ix[:, 0]
+            if maxdist is not None:
+                self.outside = ip.dists[:, 0] > maxdist
+        elif type(ip) is ipol.Idw and not ip.remove_missing:
+            # same weights as in Idw.__call__
+            weights = 1.0 / ip.dists**ip.p
+            if maxdist is not None:
+                weights[ip.dists > maxdist] = 0
+            weights[np.isposinf(weights)] = 1e12
+            self.nn_ix = ip.ix
+            self.weights = weights
+            self.wsum = weights.sum(axis=1)
+
+    def interpolate(self, data):
+        """Interpolate data onto the points within the radar circle.
+
+        Parameters
+        ----------
+        data : :class:`numpy:numpy.ndarray`
+            array of float, shape (numsources, ...)
+
+        Returns
+        -------
+        output : :class:`numpy:numpy.ndarray`
+            array of float, shape (len(ix), ...)
+        """
+        data = np.asanyarray(data)
+        if len(data) != self.interpolator.numsources:
+            raise ValueError(
+                f"Length of value array {len(data)} does not correspond to number "
+                f"of source points {self.interpolator.numsources}"
+            )
+        if self.nn_ix is None:
+            out = self.interpolator(data, **self.call_kwargs)
+        elif self.weights is None:
+            out = data[self.nn_ix]
+            if self.outside is not None:
+                out = np.where(
+                    self.outside.reshape((-1,) + (1,) * (data.ndim - 1)), np.nan, out
+                )
+        else:
+            wshape = self.weights.shape + (1,) * (data.ndim - 1)
+            out = np.sum(self.weights.reshape(wshape) * data[self.nn_ix], axis=1)
+            out /= self.wsum.reshape((-1,) + (1,) * (data.ndim - 1))
+        return out.reshape((len(self.ix),) + data.shape[1:])
+
+    def __call__(self, data):
+        """Transfer data to the composite grid.
+
+        Parameters
+        ----------
+        data : :class:`numpy:numpy.ndarray`
+            array of float, shape (numsources, ...), the data that should be
+            transferred to composite, e.g. a single sweep (numsources,) or a
+            stack of sweeps (numsources, ntime)
+
+        Returns
+        -------
+        output : :class:`numpy:numpy.ndarray`
+            array of float, shape (numtargets, ...), data of the radar circle
+            which is interpolated on the composite grid
+        """
+        data_on_subgrid = self.interpolate(data)
+        # create container for entire grid
+        compose_grid = np.full(
+            (self.numtargets,) + data_on_subgrid.shape[1:],
+            np.nan,
+            dtype=np.result_type(data_on_subgrid, np.float64),
+        )
+        # push subgrid results into the large grid
+        compose_grid[self.ix] = data_on_subgrid
+        return compose_grid
+
+    @classmethod
+    def from_xarray(cls, obj, trg, radius, center, interpol, *args, **kwargs):
+        """Create plan for radar sweep and grid given as xarray objects.
+
+        The resulting plan can be passed to :func:`~wradlib.comp.togrid` as
+        ``plan``-kwarg for all sweeps sharing the geometry of ``obj``.
+
+        Parameters
+        ----------
+        obj : :py:class:`xarray:xarray.DataArray` | :py:class:`xarray:xarray.Dataset`
+            radar sweep with x and y coordinates
+        trg : :py:class:`xarray:xarray.DataArray` | :py:class:`xarray:xarray.Dataset`
+            target grid with x and y coordinates
+        radius : float
+            the radius of the radar circle (same units as src and trg)
+        center : :class:`numpy:numpy.ndarray`
+            array of float, the location coordinates of the radar
+        interpol : :class:`~wradlib.ipol.IpolBase`
+            an interpolation class name from :mod:`wradlib.ipol`
+
+        Returns
+        -------
+        plan : :class:`~wradlib.comp.GriddingPlan`
+        """
+        xy, grid_xy = _get_xarray_points(obj, trg)
+        return cls(xy.values, grid_xy.values, radius, center, interpol, *args, **kwargs)
+
+
 @singledispatch
 def togrid(src, trg, radius, center, data, interpol, *args, **kwargs):
     """Interpolate data from a radar location to the composite grid or set of \
@@ -89,32 +264,21 @@ def togrid(src, trg, radius, center, data, interpol, *args, **kwargs):
     Keyword arguments to be used while calling the interpolator can be issued as
     `call_kwargs`, e.g. togrid(..., call_kwargs=dict(maxdist=10))
 
+    For repeated gridding of the same radar geometry create a
+    :class:`~wradlib.comp.GriddingPlan` once and apply it to each sweep.
+
     Examples
     --------
 
     See :ref:`/notebooks/basics/wradlib_workflow.ipynb#Gridding`.
 
     """
-    # get indices to select the subgrid from the composite grid
-    ix = extract_circle(center, radius, trg)
-    call_kwargs = kwargs.pop("call_kwargs", {})
-    # interpolate on subgrid
-    ip = interpol(src, trg[ix], *args, **kwargs)
-    data_on_subgrid = ip(data, **call_kwargs).reshape(len(ix))
-    # create container for entire grid
-    composegridshape = [len(trg)]
-    composegridshape.extend(data.shape[1:])
-    compose_grid = np.repeat(np.nan, len(trg) * np.prod(data.shape[1:])).reshape(
-        composegridshape
-    )
-    # push subgrid results into the large grid
-    compose_grid[ix] = data_on_subgrid
-    return compose_grid
+    plan = GriddingPlan(src, trg, radius, center, interpol, *args, **kwargs)
+    return plan(data)
 
 
-@togrid.register(DataArray)
-@togrid.register(Dataset)
-def _togrid_xarray(obj, trg, *args, **kwargs):
+def _get_xarray_points(obj, trg):
+    """Return stacked source and target points of xarray radar sweep and grid."""
     dim0 = obj.wrl.util.dim0()
     grid_xy = (
         concat(broadcast(trg.y, trg.x), "xy")
@@ -127,14 +291,25 @@ def _togrid_xarray(obj, trg, *args, **kwargs):
         .transpose(..., "xy")
         .reset_coords(drop=True)
     )
+    return xy, grid_xy
+
+
+@togrid.register(DataArray)
+@togrid.register(Dataset)
+def _togrid_xarray(obj, trg, *args, plan=None, **kwargs):
+    dim0 = obj.wrl.util.dim0()
+    xy, grid_xy = _get_xarray_points(obj, trg)
     obj = obj.stack(npoints_pol=(dim0, "range")).reset_coords(drop=True)
 
-    def wrapper(obj, xy, grid_xy, **kwargs):
-        radius = kwargs.get("radius")
-        center = kwargs.get("center")
-        ipol = kwargs.get("interpol")
-        out = togrid(xy, grid_xy, radius, center, obj, ipol)
-        return out
+    def wrapper(obj, xy, grid_xy, plan=None, **kwargs):
+        if plan is None:
+            radius = kwargs.get("radius")
+            center = kwargs.get("center")
+            interpol = kwargs.get("interpol")
+            plan = GriddingPlan(xy, grid_xy, radius, center, interpol)
+        # core dimension is last, plan works along first
+        out = plan(np.moveaxis(obj, -1, 0))
+        return np.moveaxis(out, 0, -1)
 
     out = apply_ufunc(
         wrapper,
@@ -148,7 +323,7 @@ def _togrid_xarray(obj, trg, *args, **kwargs):
         ],
         output_core_dims=[["npoints_cart"]],
         dask="parallelized",
-        kwargs=kwargs,
+        kwargs=dict(plan=plan, **kwargs),
         dask_gufunc_kwargs=dict(allow_rechunk=True),
         on_missing_core_dim="drop",
     )
@@ -159,6 +334,112 @@ def _togrid_xarray(obj, trg, *args, **kwargs):
     return out
 
 
+class CompositeAccumulator:
+    """Accumulate radar grids one by one into a composite.
+
+    Only the running state (max quality and selected value for ``method="ko"``,
+    weighted sum and sum of weights for ``method="weighted"``) is kept in
+    preallocated buffers, so that the radar grids never need to be held in
+    memory at once. Grids can be added as a whole or for sub-tiles of the
+    composite (e.g. the radar circle of a :class:`~wradlib.comp.GriddingPlan`).
+
+    Parameters
+    ----------
+    shape : tuple
+        shape of the composite grid
+    method : str
+        "ko" (see :func:`~wradlib.comp.compose_ko`) or "weighted"
+        (see :func:`~wradlib.comp.compose_weighted`), defaults to "weighted"
+    dtype : :py:class:`numpy:numpy.dtype`
+        dtype of the accumulation buffers, defaults to float32
+
+    Examples
+    --------
+    >>> acc = CompositeAccumulator(grid_shape, method="ko")  # doctest: +SKIP
+    >>> for radar in radars:  # doctest: +SKIP
+    ...     plan = plans[radar]
+    ...     acc.add(plan.interpolate(data[radar]), qual[radar], index=plan.ix)
+    >>> composite = acc.result()  # doctest: +SKIP
+    """
+
+    def __init__(self, shape, *, method="weighted", dtype=np.float32):
+        if method not in ["ko", "weighted"]:
+            raise ValueError(
+                f"wradlib: unknown compositing method {method!r}, "
+                "use 'ko' or 'weighted'."
+            )
+        self.method = method
+        self.shape = tuple(np.atleast_1d(shape))
+        if method == "ko":
+            self.value = np.full(self.shape, np.nan, dtype=dtype)
+            self.quality = np.full(self.shape, -np.inf, dtype=dtype)
+            # pixels already covered by any radar
+            self.valid = np.zeros(self.shape, dtype=bool)
+        else:
+            self.value = np.zeros(self.shape, dtype=dtype)
+            self.quality = np.zeros(self.shape, dtype=dtype)
+            # pixels where any radar value is available
+            self.valid = np.zeros(self.shape, dtype=bool)
+
+    def add(self, radargrid, qualitygrid, *, index=None):
+        """Add radar and quality grid to composite.
+
+        Parameters
+        ----------
+        radargrid : :class:`numpy:numpy.ndarray`
+            radar data of one radar location
+        qualitygrid : :class:`numpy:numpy.ndarray`
+            quality data aligned with ``radargrid``
+        index : slice or tuple or :class:`numpy:numpy.ndarray`
+            index into the composite grid which the given grids correspond to,
+            defaults to None (whole composite grid)
+        """
+        if index is None:
+            index = ...
+        radargrid = np.asanyarray(radargrid)
+        qualitygrid = np.asanyarray(qualitygrid)
+        if self.method == "ko":
+            self._add_ko(radargrid, qualitygrid, index)
+        else:
+            self._add_weighted(radargrid, qualitygrid, index)
+
+    def _add_ko(self, radargrid, qualitygrid, index):
+        value = self.value[index]
+        quality = self.quality[index]
+        valid = self.valid[index]
+        # first radar with highest quality wins, NaN quality is lowest
+        qualitygrid = np.where(np.isnan(qualitygrid), -np.inf, qualitygrid)
+        update = (qualitygrid > quality) | ~valid
+        np.copyto(value, radargrid, where=update, casting="unsafe")
+        np.copyto(quality, qualitygrid, where=update, casting="unsafe")
+        valid |= update
+        # write back in case index is not a basic slice
+        self.value[index] = value
+        self.quality[index] = quality
+        self.valid[index] = valid
+
+    def _add_weighted(self, radargrid, qualitygrid, index):
+        valid = ~np.isnan(radargrid)
+        weight = np.where(valid & ~np.isnan(qualitygrid), qualitygrid, 0)
+        self.quality[index] += weight
+        self.value[index] += np.where(weight != 0, radargrid * weight, 0)
+        self.valid[index] |= valid
+
+    def result(self):
+        """Return composite of all grids added so far.
+
+        Returns
+        -------
+        composite : :class:`numpy:numpy.ndarray`
+        """
+        if self.method == "ko":
+            return self.value.copy()
+        composite = np.zeros_like(self.value)
+        np.divide(self.value, self.quality, out=composite, where=self.quality != 0)
+        composite[~self.valid] = np.nan
+        return composite
+
+
 def compose_ko(radargrids, qualitygrids):
     """Composes grids according to quality information using quality \
     information as a knockout criterion.
@@ -182,29 +463,14 @@ def compose_ko(radargrids, qualitygrids):
     -------
     composite : :class:`numpy:numpy.ndarray`
 
+    See Also
+    --------
+    :class:`~wradlib.comp.CompositeAccumulator`
     """
-    # first add a fallback array for all pixels having missing values in all
-    # radargrids
-    radarfallback = np.repeat(np.nan, np.prod(radargrids[0].shape)).reshape(
-        radargrids[0].shape
-    )
-    radargrids.append(radarfallback)
-    radarinfo = np.array(radargrids)
-    # then do the same for the quality grids
-    qualityfallback = np.repeat(-np.inf, np.prod(radargrids[0].shape)).reshape(
-        radargrids[0].shape
-    )
-    qualitygrids.append(qualityfallback)
-    qualityinfo = np.array(qualitygrids)
-
-    select = np.nanargmax(qualityinfo, axis=0)
-    composite = radarinfo.reshape((radarinfo.shape[0], -1))[
-        select.ravel(), np.arange(np.prod(radarinfo.shape[1:]))
-    ].reshape(radarinfo.shape[1:])
-    radargrids.pop()
-    qualitygrids.pop()
-
-    return composite
+    acc = CompositeAccumulator(np.shape(radargrids[0]), method="ko", dtype=np.float64)
+    for radargrid, qualitygrid in zip(radargrids, qualitygrids):
+        acc.add(radargrid, qualitygrid)
+    return acc.result()
 
 
 @singledispatch
@@ -234,20 +500,14 @@ def compose_weighted(radargrids, qualitygrids):
     See Also
     --------
     :func:`~wradlib.comp.compose_ko`
+    :class:`~wradlib.comp.CompositeAccumulator`
     """
-    radarinfo = np.array(radargrids)
-    qualityinfo = np.array(qualitygrids)
-    # overall nanmask
-    nanmask = np.all(np.isnan(radarinfo), axis=0)
-    # quality grids must contain values only where radarinfo does
-    qualityinfo[np.isnan(radarinfo)] = np.nan
-
-    qualityinfo /= np.nansum(qualityinfo, axis=0)
-
-    composite = np.nansum(radarinfo * qualityinfo, axis=0)
-    composite[nanmask] = np.nan
-
-    return composite
+    acc = CompositeAccumulator(
+        np.shape(radargrids[0]), method="weighted", dtype=np.float64
+    )
+    for radargrid, qualitygrid in zip(radargrids, qualitygrids):
+        acc.add(radargrid, qualitygrid)
+    return acc.result()
 
 
 @compose_weighted.register(DataArray)
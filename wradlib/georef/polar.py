@@ -27,6 +27,8 @@ __all__ = [
 __doc__ = __doc__.format("\n   ".join(__all__))
 __doctest_requires__ = {"spherical*": ["osgeo"]}
 
+import hashlib
+from collections import OrderedDict
 from functools import singledispatch
 
 import numpy as np
@@ -864,7 +866,8 @@ def maximum_intensity_projection(
     Parameters
     ----------
     data : :class:`numpy:numpy.ndarray`
-        Array containing polar data (azimuth, range)
+        Array containing polar data (..., azimuth, range). Leading dimensions
+        (e.g. sweeps of a volume or time steps) are projected in one go.
     r : :class:`numpy:numpy.ndarray`, optional
         Array containing range data
     az : :class:`numpy:numpy.ndarray`, optional
@@ -872,8 +875,9 @@ def maximum_intensity_projection(
     angle : float, optional
         angle of slice, Defaults to 0. Should be between 0 and 180.
         0. means horizontal slice, 90. means vertical slice
-    elev : float, optional
-        elevation angle of scan, Defaults to 0.
+    elev : float or :class:`numpy:numpy.ndarray`, optional
+        elevation angle of scan, Defaults to 0. Array input is broadcast
+        against the leading dimensions of `data`.
     autoext : bool, optional
         This routine uses :func:`numpy.numpy.digitize` to bin the data.
         As this function needs bounds, we create one set of coordinates more
@@ -886,13 +890,16 @@ def maximum_intensity_projection(
     ys : :class:`numpy:numpy.ndarray`
         meshgrid y array
     mip : :class:`numpy:numpy.ndarray`
-        Array containing the maximum intensity projection (range, range*2)
+        Array containing the maximum intensity projection
+        (..., range, range*2)
     """
+    data = np.asanyarray(data)
+
     # providing 'reasonable defaults', based on the data's shape
     if r is None:
-        r = np.arange(data.shape[1], dtype=np.float64)
+        r = np.arange(data.shape[-1], dtype=np.float64)
     if az is None:
-        az = np.arange(data.shape[0], dtype=np.float64)
+        az = np.arange(data.shape[-2], dtype=np.float64)
 
     if angle is None:
         angle = 0.0
@@ -915,7 +922,7 @@ def maximum_intensity_projection(
 
     # roll data array to specified azimuth, assuming equidistant azimuth angles
     ind = (az >= angle).nonzero()[0][0]
-    data = np.roll(data, ind, axis=0)
+    data = np.roll(data, ind, axis=-2)
 
     # build cartesian range array, add delta to last element to compensate for
     # open bound (np.digitize)
@@ -923,70 +930,127 @@ def maximum_intensity_projection(
 
     # get height values from polar data and build cartesian height array
     # add delta to last element to compensate for open bound (np.digitize)
-    hp = np.zeros((y.shape[0], x.shape[0]))
-    hc = misc.bin_altitude(x, elev, 0, re=6370040.0)
-    hp[:] = hc
-    hc[-1] += 0.0001
-
-    # create meshgrid for polar data
-    xx, yy = np.meshgrid(x, y)
+    lead = np.broadcast_shapes(data.shape[:-2], np.shape(elev))
+    elev = np.broadcast_to(elev, lead)
+    hc = misc.bin_altitude(x, elev[..., None], 0, re=6370040.0)
+    hp = hc.copy()
+    hc[..., -1] += 0.0001
 
     # create meshgrid for cartesian slices
-    xs, ys = np.meshgrid(dc, hc)
-
-    # convert polar coordinates to cartesian
-    xxx = xx * np.cos(np.radians(90.0 - yy))
-
-    # digitize coordinates according to cartesian range array
-    range_dig1 = np.digitize(xxx.ravel(), dc)
-    range_dig1.shape = xxx.shape
-
-    # digitize heights according polar height array
-    height_dig1 = np.digitize(hp.ravel(), hc)
-    # reshape accordingly
-    height_dig1.shape = hp.shape
-
-    # what am I doing here?!
-    range_dig1 = range_dig1[0:-1, 0:-1]
-    height_dig1 = height_dig1[0:-1, 0:-1]
-
-    # create height and range masks
-    height_mask = [(height_dig1 == i).ravel().nonzero()[0] for i in range(1, len(hc))]
-    range_mask = [(range_dig1 == i).ravel().nonzero()[0] for i in range(1, len(dc))]
-
-    # create mip output array, set outval to inf
-    mip = np.zeros((r.shape[0], 2 * r.shape[0]))
-    mip[:] = np.inf
-
-    # fill mip array,
-    # in some cases there are no values found in the specified range and height
-    # then we fill in nans and interpolate
-    for i in range(0, len(range_mask)):
-        mask1 = range_mask[i]
-        found = False
-        for j in range(0, len(height_mask)):
-            mask2 = np.intersect1d(mask1, height_mask[j])
-            # this is to catch the ValueError from the max() routine when
-            # calculating on empty array
-            try:
-                mip[j, i] = data.ravel()[mask2].max()
-                if not found:
-                    found = True
-            except ValueError:
-                if found:
-                    mip[j, i] = np.nan
+    xs = np.broadcast_to(dc, hc.shape[:-1] + (hc.shape[-1], dc.shape[0])).copy()
+    ys = np.repeat(hc[..., None], dc.shape[0], axis=-1)
+
+    # convert polar coordinates to cartesian and digitize according to
+    # cartesian range array, the upper bounds are excluded
+    xxx = x * np.cos(np.radians(90.0 - y[:, None]))
+    range_dig = np.digitize(xxx[:-1, :-1], dc)
+
+    # digitize heights according polar height array, heights only vary
+    # with range and elevation
+    height_dig = np.empty(hp.shape, dtype=np.intp)
+    for idx in np.ndindex(lead):
+        height_dig[idx] = np.digitize(hp[idx], hc[idx])
+    height_dig = height_dig[..., None, :-1]
+
+    # bin index into (range, 2 * range) output grid, out of bounds bins
+    # are flagged with -1
+    nrows = r.shape[0]
+    ncols = dc.shape[0] - 1
+    valid = (range_dig >= 1) & (range_dig <= ncols)
+    valid = valid & (height_dig >= 1) & (height_dig < hc.shape[-1])
+    cell = np.where(valid, (height_dig - 1) * ncols + range_dig - 1, -1)
+    data = data[..., : range_dig.shape[0], : range_dig.shape[1]]
+    cell, data = np.broadcast_arrays(cell, data)
+    cell = cell.reshape(-1, range_dig.size)
+    data = data.reshape(-1, range_dig.size)
+    # offset bins of leading dimensions
+    cell = np.where(cell >= 0, cell + np.arange(len(cell))[:, None] * nrows * ncols, -1)
+    valid = cell >= 0
+    cell = cell[valid]
+
+    # scatter max into output array, bins without data get outval inf
+    size = len(data) * nrows * ncols
+    mip = np.full(size, -np.inf)
+    with np.errstate(invalid="ignore"):
+        np.maximum.at(mip, cell, data[valid])
+    count = np.bincount(cell, minlength=size).reshape(len(data), nrows, ncols)
+    mip = mip.reshape(count.shape)
+    mip[count == 0] = np.inf
+
+    # in some cases there are no values found in the specified range and
+    # height above the lowest found value, we fill in nans and interpolate
+    found = np.cumsum(count, axis=-2) > 0
+    mip[(count == 0) & found] = np.nan
 
     # interpolate nans inside image, do not touch outvals
-    good = ~np.isnan(mip)
-    xp = good.ravel().nonzero()[0]
-    fp = mip[~np.isnan(mip)]
-    x = np.isnan(mip).ravel().nonzero()[0]
-    mip[np.isnan(mip)] = np.interp(x, xp, fp)
+    for img in mip:
+        bad = np.isnan(img)
+        if bad.any():
+            good = ~bad
+            img[bad] = np.interp(
+                bad.ravel().nonzero()[0], good.ravel().nonzero()[0], img[good]
+            )
 
     # reset outval to nan
     mip[mip == np.inf] = np.nan
 
-    return xs, ys, mip
+    return xs, ys, mip.reshape(lead + (nrows, ncols))
+
+
+_GEOMETRY_CACHE = OrderedDict()
+_GEOMETRY_CACHE_SIZE = 16
+
+
+def _array_key(arr):
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    return arr.shape, hashlib.sha1(arr.data).hexdigest()
+
+
+def _sweep_geometry(rng, azi, ele, site, ppi, *, crs, re, ke):
+    """Computes georeferenced sweep geometry.
+
+    Returns tuple of read-only arrays (xyz, gr, rays, bins) and the
+    pyproj CRS of the coordinates.
+    """
+    # create meshgrid to overcome dimension problem with spherical_to_xyz
+    r, az = np.meshgrid(rng, azi)
+
+    # GDAL OSR, convert to this crs
+    if has_import(osr) and isinstance(crs, osr.SpatialReference):
+        xyz = spherical_to_proj(r, az, ele, site, crs=crs, re=re, ke=ke)
+    # other crs, convert to aeqd
+    elif crs:
+        xyz, crs = spherical_to_xyz(r, az, ele, site, re=re, ke=ke, squeeze=True)
+    # crs, convert to aeqd and add offset
+    else:
+        xyz, crs = spherical_to_xyz(r, az, ele, site, re=re, ke=ke, squeeze=True)
+        xyz += np.array(site).T
+
+    # calculate center point
+    # use first range bins
+    ax = tuple(range(xyz.ndim - 2))
+    center = np.mean(xyz[..., 0, :], axis=ax)
+
+    # calculate ground range
+    gr = np.sqrt((xyz[..., 0] - center[0]) ** 2 + (xyz[..., 1] - center[1]) ** 2)
+
+    # rays, bins coordinates
+    if ppi:
+        bins, rays = np.meshgrid(rng, azi, indexing="xy")
+    else:
+        bins, rays = np.meshgrid(rng, ele, indexing="xy")
+
+    # convert GDAL OSR to WKT
+    if has_import(osr):
+        crs = crs.ExportToWkt(["FORMAT=WKT2_2018"])
+
+    # import into pyproj CRS
+    proj_crs = pyproj.CRS.from_user_input(crs)
+
+    arrays = (xyz, gr, rays, bins)
+    for arr in arrays:
+        arr.flags.writeable = False
+    return arrays, proj_crs
 
 
 def georeference(obj, **kwargs):
@@ -996,6 +1060,11 @@ def georeference(obj, **kwargs):
 
     This function adds georeference data to xarray Dataset/DataArray `obj`.
 
+    The computed geometry is cached for the most recently georeferenced
+    sweeps (keyed by site, range, azimuth, elevation, sweep mode, re, ke
+    and crs). Repeated scans of the same geometry get the cached read-only
+    coordinate arrays attached.
+
     Parameters
     ----------
     obj : :py:class:`xarray:xarray.Dataset` or :py:class:`xarray:xarray.DataArray`
@@ -1011,6 +1080,8 @@ def georeference(obj, **kwargs):
         affects radar beam propagation. In principle this is wavelength-
         dependend. The default of 4/3 is a good approximation for most
         weather radar wavelengths.
+    cache : bool
+        If True (default), use and fill the geometry cache.
 
     Returns
     ----------
@@ -1019,6 +1090,7 @@ def georeference(obj, **kwargs):
     trg_crs = kwargs.pop("crs", "None")
     re = kwargs.pop("re", None)
     ke = kwargs.pop("ke", 4.0 / 3.0)
+    cache = kwargs.pop("cache", True)
 
     # adding xyz aeqd-coordinates
     site = (
@@ -1030,33 +1102,35 @@ def georeference(obj, **kwargs):
     if site == (0.0, 0.0, 0.0):
         re = 6378137.0
 
-    # create meshgrid to overcome dimension problem with spherical_to_xyz
-    r, az = np.meshgrid(obj["range"], obj["azimuth"])
+    rng = obj["range"].values
+    azi = obj["azimuth"].values
+    ele = obj["elevation"].values
+    ppi = bool(obj.sweep_mode == "azimuth_surveillance")
 
-    # GDAL OSR, convert to this crs
-    if has_import(osr) and isinstance(trg_crs, osr.SpatialReference):
-        xyz = spherical_to_proj(
-            r, az, obj["elevation"], site, crs=trg_crs, re=re, ke=ke
-        )
-    # other crs, convert to aeqd
-    elif trg_crs:
-        xyz, trg_crs = spherical_to_xyz(
-            r, az, obj["elevation"], site, re=re, ke=ke, squeeze=True
-        )
-    # crs, convert to aeqd and add offset
-    else:
-        xyz, trg_crs = spherical_to_xyz(
-            r, az, obj["elevation"], site, re=re, ke=ke, squeeze=True
+    key = None
+    if cache:
+        if has_import(osr) and isinstance(trg_crs, osr.SpatialReference):
+            crs_key = trg_crs.ExportToWkt()
+        else:
+            crs_key = bool(trg_crs)
+        key = (
+            tuple(float(s) for s in site),
+            _array_key(rng),
+            _array_key(azi),
+            _array_key(ele),
+            ppi,
+            re,
+            ke,
+            crs_key,
         )
-        xyz += np.array(site).T
-
-    # calculate center point
-    # use first range bins
-    ax = tuple(range(xyz.ndim - 2))
-    center = np.mean(xyz[..., 0, :], axis=ax)
-
-    # calculate ground range
-    gr = np.sqrt((xyz[..., 0] - center[0]) ** 2 + (xyz[..., 1] - center[1]) ** 2)
+        geometry = _GEOMETRY_CACHE.pop(key, None)
+    if key is None or geometry is None:
+        geometry = _sweep_geometry(rng, azi, ele, site, ppi, crs=trg_crs, re=re, ke=ke)
+    if key is not None:
+        _GEOMETRY_CACHE[key] = geometry
+        while len(_GEOMETRY_CACHE) > _GEOMETRY_CACHE_SIZE:
+            _GEOMETRY_CACHE.popitem(last=False)
+    (xyz, gr, rays, bins), proj_crs = geometry
 
     # dimension handling
     dim0 = obj["azimuth"].dims[-1]
@@ -1087,19 +1161,9 @@ def georeference(obj, **kwargs):
     obj.coords["gr"] = (dimlist, gr, gr_attrs)
 
     # adding rays, bins coordinates
-    if obj.sweep_mode == "azimuth_surveillance":
-        bins, rays = np.meshgrid(obj["range"], obj["azimuth"], indexing="xy")
-    else:
-        bins, rays = np.meshgrid(obj["range"], obj["elevation"], indexing="xy")
     obj.coords["rays"] = ([dim0, "range"], rays, obj[dim0].attrs)
     obj.coords["bins"] = ([dim0, "range"], bins, obj["range"].attrs)
 
-    # convert GDAL OSR to WKT
-    if has_import(osr):
-        trg_crs = trg_crs.ExportToWkt(["FORMAT=WKT2_2018"])
-
-    # import into pyproj CRS
-    proj_crs = pyproj.CRS.from_user_input(trg_crs)
     obj = add_crs(obj, crs=proj_crs)
 
     return obj
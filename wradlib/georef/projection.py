@@ -28,14 +28,15 @@ __all__ = [
 ]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import threading
 import warnings
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 import numpy as np
 import xradar as xd
 from xarray import DataArray, Dataset, apply_ufunc
 
-from wradlib.util import docstring, import_optional
+from wradlib.util import docstring, has_import, import_optional
 
 gdal = import_optional("osgeo.gdal")
 ogr = import_optional("osgeo.ogr")
@@ -285,6 +286,7 @@ def reproject(*args, **kwargs):
         C = C.reshape(-1, numCols)
         if numCols < 2 or numCols > 3:
             raise TypeError("Input Array column mismatch to `reproject`.")
+        cols = [C[:, i] for i in range(numCols)]
     else:
         if len(args) == 2:
             X, Y = (np.asanyarray(arg) for arg in args)
@@ -313,38 +315,88 @@ def reproject(*args, **kwargs):
                     f"Shape mismatch `Z` ({zshape}) input to `reproject`. "
                     f"Shape of ({xshape}) needed."
                 )
-            C = np.concatenate(
-                [X.ravel()[:, None], Y.ravel()[:, None], Z.ravel()[:, None]], axis=1
-            )
+            cols = [X.ravel(), Y.ravel(), Z.ravel()]
         else:
-            C = np.concatenate([X.ravel()[:, None], Y.ravel()[:, None]], axis=1)
+            cols = [X.ravel(), Y.ravel()]
 
     src_crs = kwargs.get("src_crs", get_default_projection())
     trg_crs = kwargs.get("trg_crs", get_default_projection())
 
     area_of_interest = kwargs.get("area_of_interest", None)
+    if area_of_interest is not None:
+        area_of_interest = tuple(float(v) for v in area_of_interest)
 
     axis_order = osr.OAMS_TRADITIONAL_GIS_ORDER
     src_crs.SetAxisMappingStrategy(axis_order)
     trg_crs.SetAxisMappingStrategy(axis_order)
-    options = osr.CoordinateTransformationOptions()
-    if area_of_interest is not None:
-        options.SetAreaOfInterest(*area_of_interest)
-    ct = osr.CreateCoordinateTransformation(src_crs, trg_crs, options)
-    trans = np.array(ct.TransformPoints(C))
+
+    trans = _transform_arrays(cols, src_crs, trg_crs, area_of_interest)
 
     if len(args) == 1:
-        return trans[:, 0:numCols].reshape(cshape)
+        return np.stack(trans, axis=-1).reshape(cshape)
     else:
-        X = trans[:, 0].reshape(xshape)
-        Y = trans[:, 1].reshape(yshape)
+        X = trans[0].reshape(xshape)
+        Y = trans[1].reshape(yshape)
         if len(args) == 2:
             return X, Y
         if len(args) == 3:
-            Z = trans[:, 2].reshape(zshape)
+            Z = trans[2].reshape(zshape)
             return X, Y, Z
 
 
+@lru_cache(maxsize=32)
+def _get_transformer(src_wkt, trg_wkt, area_of_interest=None, thread_id=None):
+    """Create coordinate transformer for given crs pair, cached.
+
+    Uses :py:class:`pyproj:pyproj.Transformer` if available, which is
+    thread-safe. Otherwise a :py:class:`gdal:osgeo.osr.CoordinateTransformation`
+    is created, which must not be shared between threads, so the caller
+    keys those by ``thread_id``.
+    """
+    if has_import(pyproj):
+        aoi = None
+        if area_of_interest is not None:
+            aoi = pyproj.aoi.AreaOfInterest(*area_of_interest)
+        return pyproj.Transformer.from_crs(
+            pyproj.CRS.from_wkt(src_wkt),
+            pyproj.CRS.from_wkt(trg_wkt),
+            always_xy=True,
+            area_of_interest=aoi,
+        )
+
+    axis_order = osr.OAMS_TRADITIONAL_GIS_ORDER
+    src_crs = osr.SpatialReference()
+    src_crs.ImportFromWkt(src_wkt)
+    src_crs.SetAxisMappingStrategy(axis_order)
+    trg_crs = osr.SpatialReference()
+    trg_crs.ImportFromWkt(trg_wkt)
+    trg_crs.SetAxisMappingStrategy(axis_order)
+    options = osr.CoordinateTransformationOptions()
+    if area_of_interest is not None:
+        options.SetAreaOfInterest(*area_of_interest)
+    return osr.CreateCoordinateTransformation(src_crs, trg_crs, options)
+
+
+def _transform_arrays(cols, src_crs, trg_crs, area_of_interest=None):
+    """Transform list of coordinate arrays (x, y[, z]) from src_crs to trg_crs.
+
+    Returns list of transformed float64 arrays of the same length.
+    """
+    wkt_opts = ["FORMAT=WKT2_2018"]
+    src_wkt = src_crs.ExportToWkt(wkt_opts)
+    trg_wkt = trg_crs.ExportToWkt(wkt_opts)
+    if has_import(pyproj):
+        transformer = _get_transformer(src_wkt, trg_wkt, area_of_interest)
+        # contiguous float64 buffers are handed to PROJ without copying
+        cols = [np.ascontiguousarray(c, dtype=np.float64) for c in cols]
+        return list(transformer.transform(*cols))
+
+    ct = _get_transformer(src_wkt, trg_wkt, area_of_interest, threading.get_ident())
+    C = np.stack(cols, axis=-1).astype(np.float64, copy=False)
+    trans = np.array(ct.TransformPoints(C))
+    return [trans[:, i] for i in range(len(cols))]
+
+
 @reproject.register(DataArray)
 @reproject.register(Dataset)
 def _reproject_xarray(obj, **kwargs):
@@ -17,6 +17,7 @@ __all__ = [
     "read_gdal_values",
     "read_gdal_projection",
     "read_gdal_coordinates",
+    "sample_raster_values",
     "extract_raster_dataset",
     "get_raster_extent",
     "get_raster_elevation",
@@ -113,6 +114,89 @@ def _pixel_to_map(coordinates, geotransform):
     return coordinates_map
 
 
+def _map_to_pixel(coordinates, geotransform):
+    """Apply the inverse geographical transformation to return pixel
+    coordinates from map coordinates.
+
+    Parameters
+    ----------
+    coordinates : :class:`numpy:numpy.ndarray`
+        array of map coordinates (x,y)
+    geotransform : :class:`numpy:numpy.ndarray`
+        geographical transformation vector (see :func:`_pixel_to_map`)
+
+    Returns
+    -------
+    coordinates_pixel : :class:`numpy:numpy.ndarray`
+        array with pixel coordinates (x,y) in image convention
+    """
+    det = geotransform[1] * geotransform[5] - geotransform[2] * geotransform[4]
+    dx = coordinates[..., 0] - geotransform[0]
+    dy = coordinates[..., 1] - geotransform[3]
+    coordinates_pixel = np.empty(coordinates.shape)
+    coordinates_pixel[..., 0] = (geotransform[5] * dx - geotransform[2] * dy) / det
+    coordinates_pixel[..., 1] = (geotransform[1] * dy - geotransform[4] * dx) / det
+    return coordinates_pixel
+
+
+def sample_raster_values(dataset, coords, *, band=1, nodata=np.nan):
+    """Sample raster values at given map coordinates.
+
+    Only the raster window enclosing `coords` is read from `dataset`, so
+    large (e.g. virtual) mosaics can be sampled block by block.
+
+    Parameters
+    ----------
+    dataset : :py:class:`gdal:osgeo.gdal.Dataset`
+        raster image with georeferencing
+    coords : :class:`numpy:numpy.ndarray`
+        Array of shape (..., 2) containing xy-coordinates in the
+        projection of `dataset`.
+
+    Keyword Arguments
+    -----------------
+    band : int
+        raster band to sample, defaults to 1
+    nodata : float
+        value for coordinates outside the raster and raster nodata
+
+    Returns
+    -------
+    values : :class:`numpy:numpy.ndarray`
+        Array of shape (...) containing the values of the raster pixels
+        the coordinates fall into.
+    """
+    coords = np.asanyarray(coords)
+    pixel = np.floor(_map_to_pixel(coords, dataset.GetGeoTransform()))
+    cols = pixel[..., 0]
+    rows = pixel[..., 1]
+    inside = (cols >= 0) & (cols < dataset.RasterXSize)
+    inside &= (rows >= 0) & (rows < dataset.RasterYSize)
+
+    values = np.full(coords.shape[:-1], nodata, dtype=np.float64)
+    if not inside.any():
+        return values
+
+    cols = cols[inside].astype(np.intp)
+    rows = rows[inside].astype(np.intp)
+    xoff = cols.min()
+    yoff = rows.min()
+    rband = dataset.GetRasterBand(band)
+    window = rband.ReadAsArray(
+        int(xoff),
+        int(yoff),
+        int(cols.max() - xoff + 1),
+        int(rows.max() - yoff + 1),
+    )
+    data = window[rows - yoff, cols - xoff].astype(np.float64)
+    nd = rband.GetNoDataValue()
+    if nd is not None:
+        data[data == nd] = nodata
+    values[inside] = data
+
+    return values
+
+
 def read_gdal_coordinates(dataset, *, mode="center"):
     """Get the projected coordinates from a GDAL dataset.
 
@@ -157,8 +157,9 @@ def get_srtm(extent, *, resolution=3, merge=True, session=None):
         list containing lonmin, lonmax, latmin, latmax
     resolution : int
         resolution of SRTM data (1, 3 or 30)
-    merge : bool
-        True to merge the tiles in one dataset
+    merge : bool or str
+        True to merge the tiles in one dataset, "vrt" to return a virtual
+        mosaic, which reads the tiles on demand
     session : object
         session object to use
 
@@ -190,6 +191,8 @@ def get_srtm(extent, *, resolution=3, merge=True, session=None):
     demlist = [gdal.Open(d) for d in demlist]
     if not merge:
         return demlist
+    if merge == "vrt":
+        return gdal.BuildVRT("", demlist)
     dem = gdal.Warp("", demlist, format="MEM")
 
     return dem
@@ -747,6 +747,8 @@ class VectorSource:
         """
         lyr = self.ds.GetLayer()
         lyr.ResetReading()
+        lyr.SetAttributeFilter(None)
+        lyr.SetSpatialFilter(None)
         if filt is not None:
             lyr.SetAttributeFilter(f"{filt[0]}={filt[1]}")
         ret_props = [[] for _ in props]
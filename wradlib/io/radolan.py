@@ -24,6 +24,7 @@ __all__ = [
     "open_radolan_dataset",
     "open_radolan_mfdataset",
     "read_dx",
+    "read_dx_stack",
     "read_radolan_composite",
     "get_radolan_filehandle",
     "read_radolan_header",
@@ -34,7 +35,6 @@ __all__ = [
 __doc__ = __doc__.format("\n   ".join(__all__))
 
 import datetime as dt
-import io
 import re
 
 import numpy as np
@@ -92,6 +92,13 @@ dwdlocs = {
 }
 
 
+# DX product bit masks
+azimuthbitmask = 2 ** (14 - 1)
+databitmask = 2 ** (13 - 1) - 1
+clutterflag = 2**15
+dataflag = 2**13 - 1
+
+
 def _get_timestamp_from_filename(filename, *, pattern=dwdpattern):
     """Helper function doing the actual work of get_dx_timestamp"""
     if pattern is dwdpattern:
@@ -175,6 +182,56 @@ def unpack_dx(raw):
     return np.array(beam)
 
 
+def _unpack_dx_beams(raw, newazimuths):
+    """Removes DWD-DX-product bit-13 zero packing of all beams at once
+
+    Parameters
+    ----------
+    raw : :py:class:`numpy:numpy.ndarray`
+        raw uint16 data words of DX product
+    newazimuths : :py:class:`numpy:numpy.ndarray`
+        indices of beam start words in `raw`, the last entry is `len(raw)`
+
+    Returns
+    -------
+    beams : :py:class:`numpy:numpy.ndarray` or None
+        unpacked uint16 beams of shape (nbeams, nbins), None if beams
+        can't be arranged in a regular array
+    """
+    # data is encoded in the first 12 bits
+    data = 4095
+    # the zero compression flag is bit 13
+    flag = 4096
+
+    nbeams = newazimuths.size - 1
+    start = newazimuths[:-1] + 3
+    size = newazimuths[1:] - start
+    if nbeams == 0 or np.any(size < 0):
+        return None
+
+    # beam number and position of every data word, beam header words are skipped
+    beam = np.repeat(np.arange(nbeams), size)
+    first = np.cumsum(size) - size
+    words = raw[np.repeat(start - first, size) + np.arange(beam.size)]
+
+    # flagged words expand to (word & data) zeros, all others to one value
+    flagged = (words & flag) != 0
+    count = np.where(flagged, words & data, 1).astype(np.int64)
+    nbins = np.bincount(beam, weights=count, minlength=nbeams).astype(np.int64)
+
+    # irregular beams and unflagged beams with size mismatch go the slow way
+    nflags = np.bincount(beam, weights=flagged, minlength=nbeams)
+    if np.any(nbins != nbins[0]) or np.any((nflags == 0) & (size != 128)):
+        return None
+
+    # range bin of every data word from cumulative run lengths
+    rbin = np.cumsum(count) - count - np.repeat(np.cumsum(nbins) - nbins, size)
+
+    beams = np.zeros((nbeams, nbins[0]), dtype=raw.dtype)
+    beams[beam[~flagged], rbin[~flagged]] = words[~flagged]
+    return beams
+
+
 def get_dx_header_token():
     """Return array with known header token of dx data
 
@@ -302,12 +359,84 @@ def read_dx(filename):
     --------
     See :ref:`/notebooks/fileio/legacy/read_dx.ipynb`.
     """
+    raw, attrs = _read_dx_raw(filename)
+    beams, attrs["elev"], attrs["azim"] = _decode_dx_raw(raw)
+
+    attrs["clutter"] = (beams & clutterflag) != 0
+
+    # converting the DWD rvp6-format into dBZ data and return as numpy array
+    # together with attributes
+    return (beams & dataflag) * 0.5 - 32.5, attrs
+
+
+def read_dx_stack(filenames):
+    """Data reader for a series of German Weather Service DX product raw
+    radar data files.
+
+    All files are decoded into one stacked array. The files need to
+    contain the same number of beams and range bins.
+
+    Parameters
+    ----------
+    filenames : sequence of str or file-like
+        filenames of binary files of DX raw data or file-like objects
+
+    Returns
+    -------
+    data : :py:class:`numpy:numpy.ndarray`
+        Array of image data [dBZ]; shape (nfiles, 360, 128)
+    attributes : list
+        list of attribute dictionaries, one per file, see
+        :func:`~wradlib.io.radolan.read_dx`. The 'azim', 'elev' and
+        'clutter' entries are views into stacked arrays.
+    """
+    nfiles = len(filenames)
+    data = None
+    attrs = []
+    for i, filename in enumerate(filenames):
+        raw, attr = _read_dx_raw(filename)
+        beams, elev, azim = _decode_dx_raw(raw)
+        if data is None:
+            data = np.empty((nfiles,) + beams.shape, dtype=beams.dtype)
+            elevs = np.empty((nfiles, beams.shape[0]))
+            azims = np.empty((nfiles, beams.shape[0]))
+        elif beams.shape != data.shape[1:]:
+            raise ValueError(
+                f"DX shape mismatch. Expected shape {data.shape[1:]}, "
+                f"but got {beams.shape} for file number {i}."
+            )
+        data[i] = beams
+        elevs[i] = elev
+        azims[i] = azim
+        attrs.append(attr)
+
+    if data is None:
+        raise ValueError("No DX files given.")
+
+    clutter = (data & clutterflag) != 0
+    for i, attr in enumerate(attrs):
+        attr["elev"] = elevs[i]
+        attr["azim"] = azims[i]
+        attr["clutter"] = clutter[i]
+
+    return (data & dataflag) * 0.5 - 32.5, attrs
+
 
-    azimuthbitmask = 2 ** (14 - 1)
-    databitmask = 2 ** (13 - 1) - 1
-    clutterflag = 2**15
-    dataflag = 2**13 - 1
+def _read_dx_raw(filename):
+    """Reads DX header and raw uint16 data words
 
+    Parameters
+    ----------
+    filename : str or file-like
+        filename of binary file of DX raw data or file-like object
+
+    Returns
+    -------
+    raw : :py:class:`numpy:numpy.ndarray`
+        raw uint16 data words
+    attrs : dict
+        header attributes
+    """
     with get_radolan_filehandle(filename) as f:
         # header string for later processing
         header = ""
@@ -346,6 +475,26 @@ def read_dx(filename):
         # we can interpret the rest directly as a 1-D array of 16 bit unsigned ints
         raw = np.frombuffer(buf, dtype="uint16")
 
+    return raw, attrs
+
+
+def _decode_dx_raw(raw):
+    """Decodes raw DX data words into beams, elevations and azimuths
+
+    Parameters
+    ----------
+    raw : :py:class:`numpy:numpy.ndarray`
+        raw uint16 data words
+
+    Returns
+    -------
+    beams : :py:class:`numpy:numpy.ndarray`
+        unpacked beams
+    elevs : :py:class:`numpy:numpy.ndarray`
+        elevation per beam
+    azims : :py:class:`numpy:numpy.ndarray`
+        azimuth per beam
+    """
     # a new ray/beam starts with bit 14 set
     # careful! where always returns its results in a tuple, so in order to get
     # the indices we have to retrieve element 0 of this tuple
@@ -355,31 +504,22 @@ def read_dx(filename):
     # data as the last index
     newazimuths = np.append(newazimuths, len(raw))
 
-    # initialize our list of rays/beams
-    beams = []
-    # initialize our list of elevations
-    elevs = []
-    # initialize our list of azimuths
-    azims = []
-
-    # iterate over all beams
-    for i in range(newazimuths.size - 1):
-        # unpack zeros
-        beam = unpack_dx(raw[newazimuths[i] + 3 : newazimuths[i + 1]])
-        beams.append(beam)
-        elevs.append((raw[newazimuths[i] + 2] & databitmask) / 10.0)
-        azims.append((raw[newazimuths[i] + 1] & databitmask) / 10.0)
-
-    beams = np.array(beams)
-
-    # attrs =  {}
-    attrs["elev"] = np.array(elevs)
-    attrs["azim"] = np.array(azims)
-    attrs["clutter"] = (beams & clutterflag) != 0
+    elevs = (raw[newazimuths[:-1] + 2] & databitmask) / 10.0
+    azims = (raw[newazimuths[:-1] + 1] & databitmask) / 10.0
 
-    # converting the DWD rvp6-format into dBZ data and return as numpy array
-    # together with attributes
-    return (beams & dataflag) * 0.5 - 32.5, attrs
+    # unpack zeros of all beams at once
+    beams = _unpack_dx_beams(raw, newazimuths)
+
+    # iterate over all beams, if they can't be unpacked at once
+    if beams is None:
+        beams = []
+        for i in range(newazimuths.size - 1):
+            # unpack zeros
+            beam = unpack_dx(raw[newazimuths[i] + 3 : newazimuths[i + 1]])
+            beams.append(beam)
+        beams = np.array(beams)
+
+    return beams, elevs, azims
 
 
 def get_radolan_header_token():
@@ -696,6 +836,10 @@ def decode_radolan_runlength_array(binarr, attrs):
     """Decodes the binary runlength coded section from DWD composite
     file and return decoded numpy array with correct shape
 
+    The whole buffer is decoded at once. Line boundaries, offsets and run
+    widths are derived with array operations and the decoded values are
+    scattered into a preallocated array.
+
     Parameters
     ----------
     binarr : str
@@ -708,19 +852,48 @@ def decode_radolan_runlength_array(binarr, attrs):
     arr : :py:class:`numpy:numpy.ndarray`
         Array of decoded values
     """
-    buf = io.BytesIO(binarr)
+    buf = np.frombuffer(binarr, dtype=np.uint8)
+    ncol = attrs["ncol"]
 
-    # read and decode first line
-    line = read_radolan_runlength_line(buf)
-    arr = decode_radolan_runlength_line(line, attrs)
+    # every line is terminated by lf (10), the trailing eot (4) is dropped
+    lf = np.flatnonzero(buf == 10)
+    nlines = lf.size
+    start = np.r_[0, lf[:-1] + 1]
 
-    # read following lines
-    line = read_radolan_runlength_line(buf)
-
-    while line is not None:
-        dline = decode_radolan_runlength_line(line, attrs)
-        arr = np.vstack((arr, dline))
-        line = read_radolan_runlength_line(buf)
+    # byte '0' is line number, we don't need it
+    # offset byte(s) start at byte '1', bytes of 255 signal continuation
+    first = start + 1
+    non255 = np.flatnonzero(buf != 255)
+    last = non255[np.searchsorted(non255, first)]
+    offset = (last - first) * (255 - 16) + buf[last].astype(np.int64) - 16
+
+    # line empty condition, lf directly behind offset byte(s)
+    full = last < lf
+    offset = np.where(full, offset, 0)
+
+    # mark runlength bytes between offset byte(s) and lf
+    mark = np.zeros(buf.size + 1, dtype=np.int64)
+    np.add.at(mark, last[full] + 1, 1)
+    np.add.at(mark, lf[full], -1)
+    runs = np.flatnonzero(np.cumsum(mark[:-1]))
+
+    line = np.searchsorted(lf, runs)
+    width = (buf[runs] >> 4).astype(np.int64)
+    value = buf[runs] & 0x0F
+
+    # column of every pixel from line offset and run widths
+    excl = np.cumsum(width) - width
+    lfirst = np.searchsorted(line, np.arange(nlines))
+    lbase = np.zeros(nlines, dtype=np.int64)
+    lbase[full] = excl[lfirst[full]]
+    col = np.repeat(offset[line] - lbase[line], width) + np.arange(width.sum())
+    row = np.repeat(line, width)
+    value = np.repeat(value, width)
+
+    # "offset pixel" and trailing pixel are "not measured" values
+    arr = np.full((nlines, ncol), attrs["nodataflag"], dtype=np.uint8)
+    valid = (col >= 0) & (col < ncol)
+    arr[row[valid], col[valid]] = value[valid]
 
     # reshape early for PZ station product
     if mh := attrs.get("maxheight", False):
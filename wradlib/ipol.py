@@ -37,17 +37,21 @@ __all__ = [
     "cart_to_irregular_interp",
     "cart_to_irregular_spline",
     "IpolMethods",
+    "get_kdtree",
+    "query_kdtree",
 ]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import hashlib
 import re
+from collections import OrderedDict
 from functools import reduce, singledispatch
 
 import numpy as np
 import scipy
 from packaging.version import Version
 from scipy import interpolate as sinterp
-from scipy import ndimage, spatial, special, stats
+from scipy import ndimage, sparse, spatial, special, stats
 
 # from xarray import DataArray, apply_ufunc
 from wradlib import georef, util, zonalstats
@@ -64,6 +68,103 @@ class MissingTargetsError(Exception):
     """Is raised in case no interpolation targets are available."""
 
 
+_KDTREE_CACHE = OrderedDict()
+_KDTREE_CACHE_SIZE = 4
+
+
+def get_kdtree(src, **kwargs):
+    """Returns KD-tree of source coordinates.
+
+    The tree is built from a contiguous float64 copy of ``src``. The most
+    recently built trees are kept, so that interpolators created on the same
+    source coordinates share one tree.
+
+    Parameters
+    ----------
+    src : :class:`numpy:numpy.ndarray`
+        ndarray of floats, shape (npoints, ndims)
+        Data point coordinates of the source points.
+
+    Keyword Arguments
+    -----------------
+    **kwargs : dict
+        keyword arguments of :class:`scipy:scipy.spatial.cKDTree`,
+        ``balanced_tree`` defaults to False
+
+    Returns
+    -------
+    tree : :class:`scipy:scipy.spatial.cKDTree`
+    """
+    kwargs.setdefault("balanced_tree", False)
+    src = np.ascontiguousarray(src, dtype=np.float64)
+    key = (
+        src.shape,
+        hashlib.sha1(src.data).hexdigest(),
+        tuple(sorted(kwargs.items())),
+    )
+    tree = _KDTREE_CACHE.pop(key, None)
+    if tree is None:
+        tree = spatial.cKDTree(src, **kwargs)
+    _KDTREE_CACHE[key] = tree
+    while len(_KDTREE_CACHE) > _KDTREE_CACHE_SIZE:
+        _KDTREE_CACHE.popitem(last=False)
+    return tree
+
+
+def query_kdtree(tree, trg, *, k=1, workers=-1, chunksize=2**20, **kwargs):
+    """Queries KD-tree for nearest neighbours of target coordinates.
+
+    Queries are run in parallel and in chunks of ``chunksize`` targets,
+    which bounds the temporary copy of the target coordinates.
+
+    Parameters
+    ----------
+    tree : :class:`scipy:scipy.spatial.cKDTree`
+        KD-tree of the source points, e.g. from :func:`get_kdtree`
+    trg : :class:`numpy:numpy.ndarray`
+        ndarray of floats, shape (npoints, ndims)
+        Data point coordinates of the target points.
+    k : int
+        number of nearest neighbours, defaults to 1
+    workers : int
+        number of parallel workers, -1 uses all cpus, defaults to -1
+    chunksize : int
+        number of targets queried at once, defaults to 2**20
+
+    Keyword Arguments
+    -----------------
+    **kwargs : dict
+        keyword arguments of :meth:`scipy:scipy.spatial.cKDTree.query`
+
+    Returns
+    -------
+    dists : :class:`numpy:numpy.ndarray`
+        distances, shape (npoints, k), squeezed if k equals 1
+    ix : :class:`numpy:numpy.ndarray`
+        source indices, shape (npoints, k), squeezed if k equals 1
+    """
+    # scipy kwarg changed from version 1.6
+    if Version(scipy.__version__) < Version("1.6"):
+        kwargs.update(n_jobs=workers)
+    else:
+        kwargs.update(workers=workers)
+    trg = np.asanyarray(trg)
+    if len(trg) <= chunksize:
+        trg = np.ascontiguousarray(trg, dtype=np.float64)
+        return tree.query(trg, k=k, **kwargs)
+    dists = ix = None
+    for start in range(0, len(trg), chunksize):
+        sl = slice(start, start + chunksize)
+        chunk = np.ascontiguousarray(trg[sl], dtype=np.float64)
+        d, i = tree.query(chunk, k=k, **kwargs)
+        if dists is None:
+            dists = np.empty((len(trg),) + d.shape[1:], dtype=d.dtype)
+            ix = np.empty((len(trg),) + i.shape[1:], dtype=i.dtype)
+        dists[sl] = d
+        ix[sl] = i
+    return dists, ix
+
+
 class IpolBase:
     """
     IpolBase(src, trg)
@@ -212,8 +313,7 @@ class Nearest(IpolBase):
             if len(src) == 0:
                 raise MissingSourcesError
             # plant a tree, use unbalanced tree as default
-            kwargs.update(balanced_tree=kwargs.pop("balanced_tree", False))
-            self.tree = spatial.cKDTree(src, **kwargs)
+            self.tree = get_kdtree(src, **kwargs)
 
         self.numsources = self.tree.n
 
@@ -225,7 +325,7 @@ class Nearest(IpolBase):
         self.nnearest = remove_missing + 1
 
         # query tree
-        self.dists, self.ix = self.tree.query(trg, k=self.nnearest)
+        self.dists, self.ix = query_kdtree(self.tree, trg, k=self.nnearest)
         # avoid bug, if there is only one neighbor at all
         if self.dists.ndim == 1:
             self.dists = self.dists[:, np.newaxis]
@@ -263,23 +363,24 @@ class Nearest(IpolBase):
 
         # get first neighbour
         trgvals = vals[self.ix[:, 0]]
-        dists = self.dists[..., 0].copy()
-
-        # iteratively fill NaN with next neighbours
-        isnan = np.isnan(trgvals)
-        nanidx = np.argwhere(isnan)[..., 0]
-        if self.nnearest > 1 & np.count_nonzero(isnan):
-            for i in range(self.nnearest - 1):
-                trgvals[isnan] = vals[self.ix[:, i + 1]][isnan]
-                dists[nanidx] = self.dists[..., i + 1][nanidx]
-                isnan = np.isnan(trgvals)
-                nanidx = np.argwhere(isnan)[..., 0]
-                if not np.count_nonzero(isnan):
-                    break
+        dists = self.dists[:, 0]
+
+        # fill NaN with the first valid of the next neighbours
+        isnan = np.isnan(vals)
+        if self.nnearest > 1 and isnan.any():
+            shape = trgvals.shape
+            vals2d = vals.reshape(self.numsources, -1)
+            valid = ~isnan.reshape(self.numsources, -1)[self.ix]
+            # index of first valid neighbour, per target and dataset
+            first = np.argmax(valid, axis=1)
+            ix = np.take_along_axis(self.ix, first, axis=1)
+            trgvals = vals2d[ix, np.arange(vals2d.shape[1])].reshape(shape)
+            dists = np.take_along_axis(self.dists, first, axis=1).reshape(shape)
 
         if maxdist is None:
             return trgvals
         else:
+            dists = dists.reshape(dists.shape + (1,) * (trgvals.ndim - dists.ndim))
             return np.where(dists > maxdist, np.nan, trgvals)
 
 
@@ -303,7 +404,13 @@ class Idw(IpolBase):
         inverse distance power used in 1/dist**p
     remove_missing : bool
         If True masks NaN values in the data values, defaults to False
-
+    sparse : bool
+        If True, the interpolation weights are precomputed as sparse
+        (ntrg, nsrc) matrix and interpolation becomes a sparse matrix
+        product, defaults to False. Recommended when the same interpolator
+        is applied repeatedly or to stacks of shape (nsrc, ntime). NaN
+        are then renormalised by a second product with the validity mask
+        and targets without valid neighbours result in NaN.
 
     Keyword Arguments
     -----------------
@@ -320,7 +427,17 @@ class Idw(IpolBase):
 
     """
 
-    def __init__(self, src, trg, *, nnearest=4, p=2.0, remove_missing=False, **kwargs):
+    def __init__(
+        self,
+        src,
+        trg,
+        *,
+        nnearest=4,
+        p=2.0,
+        remove_missing=False,
+        sparse=False,
+        **kwargs,
+    ):
         if isinstance(src, spatial.cKDTree):
             self.tree = src
         else:
@@ -328,8 +445,7 @@ class Idw(IpolBase):
             if len(src) == 0:
                 raise MissingSourcesError
             # plant a tree, use unbalanced tree as default
-            kwargs.update(balanced_tree=kwargs.pop("balanced_tree", False))
-            self.tree = spatial.cKDTree(src, **kwargs)
+            self.tree = get_kdtree(src, **kwargs)
 
         self.numsources = self.tree.n
 
@@ -350,15 +466,12 @@ class Idw(IpolBase):
             self.nnearest = nnearest
 
         self.remove_missing = remove_missing
+        self.sparse = sparse
+        self._sparse_weights = None
 
         self.p = p
         # query tree
-        # scipy kwarg changed from version 1.6
-        if Version(scipy.__version__) < Version("1.6"):
-            query_kwargs = dict(n_jobs=-1)
-        else:
-            query_kwargs = dict(workers=-1)
-        self.dists, self.ix = self.tree.query(trg, k=self.nnearest, **query_kwargs)
+        self.dists, self.ix = query_kdtree(self.tree, trg, k=self.nnearest)
         # avoid bug, if there is only one neighbor at all
         if self.dists.ndim == 1:
             self.dists = self.dists[:, np.newaxis]
@@ -394,15 +507,10 @@ class Idw(IpolBase):
         """
         self._check_shape(vals)
 
-        weights = 1.0 / self.dists**self.p
+        if self.sparse:
+            return self._call_sparse(vals, maxdist=maxdist)
 
-        # if maxdist isn't given, take the maximum distance
-        if maxdist is not None:
-            outside = self.dists > maxdist
-            weights[outside] = 0
-
-        # take care of point coincidence
-        weights[np.isposinf(weights)] = 1e12
+        weights = self._get_weights(maxdist)
 
         # shape handling (time, ensemble etc)
         wshape = weights.shape
@@ -425,14 +533,65 @@ class Idw(IpolBase):
 
         return interpol
 
+    def _get_weights(self, maxdist):
+        """Returns inverse distance weights of shape (ntrg, nnearest)."""
+        weights = 1.0 / self.dists**self.p
+
+        # if maxdist isn't given, take the maximum distance
+        if maxdist is not None:
+            outside = self.dists > maxdist
+            weights[outside] = 0
+
+        # take care of point coincidence
+        weights[np.isposinf(weights)] = 1e12
+
+        return weights
+
+    def _get_sparse_weights(self, maxdist):
+        """Returns sparse (ntrg, nsrc) weight matrix and its row sums.
+
+        The matrix of the most recently used ``maxdist`` is kept.
+        """
+        if self._sparse_weights is None or self._sparse_weights[0] != maxdist:
+            weights = self._get_weights(maxdist)
+            # zero weights are kept explicitly, so that NaN propagate
+            # like in the dense calculation
+            indptr = np.arange(0, weights.size + 1, self.nnearest)
+            matrix = sparse.csr_array(
+                (weights.ravel(), self.ix.ravel(), indptr),
+                shape=(self.numtargets, self.numsources),
+            )
+            self._sparse_weights = (maxdist, matrix, np.sum(weights, axis=1))
+        return self._sparse_weights[1:]
+
+    def _call_sparse(self, vals, *, maxdist=None):
+        """Interpolates by sparse matrix product."""
+        matrix, wsum = self._get_sparse_weights(maxdist)
+        shape = (self.numtargets,) + vals.shape[1:]
+        vals = vals.reshape(self.numsources, -1)
+        isnan = np.isnan(vals) if self.remove_missing else None
+        if isnan is not None and isnan.any():
+            interpol = matrix @ np.where(isnan, 0.0, vals)
+            wsum = matrix @ (~isnan).astype(matrix.dtype)
+        else:
+            interpol = matrix @ vals
+            wsum = wsum[:, np.newaxis]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            interpol /= wsum
+        if isnan is not None:
+            interpol[wsum == 0] = np.nan
+        return interpol.reshape(shape)
+
 
 class Linear(IpolBase):
     """
-    Interface to the :class:`scipy:scipy.interpolate.LinearNDInterpolator`
-    class.
+    Linear barycentric interpolation on the Delaunay triangulation of the
+    source points, as in :class:`scipy:scipy.interpolate.LinearNDInterpolator`.
 
     We provide this class in order to achieve a uniform interface for all
-    Interpolator classes
+    Interpolator classes. The triangulation, the vertex indices and the
+    barycentric weights of the targets are computed once on construction,
+    so evaluating the interpolator is a weighted gather.
 
     Parameters
     ----------
@@ -442,6 +601,10 @@ class Linear(IpolBase):
     trg : :class:`numpy:numpy.ndarray`
         ndarray of floats, shape (npoints, ndims)
         Data point coordinates of the target points.
+    remove_missing : bool
+        If True, source points with NaN values are excluded from the
+        triangulation. Triangulations are cached per NaN pattern,
+        defaults to False.
 
     Examples
     --------
@@ -459,6 +622,64 @@ class Linear(IpolBase):
         self.numsources = len(src)
         if self.numsources == 0:
             raise MissingSourcesError
+        self.vertices, self.weights, self.outside = self._triangulate()
+        # triangulations for NaN patterns of remove_missing
+        self._cache = {}
+        self._maxcache = 8
+
+    def _triangulate(self, valid=None):
+        """Triangulate (valid) source points and locate the targets.
+
+        Returns
+        -------
+        vertices : :class:`numpy:numpy.ndarray`
+            source indices of the simplex vertices, shape (ntrg, ndim + 1)
+        weights : :class:`numpy:numpy.ndarray`
+            barycentric weights of the vertices, shape (ntrg, ndim + 1)
+        outside : :class:`numpy:numpy.ndarray`
+            targets outside the convex hull, shape (ntrg,)
+        """
+        src = self.src if valid is None else self.src[valid]
+        ndim = src.shape[-1]
+        tri = spatial.Delaunay(src)
+        simplex = tri.find_simplex(self.trg)
+        outside = simplex == -1
+        trans = tri.transform[simplex]
+        delta = self.trg - trans[:, ndim]
+        weights = np.empty((self.numtargets, ndim + 1))
+        weights[:, ndim] = 1.0
+        # same evaluation order as scipy's barycentric coordinates
+        for i in range(ndim):
+            weights[:, i] = 0.0
+            for j in range(ndim):
+                weights[:, i] += trans[:, i, j] * delta[:, j]
+            weights[:, ndim] -= weights[:, i]
+        vertices = tri.simplices[simplex]
+        if valid is not None:
+            vertices = np.flatnonzero(valid)[vertices]
+        vertices[outside] = 0
+        weights[outside] = 0.0
+        return vertices, weights, outside
+
+    def _get_triangulation(self, valid):
+        """Return (cached) triangulation for the given valid source points."""
+        key = np.packbits(valid).tobytes()
+        tri = self._cache.pop(key, None)
+        if tri is None:
+            tri = self._triangulate(valid)
+        # keep most recently used patterns
+        self._cache[key] = tri
+        if len(self._cache) > self._maxcache:
+            self._cache.pop(next(iter(self._cache)))
+        return tri
+
+    def _gather(self, vals, vertices, weights, outside, fill_value):
+        out = np.zeros((self.numtargets,) + vals.shape[1:])
+        wshape = (-1,) + (1,) * (vals.ndim - 1)
+        for j in range(weights.shape[-1]):
+            out += weights[:, j].reshape(wshape) * vals[vertices[:, j]]
+        out[outside] = fill_value
+        return out
 
     def __call__(self, vals, *, fill_value=np.nan):
         """
@@ -488,13 +709,25 @@ class Linear(IpolBase):
         """
         self._check_shape(vals)
         isnan = np.isnan(vals)
-        if self.remove_missing & np.count_nonzero(isnan):
-            ip = sinterp.LinearNDInterpolator(
-                self.src[~isnan, ...], vals[~isnan], fill_value=fill_value
+        if not (self.remove_missing and np.any(isnan)):
+            return self._gather(
+                vals, self.vertices, self.weights, self.outside, fill_value
             )
-        else:
-            ip = sinterp.LinearNDInterpolator(self.src, vals, fill_value=fill_value)
-        return ip(self.trg)
+
+        # evaluate every distinct NaN pattern of the datasets separately
+        vals2d = vals.reshape(self.numsources, -1)
+        patterns, inverse = np.unique(
+            isnan.reshape(self.numsources, -1).T, axis=0, return_inverse=True
+        )
+        out = np.empty((self.numtargets, vals2d.shape[-1]))
+        for i, pattern in enumerate(patterns):
+            cols = np.flatnonzero(inverse.ravel() == i)
+            if np.any(pattern):
+                tri = self._get_triangulation(~pattern)
+            else:
+                tri = (self.vertices, self.weights, self.outside)
+            out[:, cols] = self._gather(vals2d[:, cols], *tri, fill_value)
+        return out.reshape((self.numtargets,) + vals.shape[1:])
 
 
 class RectGridBase:
@@ -946,6 +1179,88 @@ def cov_cau(h, sill=1.0, rng=1.0, alpha=1.0, beta=1.0):
     return sill * (1 + (h / rng) ** alpha) ** (-beta / alpha)
 
 
+def _distance_matrix(pts):
+    """Distance matrices of stacked point configurations (..., npoints, ndims)."""
+    return spatial.minkowski_distance(
+        pts[..., :, np.newaxis, :], pts[..., np.newaxis, :, :]
+    )
+
+
+def _solve_kriging(
+    ix, dists, krig_matrix, krig_rhs, cov0, *, chunksize=None, singular_nan=False
+):
+    """Sets up and solves the kriging systems of all targets in chunks.
+
+    Targets with identical sets of neighbours share one kriging matrix,
+    which is set up only once.
+
+    Parameters
+    ----------
+    ix : :class:`numpy:numpy.ndarray`
+        ndarray of int, shape (numtargets, nnearest), neighbour indices
+    dists : :class:`numpy:numpy.ndarray`
+        ndarray of float, shape (numtargets, nnearest), neighbour distances
+    krig_matrix : callable
+        returns stacked kriging matrices for stacked neighbour indices
+    krig_rhs : callable
+        returns stacked right hand sides for stacked neighbour distances
+    cov0 : float
+        covariance at separation distance 0
+    chunksize : int
+        number of targets solved at once, defaults to keeping the stacked
+        kriging systems below about 256 MB
+    singular_nan : bool
+        If True, singular systems result in NaN weights, otherwise
+        :class:`numpy:numpy.linalg.LinAlgError` is raised, defaults to False
+
+    Returns
+    -------
+    weights : :class:`numpy:numpy.ndarray`
+        ndarray of float, shape (numtargets, nnearest + nlagrange)
+    variance : :class:`numpy:numpy.ndarray`
+        ndarray of float, shape (numtargets, ), estimation variance
+    """
+    ntrg, nnear = ix.shape
+
+    # sort neighbours to identify identical neighbour sets
+    order = np.argsort(ix, axis=1)
+    ix = np.take_along_axis(ix, order, axis=1)
+    dists = np.take_along_axis(dists, order, axis=1)
+    systems, isys = np.unique(ix, axis=0, return_inverse=True)
+    isys = isys.ravel()
+
+    rhs = krig_rhs(dists)
+    nsys = rhs.shape[-1]
+    if chunksize is None:
+        chunksize = max(1, 2**25 // (nsys * nsys))
+
+    # solve chunks of targets grouped by kriging system
+    weights = np.empty_like(rhs)
+    tix = np.argsort(isys, kind="stable")
+    for i in range(0, ntrg, chunksize):
+        chunk = tix[i : i + chunksize]
+        usys, local = np.unique(isys[chunk], return_inverse=True)
+        matrix = krig_matrix(systems[usys])[local.ravel()]
+        try:
+            weights[chunk] = np.linalg.solve(matrix, rhs[chunk, :, np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            if not singular_nan:
+                raise
+            # solve individually, singular systems get NaN weights
+            for j, t in enumerate(chunk):
+                try:
+                    weights[t] = np.linalg.solve(matrix[j], rhs[t])
+                except np.linalg.LinAlgError:
+                    weights[t] = np.nan
+
+    variance = cov0 - np.sum(weights * rhs, axis=1)
+
+    # restore original neighbour order
+    np.put_along_axis(weights[:, :nnear], order, weights[:, :nnear].copy(), axis=1)
+
+    return weights, variance
+
+
 class OrdinaryKriging(IpolBase):
     r"""
     OrdinaryKriging(src, trg, cov='1.0 Exp(10000.)', nnearest=12)
@@ -993,12 +1308,17 @@ class OrdinaryKriging(IpolBase):
         max. number of neighbours to be considered
     remove_missing : bool
         If True masks NaN values in the data values, defaults to False
+    chunksize : int
+        number of kriging systems solved at once, defaults to keeping the
+        stacked kriging systems below about 256 MB
 
 
     Note
     ----
     The class calculates the Kriging weights during initialization, because
-    these only depend on the configuration of the points.
+    these only depend on the configuration of the points. The kriging systems
+    of all targets are solved in stacked chunks and targets with identical
+    sets of neighbours share one kriging matrix.
 
     The call method is then only used to calculate estimated values at the
     target points based on those at the source points. Therefore, the main
@@ -1021,6 +1341,7 @@ class OrdinaryKriging(IpolBase):
         *,
         nnearest=12,
         remove_missing=False,
+        chunksize=None,
         **kwargs,
     ):
         """ """
@@ -1032,12 +1353,12 @@ class OrdinaryKriging(IpolBase):
             if len(src) == 0:
                 raise MissingSourcesError
             # plant a tree, use unbalanced tree as default
-            kwargs.update(balanced_tree=kwargs.pop("balanced_tree", False))
-            self.tree = spatial.cKDTree(self.src, **kwargs)
+            self.tree = get_kdtree(self.src, **kwargs)
 
         self.numsources = self.tree.n
 
         self.remove_missing = remove_missing
+        self.chunksize = chunksize
 
         self.trg = self._make_coord_arrays(trg)
         # remember some things
@@ -1056,48 +1377,49 @@ class OrdinaryKriging(IpolBase):
             self.nnearest = nnearest
 
         # tree query
-        self.dists, self.ix = self.tree.query(trg, k=self.nnearest)
+        self.dists, self.ix = query_kdtree(self.tree, trg, k=self.nnearest)
         # avoid bug, if there is only one neighbor at all
         if self.dists.ndim == 1:
             self.dists = self.dists[:, np.newaxis]
             self.ix = self.ix[:, np.newaxis]
         # parse covariogram function string
         self.cov_func = parse_covariogram(cov)
-        self.weights = []
-        self.estimation_variance = []
         # do the kriging
         self._krige()
 
-    def _krig_matrix(self, src):
-        """Sets up the kriging system for a configuration of source points."""
-        var_matrix = self.cov_func(spatial.distance_matrix(src, src))
+    def _krig_matrix(self, ix):
+        """Sets up the kriging systems for stacked configurations of source
+        points given by their indices."""
+        var_matrix = self.cov_func(_distance_matrix(self.src[ix, :]))
 
-        ok_matrix = np.ones((len(src) + 1, len(src) + 1))
+        ok_matrix = np.ones((len(ix), ix.shape[1] + 1, ix.shape[1] + 1))
 
-        ok_matrix[:-1, :-1] = var_matrix
-        ok_matrix[-1, -1] = 0.0
+        ok_matrix[:, :-1, :-1] = var_matrix
+        ok_matrix[:, -1, -1] = 0.0
 
         return ok_matrix
 
     def _krig_rhs(self, dists):
-        """Sets up a right hand side of the kriging system given the distances
-        of the target to the source points. To be used in conjunction with
-        `_krig_matrix`."""
-        rhs = self.cov_func(dists)
-        ok_rhs = np.concatenate([rhs, [1.0]])
+        """Sets up the right hand sides of the kriging systems given the
+        distances of the targets to the source points. To be used in
+        conjunction with `_krig_matrix`."""
+        ok_rhs = np.ones((len(dists), dists.shape[1] + 1))
+        ok_rhs[:, :-1] = self.cov_func(dists)
 
         return ok_rhs
 
     def _krige(self):
-        """Sets up the kriging system and solves it in order to obtain the
+        """Sets up the kriging systems and solves them in order to obtain the
         interpolation weights of ordinary kriging.
         Also calculates the kriging estimation variance from the results"""
-        for dist, ix in zip(self.dists, self.ix):
-            matrix = self._krig_matrix(self.src[ix, :])
-            rhs = self._krig_rhs(dist)
-            weights = np.linalg.solve(matrix, rhs)
-            self.weights.append(weights)
-            self.estimation_variance.append(self.cov_func(0.0) - np.sum(weights * rhs))
+        self.weights, self.estimation_variance = _solve_kriging(
+            self.ix,
+            self.dists,
+            self._krig_matrix,
+            self._krig_rhs,
+            self.cov_func(0.0),
+            chunksize=self.chunksize,
+        )
 
     def __call__(self, vals):
         """
@@ -1134,7 +1456,7 @@ class OrdinaryKriging(IpolBase):
         trgvals = v[self.ix]
 
         # calculate estimator
-        weights = np.array(self.weights)
+        weights = self.weights
 
         # nan handling
         if self.remove_missing:
@@ -1178,6 +1500,11 @@ class ExternalDriftKriging(IpolBase):
     trg_drift : :class:`numpy:numpy.ndarray`
         ndarray of floats, shape (ntrgpoints, )
         values of the external drift at each target point
+    remove_missing : bool
+        If True masks NaN values in the data values, defaults to False
+    chunksize : int
+        number of kriging systems solved at once, defaults to keeping the
+        stacked kriging systems below about 256 MB
 
     See Also
     --------
@@ -1210,6 +1537,7 @@ class ExternalDriftKriging(IpolBase):
         src_drift=None,
         trg_drift=None,
         remove_missing=False,
+        chunksize=None,
         **kwargs,
     ):
         """ """
@@ -1221,11 +1549,11 @@ class ExternalDriftKriging(IpolBase):
             if len(src) == 0:
                 raise MissingSourcesError
             # plant a tree, use unbalanced tree as default
-            kwargs.update(balanced_tree=kwargs.pop("balanced_tree", False))
-            self.tree = spatial.cKDTree(self.src, **kwargs)
+            self.tree = get_kdtree(self.src, **kwargs)
 
         self.numsources = self.tree.n
         self.remove_missing = remove_missing
+        self.chunksize = chunksize
         self.trg = self._make_coord_arrays(trg)
         self.src_drift = src_drift
         self.trg_drift = trg_drift
@@ -1246,7 +1574,7 @@ class ExternalDriftKriging(IpolBase):
         else:
             self.nnearest = nnearest
         # query tree
-        self.dists, self.ix = self.tree.query(trg, k=self.nnearest)
+        self.dists, self.ix = query_kdtree(self.tree, trg, k=self.nnearest)
         # avoid bug, if there is only one neighbor at all
         if self.dists.ndim == 1:
             self.dists = self.dists[:, np.newaxis]
@@ -1256,52 +1584,50 @@ class ExternalDriftKriging(IpolBase):
         self.weights = []
         self.estimation_variance = []
 
-    def _krig_matrix(self, src, drift):
-        """Sets up the kriging system for a configuration of source points."""
+    def _krig_matrix(self, ix, drift):
+        """Sets up the kriging systems for stacked configurations of source
+        points given by their indices."""
         # the basic covariance matrix
-        var_matrix = self.cov_func(spatial.distance_matrix(src, src))
+        var_matrix = self.cov_func(_distance_matrix(self.src[ix, :]))
         # the extended matrix, initialized to ones
-        edk_matrix = np.ones((len(src) + 2, len(src) + 2))
+        edk_matrix = np.ones((len(ix), ix.shape[1] + 2, ix.shape[1] + 2))
 
         # adding entries for the first lagrange multiplier for the ordinary
         # kriging part
-        edk_matrix[:-2, :-2] = var_matrix
-        edk_matrix[-2, -2] = 0.0
+        edk_matrix[:, :-2, :-2] = var_matrix
+        edk_matrix[:, -2, -2] = 0.0
 
         # adding entries for the second lagrange multiplier for the  edk part
-        edk_matrix[:-2, -1] = drift
-        edk_matrix[-1, :-2] = drift
-        edk_matrix[-2:, -1] = 0.0
-        edk_matrix[-1, -2:] = 0.0
+        edk_matrix[:, :-2, -1] = drift[ix]
+        edk_matrix[:, -1, :-2] = drift[ix]
+        edk_matrix[:, -2:, -1] = 0.0
+        edk_matrix[:, -1, -2:] = 0.0
 
         return edk_matrix
 
     def _krig_rhs(self, dists, drift):
-        """Sets up a right hand side of the kriging system given the distances
-        of the target to the source points. To be used in conjunction with
-        `_krig_matrix`."""
-        rhs = self.cov_func(dists)
-        edk_rhs = np.concatenate([rhs, np.array([1.0, drift])])
+        """Sets up the right hand sides of the kriging systems given the
+        distances of the targets to the source points. To be used in
+        conjunction with `_krig_matrix`."""
+        edk_rhs = np.ones((len(dists), dists.shape[1] + 2))
+        edk_rhs[:, :-2] = self.cov_func(dists)
+        edk_rhs[:, -1] = drift
 
         return edk_rhs
 
     def _krige(self, src_drift, trg_drift):
-        """Sets up the kriging system and solves it in order to obtain the
-        interpolation weights of ordinary kriging.
+        """Sets up the kriging systems and solves them in order to obtain the
+        interpolation weights of external drift kriging.
         Also calculates the kriging estimation variance from the results"""
-        all_weights = []
-        estimation_variances = []
-        for dist, ix, td in zip(self.dists, self.ix, trg_drift):
-            matrix = self._krig_matrix(self.src[ix, :], src_drift[ix])
-            rhs = self._krig_rhs(dist, td)
-            try:
-                weights = np.linalg.solve(matrix, rhs)
-            except np.linalg.LinAlgError:
-                weights = np.repeat(np.nan, len(rhs))
-            all_weights.append(weights)
-            estimation_variances.append(self.cov_func(0.0) - np.sum(weights * rhs))
-
-        return all_weights, estimation_variances
+        return _solve_kriging(
+            self.ix,
+            self.dists,
+            lambda ix: self._krig_matrix(ix, src_drift),
+            lambda dists: self._krig_rhs(dists, trg_drift),
+            self.cov_func(0.0),
+            chunksize=self.chunksize,
+            singular_nan=True,
+        )
 
     def __call__(self, vals, *, src_drift=None, trg_drift=None):
         """
@@ -1370,7 +1696,7 @@ class ExternalDriftKriging(IpolBase):
             wght, variances = self._krige(src_d.squeeze(), trg_d.squeeze())
             self.weights = wght
             self.estimation_variance = variances
-            weights = np.array(self.weights)
+            weights = self.weights
 
             trgvals = v[self.ix]
             if self.remove_missing:
@@ -1390,12 +1716,10 @@ class ExternalDriftKriging(IpolBase):
                     f"({src_d.shape[1]}) and `trg` ({trg_d.shape[1]})."
                 )
             for i in range(v.shape[1]):
-                wght, variances = self._krige(
+                weights, variances = self._krige(
                     src_d[:, i].squeeze(), trg_d[:, i].squeeze()
                 )
 
-                weights = np.array(wght)
-
                 trgvals = v[self.ix, i]
                 if self.remove_missing:
                     isnan = np.isnan(trgvals)
@@ -29,6 +29,7 @@ __all__ = [
     "pulse_volume",
     "beam_block_frac",
     "cum_beam_block_frac",
+    "dem_beam_block_frac",
     "get_bb_ratio",
     "QualMethods",
 ]
@@ -39,7 +40,8 @@ from functools import singledispatch
 import numpy as np
 import xarray as xr
 
-from wradlib.util import XarrayMethods, docstring
+import wradlib
+from wradlib.util import XarrayMethods, docstring, half_power_radius
 
 
 @singledispatch
@@ -196,6 +198,7 @@ def beam_block_frac(th, bh, a):
         return pbb
 
 
+@singledispatch
 def cum_beam_block_frac(pbb):
     """Cumulative beam blockage fraction along a beam.
 
@@ -207,7 +210,7 @@ def cum_beam_block_frac(pbb):
     Parameters
     ----------
     pbb : :class:`numpy:numpy.ndarray`
-        2-D array of floats of shape (num beams, num range bins)
+        Array of floats of shape (..., num beams, num range bins)
         Partial beam blockage fraction of a bin along a beam [m]
 
     Returns
@@ -224,25 +227,147 @@ def cum_beam_block_frac(pbb):
     See :ref:`/notebooks/beamblockage/beamblockage.ipynb`.
 
     """
+    # running maximum along range, NaN bins take the preceding maximum
+    cbb = np.fmax(pbb, 0.0)
+    return np.maximum.accumulate(cbb, axis=-1, out=cbb)
+
 
-    # This is the index of the maximum PBB along each beam
-    maxindex = np.nanargmax(pbb, axis=1)
-    cbb = np.copy(pbb)
+@cum_beam_block_frac.register(xr.DataArray)
+def _cum_beam_block_frac_xarray(obj):
+    """Cumulative beam blockage fraction along a beam.
 
-    # Iterate over all beams
-    for ii, index in enumerate(maxindex):
-        premax = 0.0
-        for jj in range(index):
-            # Only iterate to max index to make this faster
-            if pbb[ii, jj] > premax:
-                cbb[ii, jj] = pbb[ii, jj]
-                premax = pbb[ii, jj]
-            else:
-                cbb[ii, jj] = premax
-        # beyond max index, everything is max anyway
-        cbb[ii, index:] = pbb[ii, index]
+    Computes the cumulative beam blockage (cbb) along a beam from the partial
+    beam blockage (pbb) fraction of each bin along that beam. CBB in one bin
+    along a beam will always be at least as high as the maximum PBB of the
+    preceeding bins.
 
-    return cbb
+    Parameters
+    ----------
+    obj : :py:class:`xarray:xarray.DataArray`
+        Partial beam blockage fraction of a bin along a beam
+
+    Returns
+    -------
+    out : :py:class:`xarray:xarray.DataArray`
+        Cumulative partial beam blockage fraction [unitless]
+
+    Examples
+    --------
+
+    See :ref:`/notebooks/beamblockage/beamblockage.ipynb`.
+
+    """
+    out = xr.apply_ufunc(
+        cum_beam_block_frac,
+        obj,
+        input_core_dims=[["range"]],
+        output_core_dims=[["range"]],
+        dask="parallelized",
+        output_dtypes=[np.result_type(obj.dtype, 0.0)],
+        dask_gufunc_kwargs=dict(allow_rechunk=True),
+    )
+    out.name = "CBB"
+    return out
+
+
+def dem_beam_block_frac(
+    r,
+    az,
+    elev,
+    site,
+    *,
+    dem=None,
+    beamwidth=1.0,
+    re=None,
+    ke=4.0 / 3.0,
+    blocksize=64,
+    **kwargs,
+):
+    """Partial and cumulative beam blockage fraction from a DEM, sweep by \
+    sweep.
+
+    The terrain height is sampled at the bin centroids of blocks of
+    `blocksize` rays. Only the DEM window covering the current block is read,
+    which keeps memory bounded for large ranges and fine range resolution.
+
+    Parameters
+    ----------
+    r : :class:`numpy:numpy.ndarray`
+        Array of ranges [m]
+    az : :class:`numpy:numpy.ndarray`
+        Array of azimuth angles [deg]
+    elev : float or :class:`numpy:numpy.ndarray`
+        elevation angle(s) of the sweep(s) [deg]
+    site : sequence
+        the lon / lat coordinates of the radar location and its altitude
+        a.m.s.l. (in meters)
+
+    Keyword Arguments
+    -----------------
+    dem : :py:class:`gdal:osgeo.gdal.Dataset`
+        Digital elevation model. If None (default), a virtual SRTM mosaic
+        covering the radar footprint is retrieved using
+        :func:`wradlib.io.dem.get_srtm`.
+    beamwidth : float
+        half-power beam width [deg], defaults to 1.0
+    re : float
+        earth's radius [m], defaults to None (calculating from site latitude)
+    ke : float
+        adjustment factor to account for the refractivity gradient that
+        affects radar beam propagation. Defaults to 4/3.
+    blocksize : int
+        number of rays processed at once, defaults to 64
+    kwargs : dict
+        keyword arguments passed to :func:`wradlib.io.dem.get_srtm`
+
+    Yields
+    ------
+    pbb : :class:`numpy:numpy.ndarray`
+        Array of shape (num beams, num range bins) containing the partial beam
+        blockage fraction of the sweep, NaN where no terrain is available
+    cbb : :class:`numpy:numpy.ndarray`
+        Array of shape (num beams, num range bins) containing the cumulative
+        beam blockage fraction of the sweep
+
+    Examples
+    --------
+    >>> for pbb, cbb in dem_beam_block_frac(r, az, [0.5, 1.5], site):  #doctest: +SKIP
+    ...     pass
+
+    See :ref:`/notebooks/beamblockage/beamblockage.ipynb`.
+    """
+    georef = wradlib.georef
+    r = np.asanyarray(r, dtype=np.float64)
+    az = np.asanyarray(az, dtype=np.float64)
+    elev = np.atleast_1d(elev)
+
+    if dem is None:
+        # footprint of lowest sweep, extended by some bins, all gates lie
+        # between the outer ring and the site (e.g. for sector scans)
+        ring = np.full_like(az, r[-1] * 1.01)
+        theta = np.full_like(az, np.min(elev))
+        lonlat = georef.spherical_to_proj(ring, az, theta, site, re=re, ke=ke)
+        lon = np.append(lonlat[..., 0], site[0])
+        lat = np.append(lonlat[..., 1], site[1])
+        extent = [lon.min(), lon.max(), lat.min(), lat.max()]
+        dem = wradlib.io.dem.get_srtm(extent, merge="vrt", **kwargs)
+    crs = georef.read_gdal_projection(dem)
+
+    beamradius = half_power_radius(r, beamwidth)
+
+    for el in elev:
+        pbb = np.empty((len(az), len(r)))
+        for start in range(0, len(az), blocksize):
+            block = slice(start, start + blocksize)
+            # keep (azimuth, range) dims, even if the block has len(r) rays
+            xyz, aeqd = georef.spherical_to_xyz(
+                r, az[block], [el], site, re=re, ke=ke, strict_dims=True
+            )
+            coords = georef.reproject(xyz[0], src_crs=aeqd, trg_crs=crs)
+            terrain = georef.sample_raster_values(dem, coords[..., :2])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pbb[block] = beam_block_frac(terrain, coords[..., 2], beamradius)
+        yield pbb, cum_beam_block_frac(pbb)
 
 
 @singledispatch
@@ -378,6 +503,13 @@ class QualMethods(XarrayMethods):
         else:
             return pulse_volume(self._obj, *args, **kwargs)
 
+    @docstring(_cum_beam_block_frac_xarray)
+    def cum_beam_block_frac(self, *args, **kwargs):
+        if not isinstance(self, QualMethods):
+            return cum_beam_block_frac(self, *args, **kwargs)
+        else:
+            return cum_beam_block_frac(self._obj, *args, **kwargs)
+
     @docstring(_get_bb_ratio_xarray)
     def get_bb_ratio(self, *args, **kwargs):
         if not isinstance(self, QualMethods):
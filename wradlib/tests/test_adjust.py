@@ -7,7 +7,7 @@ from dataclasses import dataclass
 import numpy as np
 import pytest
 
-from wradlib import adjust
+from wradlib import adjust, ipol
 
 
 @pytest.fixture
@@ -259,3 +259,104 @@ def test_best():
     x = 7.5
     y = np.array([0.0, 1.0, 0.0, 1.0, 0.0, 7.7, 8.0, 8.0, 8.0, 8.0])
     assert adjust.best(x, y) == 7.7
+    # NaN are not selected
+    y = np.array([[np.nan, 1.0, 3.0], [np.nan, np.nan, np.nan]])
+    np.testing.assert_equal(adjust.best(np.array([0.0, 1.0]), y), [1.0, np.nan])
+    # cube of (ngauges, nnear, ntime)
+    y = np.stack([y[:1], y[:1] + 2], axis=-1)
+    np.testing.assert_equal(adjust.best(np.array([[2.5, 2.5]]), y), [[3.0, 3.0]])
+    with pytest.raises(ValueError):
+        adjust.best(np.array([2.5, 2.5]), y)
+
+
+@pytest.mark.parametrize("stat", ["median", "mean", "min", "max", "best"])
+@pytest.mark.parametrize("nnear", [1, 4])
+def test_RawAtObs(stat, nnear):
+    rng = np.random.default_rng(42)
+    raw_coords = np.stack(np.meshgrid(np.arange(20.0), np.arange(20.0)), axis=-1)
+    raw_coords = raw_coords.reshape(-1, 2)
+    obs_coords = rng.uniform(0, 19, (30, 2))
+    raw = rng.gamma(1, 2, (400, 5))
+    obs = rng.gamma(1, 2, (30, 5))
+    rawatobs = adjust.RawAtObs(obs_coords, raw_coords, nnear=nnear, stat=stat)
+    res = rawatobs(raw, obs)
+    assert res.shape == (30, 5)
+    ref = np.stack([rawatobs(raw[:, t], obs[:, t]) for t in range(5)], axis=-1)
+    np.testing.assert_allclose(res, ref)
+
+
+@pytest.mark.parametrize(
+    "adjuster",
+    [
+        adjust.AdjustAdd,
+        adjust.AdjustMultiply,
+        adjust.AdjustMixed,
+        adjust.AdjustNone,
+        adjust.GageOnly,
+    ],
+)
+@pytest.mark.parametrize("ipclass", [ipol.Idw, ipol.Nearest])
+def test_xvalidate(adjuster, ipclass):
+    rng = np.random.default_rng(42)
+    raw_coords = np.stack(np.meshgrid(np.arange(20.0), np.arange(20.0)), axis=-1)
+    raw_coords = raw_coords.reshape(-1, 2)
+    obs_coords = rng.uniform(0, 19, (30, 2))
+    raw = rng.gamma(1, 2, (400, 3))
+    obs = rng.gamma(1, 2, (30, 3))
+    obs[rng.random(obs.shape) < 0.2] = np.nan
+    kwargs = dict(nnear_raws=4, mingages=5, ipclass=ipclass)
+    adj = adjuster(obs_coords, raw_coords, **kwargs)
+    res_obs, res = adj.xvalidate(obs, raw)
+    assert res_obs is obs
+    assert res.shape == obs.shape
+    # leave-one-out loop over valid gages
+    adj = adjuster(obs_coords, raw_coords, **kwargs)
+    adj._elementwise = False
+    for t in range(obs.shape[1]):
+        _, ref = adj.xvalidate(obs[:, t], raw[:, t])
+        np.testing.assert_allclose(res[:, t], ref)
+
+
+@pytest.mark.parametrize(
+    "adjuster",
+    [
+        adjust.AdjustAdd,
+        adjust.AdjustMultiply,
+        adjust.AdjustMixed,
+        adjust.AdjustMFB,
+        adjust.AdjustNone,
+        adjust.GageOnly,
+    ],
+)
+@pytest.mark.parametrize("stat", ["median", "best"])
+def test_batch(adjuster, stat):
+    rng = np.random.default_rng(42)
+    raw_coords = np.stack(np.meshgrid(np.arange(20.0), np.arange(20.0)), axis=-1)
+    raw_coords = raw_coords.reshape(-1, 2)
+    obs_coords = rng.uniform(0, 19, (30, 2))
+    raw = rng.gamma(1, 2, (400, 12))
+    obs = rng.gamma(1, 2, (30, 12))
+    obs[rng.integers(0, 3, 12), np.arange(12)] = np.nan
+    adj = adjuster(obs_coords, raw_coords, nnear_raws=4, mingages=5, stat=stat)
+    res = adj.batch(obs, raw)
+    assert res.shape == raw.shape
+    ref = np.stack([adj(obs[:, t], raw[:, t]) for t in range(12)], axis=-1)
+    np.testing.assert_allclose(res, ref)
+
+    with pytest.raises(ValueError):
+        adj.batch(obs[:, 0], raw[:, 0])
+
+
+def test_call_keeps_no_interpolators():
+    rng = np.random.default_rng(42)
+    raw_coords = np.stack(np.meshgrid(np.arange(20.0), np.arange(20.0)), axis=-1)
+    raw_coords = raw_coords.reshape(-1, 2)
+    obs_coords = rng.uniform(0, 19, (30, 2))
+    adj = adjust.AdjustAdd(obs_coords, raw_coords, nnear_raws=4, mingages=5)
+    for t in range(5):
+        obs = rng.gamma(1, 2, 30)
+        obs[t] = np.nan
+        adj(obs, rng.gamma(1, 2, 400))
+    ips = [v for v in vars(adj).values() if isinstance(v, ipol.IpolBase)]
+    assert ips == [adj.ip]
+    assert not adj._loo_ips
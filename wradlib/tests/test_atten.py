@@ -87,6 +87,85 @@ def test__sector_filter_2():
     np.testing.assert_equal(result, ref)
 
 
+def test__sector_filter_stack():
+    """test sector filter on stack of sweeps against single rows"""
+    rng = np.random.default_rng(42)
+    mask = rng.random((3, 4, 60)) < 0.7
+    result = atten._sector_filter(mask, 4)
+    assert result.dtype == bool
+    for i in range(mask.shape[0]):
+        for j in range(mask.shape[1]):
+            np.testing.assert_equal(
+                result[i, j], atten._sector_filter(mask[i, j][None], 4)[0]
+            )
+
+
+def test__iterate_attenuation_constrained():
+    """batched candidates give identical results to one by one"""
+    rng = np.random.default_rng(42)
+    gateset = rng.uniform(0, 20, (2, 36, 50))
+    gateset[:, 5:20, 10:20] += 35
+    gateset[:, 30:32, 10:20] += 35
+    a_cand = np.tile(np.linspace(1.67e-4, 2.33e-5, 10), 3)
+    b_cand = np.repeat([0.7, 0.69, 0.68], 10)
+    kwargs = dict(
+        constraints=[atten.constraint_dbz, atten.constraint_pia],
+        constraint_args=[[59.0], [10.0]],
+        sector_thr=3,
+    )
+    results = []
+    for chunksize in [1, 2**22]:
+        pia = np.zeros_like(gateset)
+        a_used = np.empty(gateset.shape[:-1])
+        b_used = np.empty(gateset.shape[:-1])
+        small_sectors = atten._iterate_attenuation_constrained(
+            gateset,
+            pia,
+            a_used,
+            b_used,
+            a_cand,
+            b_cand,
+            chunksize=chunksize,
+            **kwargs,
+        )
+        results.append((pia, a_used, b_used, small_sectors))
+    for res0, res1 in zip(*results):
+        np.testing.assert_array_equal(res0, res1)
+    pia, a_used, b_used, small_sectors = results[0]
+    assert np.any(small_sectors)
+    assert np.any(a_used < 1.67e-4)
+    np.testing.assert_allclose(
+        pia[0, 0], atten.calc_attenuation_forward(gateset[0, 0], a=a_used[0, 0])
+    )
+
+
+def test__interp_atten():
+    """test interpolation of small sectors across the seam"""
+    pia = np.zeros((2, 8, 3))
+    pia[..., -1] = np.arange(16).reshape(2, 8)
+    invalid = np.zeros((2, 8), dtype=bool)
+    invalid[0, [0, 7]] = True
+    invalid[1, 3:5] = True
+    atten._interp_atten(pia, invalid)
+    np.testing.assert_allclose(pia[0, [0, 7], -1], [8.0 / 3, 13.0 / 3])
+    np.testing.assert_allclose(pia[1, 3:5, -1], [11.0, 12.0])
+    np.testing.assert_equal(pia[..., :-1], 0.0)
+    with pytest.raises(ValueError, match="without valid beams"):
+        atten._interp_atten(pia, np.ones((2, 8), dtype=bool))
+
+
+def test_bisect_reference_attenuation_unfinished(att_data):
+    """beams which can't be compared to the reference are finished"""
+    pia_ref = np.array([[np.nan, 0.01], [0.1, 0.2]])
+    pia, amid, b = atten.bisect_reference_attenuation(att_data.gateset, pia_ref=pia_ref)
+    assert amid[0, 0] == (1.67e-4 + 2.33e-5) / 2
+    _, amid1, b1 = atten.bisect_reference_attenuation(
+        att_data.gateset[1:], pia_ref=pia_ref[1:]
+    )
+    np.testing.assert_array_equal(amid[1:], amid1)
+    np.testing.assert_array_equal(b[1:], b1)
+
+
 def test_correct_attenuation_hb():
     filestr = "dx/raa00-dx_10908-0806021655-fbg---bin.gz"
     filename = get_wradlib_data_file(filestr)
@@ -98,6 +177,29 @@ def test_correct_attenuation_hb():
         atten.correct_attenuation_hb(gateset, mode="except")
 
 
+def test_correct_attenuation_hb_modes(att_data):
+    gateset = att_data.gateset.astype(float)
+    coefficients = {"a": 2e-4, "b": 0.7, "gate_length": 1.0}
+    pia = atten.correct_attenuation_hb(
+        gateset, coefficients=coefficients, mode="warn", thrs=100.0
+    )
+    np.testing.assert_allclose(pia, att_data.gateset_result)
+
+    overflow = (gateset + att_data.gateset_result) > 30.0
+    overflow[..., 0] = False
+    pia = atten.correct_attenuation_hb(
+        gateset, coefficients=coefficients, mode="nan", thrs=30.0
+    )
+    np.testing.assert_equal(np.isnan(pia), overflow)
+    np.testing.assert_allclose(pia[~overflow], att_data.gateset_result[~overflow])
+    pia = atten.correct_attenuation_hb(
+        gateset, coefficients=coefficients, mode="zero", thrs=30.0
+    )
+    np.testing.assert_equal(pia[overflow], 0.0)
+    with pytest.raises(atten.AttenuationOverflowError):
+        atten.correct_attenuation_hb(gateset, coefficients=coefficients, thrs=30.0)
+
+
 def test_correct_attenuation_constrained():
     filestr = "dx/raa00-dx_10908-0806021655-fbg---bin.gz"
     filename = get_wradlib_data_file(filestr)
@@ -11,11 +11,50 @@ import xarray as xr
 
 from wradlib import classify, georef, io, ipol
 
-from . import get_wradlib_data_file, requires_gdal, requires_h5py, requires_netcdf
+from . import (
+    get_wradlib_data_file,
+    requires_dask,
+    requires_gdal,
+    requires_h5py,
+    requires_netcdf,
+)
+
+
+@pytest.mark.parametrize("wsize", [3, 4, 5])
+@pytest.mark.parametrize("radial", [False, True])
+def test_filter_gabella_a(wsize, radial):
+    rng = np.random.default_rng(42)
+    img = rng.uniform(0, 20, (3, 36, 20))
+    img[0, 5:8, 6:9] = np.nan
+    res = classify.filter_gabella_a(img, wsize, 6.0, radial=radial)
+    assert res.shape == img.shape
+    # count of neighbours by rolling each image
+    nn = wsize // 2
+    for i in range(len(img)):
+        count = -np.ones(img[i].shape, dtype=int)
+        for sa in [0] if radial else range(-nn, nn + 1):
+            for sr in range(-nn, nn + 1):
+                ref = np.roll(img[i], (sa, sr), axis=(0, 1))
+                count += (img[i] - ref) < 6.0
+        count[:, 0:nn] = wsize**2
+        count[:, -nn:] = wsize**2
+        np.testing.assert_array_equal(res[i], count)
+        np.testing.assert_array_equal(
+            classify.filter_gabella_a(img[i], wsize, 6.0, radial=radial), count
+        )
 
 
-def test_filter_gabella_a():
-    pass
+def test_filter_gabella_b():
+    img = np.zeros((2, 10, 12))
+    img[0, 2:6, 2:6] = 10
+    img[1, 0, 0] = 10
+    img[1, 5:8, 3:6] = 10
+    res = classify.filter_gabella_b(img)
+    for i in range(len(img)):
+        np.testing.assert_array_equal(res[i], classify.filter_gabella_b(img[i]))
+    np.testing.assert_allclose(res[0, 3, 3], 16 / 12)
+    np.testing.assert_allclose(res[1, 0, 0], 1.0)
+    np.testing.assert_allclose(res[1, 6, 4], 9 / 8)
 
 
 def test_filter_window_distance():
@@ -49,6 +88,80 @@ def test_histo_cut():
     classify.histo_cut(yearsum)
 
 
+def _histo_cut_data(skewed=False):
+    rng = np.random.default_rng(42)
+    if skewed:
+        acc = rng.lognormal(6, 1, (100, 120))
+        acc[rng.random(acc.shape) < 0.01] *= 50
+        return acc
+    acc = np.abs(rng.normal(800, 100, (300, 200)))
+    acc[rng.random(acc.shape) < 0.01] *= 5
+    acc[100:150, 50:80] *= 0.2
+    return acc
+
+
+def test_histo_cut_sorted():
+    acc = _histo_cut_data()
+    # reference with full histograms in each iteration
+    lower, upper = 0, acc.max()
+    lower_before = upper_before = -51
+    while abs(lower - lower_before) > 1 or abs(upper - upper_before) > 1:
+        valid = acc[(acc >= lower) & (acc <= upper)]
+        n, bins = np.histogram(valid, bins=50)
+        index = np.argmax(n)
+        if abs(lower - lower_before) > 1:
+            for i in range(index, -1, -1):
+                if n[i] < (n[index] * 0.01):
+                    break
+        if abs(upper - upper_before) > 1:
+            for j in range(index, len(n)):
+                if n[j] < (n[index] * 0.01):
+                    break
+        lower_before, upper_before = lower, upper
+        lower, upper = bins[i], bins[j + 1]
+    res = classify.histo_cut(acc)
+    assert res.dtype == np.uint8
+    np.testing.assert_array_equal(res == 1, acc > upper)
+    np.testing.assert_array_equal(res == 2, acc < lower)
+    assert np.mean(res[100:150, 50:80] == 2) > 0.95
+
+
+@pytest.mark.parametrize("skewed", [False, True])
+@pytest.mark.parametrize("fine_bins", [2**16, 16])
+def test_histo_cut_chunked(tmp_path, skewed, fine_bins):
+    acc = _histo_cut_data(skewed)
+    ref = classify.histo_cut(acc)
+    # same as exact result
+    res = classify.histo_cut(acc, fine_bins=fine_bins, chunksize=1000)
+    np.testing.assert_array_equal(res, ref)
+    acc = acc.astype(np.float32)
+    np.testing.assert_array_equal(
+        classify.histo_cut(acc, fine_bins=fine_bins), classify.histo_cut(acc)
+    )
+    filename = tmp_path / "acc.npy"
+    np.save(filename, acc)
+    acc = np.load(filename, mmap_mode="r")
+    np.testing.assert_array_equal(
+        classify.histo_cut(acc, chunksize=1000), classify.histo_cut(np.array(acc))
+    )
+
+
+@requires_dask
+@pytest.mark.parametrize("skewed", [False, True])
+def test_histo_cut_dask(skewed):
+    import dask.array as da
+
+    acc = _histo_cut_data(skewed)
+    ref = classify.histo_cut(acc)
+    res = classify.histo_cut(da.from_array(acc, chunks=100))
+    assert isinstance(res, da.Array)
+    np.testing.assert_array_equal(res.compute(), ref)
+    acc = xr.DataArray(da.from_array(acc, chunks=100), dims=["azimuth", "range"])
+    res = classify.histo_cut(acc)
+    assert isinstance(res.data, da.Array)
+    np.testing.assert_array_equal(res.values, ref)
+
+
 @pytest.fixture()
 def fuzzy_data():
     rhofile = get_wradlib_data_file("netcdf/TAG-20120801" "-140046-02-R.nc")
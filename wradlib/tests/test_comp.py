@@ -67,6 +67,52 @@ def test_togrid(comp_data):
     )
 
 
+@pytest.mark.parametrize(
+    "interpol, kwargs, call_kwargs",
+    [
+        (ipol.Nearest, {}, {}),
+        (ipol.Nearest, {}, dict(maxdist=2.0)),
+        (ipol.Nearest, dict(remove_missing=2), {}),
+        (ipol.Idw, dict(nnearest=6), dict(maxdist=5.0)),
+        (ipol.Linear, {}, {}),
+    ],
+)
+def test_GriddingPlan(interpol, kwargs, call_kwargs):
+    rng = np.random.default_rng(42)
+    src = rng.uniform(-100, 100, (2000, 2))
+    trg = np.stack(
+        np.meshgrid(np.linspace(-120, 120, 50), np.linspace(-120, 120, 50)), axis=-1
+    ).reshape(-1, 2)
+    center = np.array([0.0, 0.0])
+    data = rng.normal(size=len(src))
+    data[::20] = np.nan
+
+    plan = comp.GriddingPlan(
+        src, trg, 100.0, center, interpol, call_kwargs=call_kwargs, **kwargs
+    )
+    ip = interpol(src, trg[plan.ix], **kwargs)
+    res = np.full(len(trg), np.nan)
+    res[plan.ix] = ip(data, **call_kwargs)
+
+    out = plan(data)
+    assert out.shape == (len(trg),)
+    np.testing.assert_array_equal(out, res)
+    np.testing.assert_array_equal(
+        comp.togrid(
+            src, trg, 100.0, center, data, interpol, call_kwargs=call_kwargs, **kwargs
+        ),
+        res,
+    )
+    # stack of sweeps
+    stack = plan(np.stack([data, data * 2], axis=-1))
+    assert stack.shape == (len(trg), 2)
+    np.testing.assert_array_equal(stack[:, 0], res)
+    np.testing.assert_allclose(stack[:, 1], res * 2)
+
+    with pytest.raises(ValueError, match="does not correspond"):
+        plan(data[:-1])
+
+
 def test_compose():
     g1 = np.array(
         [
@@ -249,3 +295,40 @@ def test_compose():
     )
     np.testing.assert_allclose(composite, res)
     np.testing.assert_allclose(composite1, res1)
+
+
+@pytest.mark.parametrize("method", ["ko", "weighted"])
+def test_CompositeAccumulator(method):
+    rng = np.random.default_rng(42)
+    shape = (20, 30)
+    radargrids = [
+        np.where(rng.random(shape) < 0.3, np.nan, rng.normal(size=shape))
+        for _ in range(3)
+    ]
+    qualitygrids = [
+        np.where(rng.random(shape) < 0.3, np.nan, rng.random(shape)) for _ in range(3)
+    ]
+    compose = dict(ko=comp.compose_ko, weighted=comp.compose_weighted)[method]
+    res = compose(radargrids, qualitygrids)
+    # input lists are left untouched
+    assert len(radargrids) == 3
+    assert len(qualitygrids) == 3
+
+    acc = comp.CompositeAccumulator(shape, method=method)
+    assert acc.value.dtype == np.float32
+    for radargrid, qualitygrid in zip(radargrids, qualitygrids):
+        acc.add(radargrid, qualitygrid)
+    np.testing.assert_allclose(acc.result(), res, rtol=1e-5, atol=1e-6)
+
+    # sub-tiles
+    acc = comp.CompositeAccumulator(shape, method=method, dtype=np.float64)
+    ix = rng.permutation(shape[0])
+    for radargrid, qualitygrid in zip(radargrids, qualitygrids):
+        for tile in [np.s_[:10], np.s_[10:]]:
+            acc.add(radargrid[ix[tile]], qualitygrid[ix[tile]], index=ix[tile])
+    np.testing.assert_allclose(acc.result(), res)
+
+
+def test_CompositeAccumulator_errors():
+    with pytest.raises(ValueError, match="unknown compositing method"):
+        comp.CompositeAccumulator((10, 10), method="max")
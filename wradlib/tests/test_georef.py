@@ -676,6 +676,39 @@ def test_reproject_area_of_interest():
     assert pytest.approx(pcoords3[0, 1]) == 53.0014816583828
 
 
+@requires_gdal
+def test_reproject_transformer_cache():
+    from wradlib.georef import projection
+
+    proj_gk = osr.SpatialReference()
+    proj_gk.ImportFromEPSG(31466)
+    proj_wgs84 = osr.SpatialReference()
+    proj_wgs84.ImportFromEPSG(4326)
+    lon = np.linspace(6.0, 9.0, 12).reshape(3, 4)
+    lat = np.linspace(50.0, 55.0, 12).reshape(3, 4)
+
+    projection._get_transformer.cache_clear()
+    x, y = georef.reproject(lon, lat, src_crs=proj_wgs84, trg_crs=proj_gk)
+    assert projection._get_transformer.cache_info().misses == 1
+    xy = georef.reproject(
+        np.stack([lon, lat], axis=-1), src_crs=proj_wgs84, trg_crs=proj_gk
+    )
+    assert projection._get_transformer.cache_info().hits == 1
+    assert xy.shape == (3, 4, 2)
+    np.testing.assert_allclose(xy[..., 0], x)
+    np.testing.assert_allclose(xy[..., 1], y)
+
+    # area of interest is part of the key
+    georef.reproject(
+        lon,
+        lat,
+        src_crs=proj_wgs84,
+        trg_crs=proj_gk,
+        area_of_interest=(6.0, 50.0, 10.0, 60.0),
+    )
+    assert projection._get_transformer.cache_info().misses == 2
+
+
 @requires_gdal
 def test_reproject_errors():
     x = 10
@@ -825,6 +858,33 @@ def test_read_gdal_values(gdal_data):
     georef.read_gdal_values(gdal_data.ds, nodata=9999.0)
 
 
+def test_map_to_pixel():
+    geotransform = [5.0, 0.01, 0.0, 52.0, 0.0, -0.01]
+    pixel = np.random.default_rng(42).uniform(0, 100, (10, 7, 2))
+    coords = georef.raster._pixel_to_map(pixel, geotransform)
+    np.testing.assert_allclose(georef.raster._map_to_pixel(coords, geotransform), pixel)
+
+
+@requires_gdal
+def test_sample_raster_values():
+    data = np.arange(20 * 30, dtype=np.float32).reshape(20, 30)
+    data[5, 5] = -32768
+    x, y = np.meshgrid(np.linspace(5.0, 8.0, 31), np.linspace(52.0, 50.0, 21))
+    edges = np.stack([x, y], axis=-1)
+    ds = georef.create_raster_dataset(
+        data, edges, crs=georef.epsg_to_osr(4326), nodata=-32768
+    )
+    centers = georef.read_gdal_coordinates(ds)
+    values = georef.sample_raster_values(ds, centers)
+    res = data.astype(np.float64)
+    res[5, 5] = np.nan
+    np.testing.assert_array_equal(values, res)
+    # only a window is needed for a subset, outside is nodata
+    coords = np.array([[5.55, 51.45], [4.9, 51.0], [7.0, 49.9], [6.51, 51.01]])
+    values = georef.sample_raster_values(ds, coords, nodata=-1.0)
+    np.testing.assert_array_equal(values, [-1.0, -1.0, -1.0, data[9, 15]])
+
+
 @requires_gdal
 def test_reproject_raster_dataset(gdal_data):
     georef.reproject_raster_dataset(
@@ -1621,3 +1681,74 @@ def test_georeference_dataset(xr_data):
     src_da.drop_vars(["x", "y", "z", "gr", "rays", "bins"])
     da = georef.georeference(src_da)
     xr.testing.assert_equal(xr_data, da)
+
+
+def test_georeference_cache():
+    func = georef.create_xarray_dataarray
+    kwargs = dict(
+        r=np.arange(0.0, 100000.0, 100.0),
+        phi=np.arange(0.0, 360.0),
+        theta=np.ones(360) * 1.0,
+        site=(9.0, 48.0, 100.0),
+        sweep_mode="azimuth_surveillance",
+    )
+    re = 6370040.0
+    da1 = georef.georeference(func(np.random.rand(360, 1000), **kwargs), re=re)
+    da2 = georef.georeference(func(np.random.rand(360, 1000), **kwargs), re=re)
+    da3 = georef.georeference(
+        func(np.random.rand(360, 1000), **kwargs), re=re, cache=False
+    )
+    for coord in ["x", "y", "z", "gr", "rays", "bins"]:
+        assert not da1[coord].values.flags.writeable
+        assert np.shares_memory(da1[coord].values, da2[coord].values)
+        assert not np.shares_memory(da1[coord].values, da3[coord].values)
+        np.testing.assert_array_equal(da1[coord].values, da3[coord].values)
+    xr.testing.assert_identical(da1.coords.to_dataset(), da3.coords.to_dataset())
+    # other geometry is not taken from cache
+    da4 = georef.georeference(func(np.random.rand(360, 1000), **kwargs), re=re, ke=1.0)
+    assert not np.shares_memory(da1.z.values, da4.z.values)
+    assert np.all(da4.z.values >= da1.z.values)
+
+
+def test_maximum_intensity_projection_stack():
+    rng = np.random.default_rng(42)
+    data = rng.uniform(0, 50, (3, 90, 50))
+    data[rng.random(data.shape) < 0.05] = np.nan
+    r = np.arange(50, dtype=np.float64) * 1000
+    az = np.arange(90, dtype=np.float64) * 4
+    elev = np.array([0.5, 1.5, 5.0])
+    xs, ys, mip = georef.maximum_intensity_projection(
+        data, r=r, az=az, angle=45.0, elev=elev
+    )
+    assert xs.shape == (3, 51, 101)
+    assert ys.shape == (3, 51, 101)
+    assert mip.shape == (3, 50, 100)
+    assert np.nanmax(mip) <= np.nanmax(data)
+    for i in range(3):
+        res = georef.maximum_intensity_projection(
+            data[i], r=r, az=az, angle=45.0, elev=elev[i]
+        )
+        np.testing.assert_array_equal(res[0], xs[i])
+        np.testing.assert_array_equal(res[1], ys[i])
+        np.testing.assert_array_equal(res[2], mip[i])
+
+
+def test_maximum_intensity_projection_autoext():
+    # r and az are bin bounds, data of the last bounds is cropped
+    r = np.array([0.0, 1000.0, 2000.0])
+    az = np.array([0.0, 90.0, 180.0, 270.0, 360.0])
+    data = np.arange(1.0, 9.0).reshape(4, 2)
+    xs, ys, mip = georef.maximum_intensity_projection(
+        data, r=r, az=az, angle=0.0, elev=0.0, autoext=False
+    )
+    assert xs.shape == ys.shape == (3, 7)
+    # 0 and 180 deg at center column, 90 deg east, 270 deg west
+    res = np.full((3, 6), np.nan)
+    res[0, 2] = 7.0
+    res[1, [1, 2, 4]] = [8.0, 6.0, 4.0]
+    np.testing.assert_array_equal(mip, res)
+    padded = np.pad(data, ((0, 1), (0, 1)), constant_values=100.0)
+    res2 = georef.maximum_intensity_projection(
+        padded, r=r, az=az, angle=0.0, elev=0.0, autoext=False
+    )
+    np.testing.assert_array_equal(res2[2], mip)
@@ -100,8 +100,33 @@ def test_parse_old_dx_header():
     io.radolan.parse_dx_header(head)
 
 
+def create_dx_product(nbeams=360, *, seed=42):
+    rng = np.random.default_rng(seed)
+    words = []
+    for i in range(nbeams):
+        # beam start, azimuth, elevation
+        words += [2**13, i * 10, 5]
+        nbin = 0
+        while nbin < 128:
+            if rng.random() < 0.2:
+                nzeros = min(int(rng.integers(1, 20)), 128 - nbin)
+                words.append(4096 | nzeros)
+                nbin += nzeros
+            else:
+                words.append(int(rng.integers(0, 4096)) | int(rng.integers(0, 2)) << 15)
+                nbin += 1
+    raw = np.array(words, dtype=np.uint16).tobytes()
+    header = "DX021655109080608BY{:7d}VS 2CO0CD2CS0EP0.30.30.40.50.50.40.40.4MS  0"
+    size = len(header.format(0)) + 1 + len(raw)
+    return (header.format(size) + "\x03").encode() + raw
+
+
 def test_unpack_dx():
-    pass
+    raw = np.array([1, 4096 | 3, 2, 4096 | 123], dtype=np.uint16)
+    beam = io.radolan.unpack_dx(raw)
+    assert beam.shape == (128,)
+    np.testing.assert_array_equal(beam[:6], [1, 0, 0, 0, 2, 0])
+    assert np.all(beam[5:] == 0)
 
 
 def test_read_dx(file_or_filelike):
@@ -110,6 +135,47 @@ def test_read_dx(file_or_filelike):
         data, attrs = io.radolan.read_dx(dxfile)
 
 
+def test_read_dx_synthetic():
+    dx = create_dx_product()
+    data, attrs = io.radolan.read_dx(sio.BytesIO(dx))
+    assert data.shape == (360, 128)
+    np.testing.assert_array_equal(attrs["azim"], np.arange(360))
+    np.testing.assert_array_equal(attrs["elev"], np.full(360, 0.5))
+
+    # compare with beam-wise unpacking
+    raw = np.frombuffer(dx[dx.index(b"\x03") + 1 :], dtype=np.uint16)
+    newazimuths = np.append(np.where(raw == 2**13)[0], len(raw))
+    beams = np.array(
+        [
+            io.radolan.unpack_dx(raw[newazimuths[i] + 3 : newazimuths[i + 1]])
+            for i in range(360)
+        ]
+    )
+    np.testing.assert_array_equal(data, (beams & 8191) * 0.5 - 32.5)
+    np.testing.assert_array_equal(attrs["clutter"], (beams & 2**15) != 0)
+
+
+def test_read_dx_stack():
+    dxfiles = [sio.BytesIO(create_dx_product(seed=seed)) for seed in range(3)]
+    data, attrs = io.radolan.read_dx_stack(dxfiles)
+    assert data.shape == (3, 360, 128)
+    assert len(attrs) == 3
+    for seed in range(3):
+        dx_data, dx_attrs = io.radolan.read_dx(
+            sio.BytesIO(create_dx_product(seed=seed))
+        )
+        np.testing.assert_array_equal(data[seed], dx_data)
+        np.testing.assert_array_equal(attrs[seed]["clutter"], dx_attrs["clutter"])
+        np.testing.assert_array_equal(attrs[seed]["azim"], dx_attrs["azim"])
+
+    dxfiles = [
+        sio.BytesIO(create_dx_product()),
+        sio.BytesIO(create_dx_product(nbeams=361)),
+    ]
+    with pytest.raises(ValueError, match="DX shape mismatch"):
+        io.radolan.read_dx_stack(dxfiles)
+
+
 def test_write_polygon_to_text():
     poly1 = [
         [0.0, 0.0, 0.0, 0.0],
@@ -610,6 +676,30 @@ def test_decode_radolan_runlength_array():
     assert arr.shape == (460, 460)
 
 
+def test_decode_radolan_runlength_array_linewise():
+    # offset continuation (255), empty line and trailing nodata
+    lines = [
+        b"\x01\x10\xf1\x32\x10\n",
+        b"\x02\n",
+        b"\x03\xff\x10\x23\n",
+        b"\x04\x12\xf9\xf9\n",
+    ]
+    binarr = b"".join(lines) + b"\x04"
+    attrs = {"ncol": 300, "nrow": 4, "nodataflag": 255}
+    arr = io.radolan.decode_radolan_runlength_array(binarr, attrs)
+    assert arr.shape == (4, 300)
+    assert arr.dtype == np.uint8
+    for i, line in enumerate(lines):
+        line = np.frombuffer(line, np.uint8)
+        dline = io.radolan.decode_radolan_runlength_line(line, attrs)
+        np.testing.assert_array_equal(arr[3 - i], dline)
+
+    attrs.update(nrow=2, maxheight=2)
+    arr = io.radolan.decode_radolan_runlength_array(binarr, attrs)
+    assert arr.shape == (2, 2, 300)
+    np.testing.assert_array_equal(arr[1, 1, 239:241], [3, 3])
+
+
 def test_read_radolan_binary_array():
     filename = "radolan/misc/raa01-rw_10000-1408030950-dwd---bin.gz"
     rw_file = get_wradlib_data_file(filename)
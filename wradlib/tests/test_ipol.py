@@ -127,6 +127,31 @@ def test_cov_cau():
     )
 
 
+def test_get_kdtree():
+    rng = np.random.default_rng(42)
+    src = rng.uniform(0, 10, (100, 2))
+    tree = ipol.get_kdtree(src)
+    assert ipol.get_kdtree(src.copy()) is tree
+    assert ipol.get_kdtree(src, balanced_tree=True) is not tree
+    assert ipol.get_kdtree(src + 1) is not tree
+    # interpolators share the tree
+    trg = rng.uniform(0, 10, (10, 2))
+    assert ipol.Nearest(src, trg).tree is ipol.Idw(src, trg).tree
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test_query_kdtree(k):
+    rng = np.random.default_rng(42)
+    src = rng.uniform(0, 10, (100, 2))
+    trg = rng.uniform(0, 10, (55, 2)).astype(np.float32)
+    tree = ipol.get_kdtree(src)
+    dists, ix = tree.query(trg.astype(np.float64), k=k)
+    for chunksize in [10, 100]:
+        res = ipol.query_kdtree(tree, trg, k=k, chunksize=chunksize)
+        np.testing.assert_equal(res[0], dists)
+        np.testing.assert_equal(res[1], ix)
+
+
 def test_Nearest_1(ipol_data):
     """testing the basic behaviour of the Idw class"""
     ip = ipol.Nearest(ipol_data.src, ipol_data.trg)
@@ -155,6 +180,40 @@ def test_Idw_1(ipol_data):
     assert np.allclose(res, np.array([3.0, 2.0, 2.8, 1.0]))
 
 
+@pytest.mark.parametrize("maxdist", [None, 2.0])
+@pytest.mark.parametrize("remove_missing", [False, True])
+def test_Idw_sparse(remove_missing, maxdist):
+    """testing sparse weight matrix of the Idw class"""
+    rng = np.random.default_rng(42)
+    src = rng.uniform(0, 10, (100, 2))
+    trg = rng.uniform(0, 10, (150, 2))
+    trg[:3] = src[:3]
+    vals = rng.normal(size=(100, 4, 2))
+    vals[rng.random(vals.shape) < 0.2] = np.nan
+    kwargs = dict(nnearest=5, remove_missing=remove_missing)
+    ref = ipol.Idw(src, trg, **kwargs)(vals, maxdist=maxdist)
+    ip = ipol.Idw(src, trg, sparse=True, **kwargs)
+    res = ip(vals, maxdist=maxdist)
+    assert res.shape == (150, 4, 2)
+    np.testing.assert_allclose(res, np.ma.filled(ref, np.nan))
+    # flat input
+    np.testing.assert_allclose(
+        ip(vals[:, 0, 0], maxdist=maxdist), res[:, 0, 0], equal_nan=True
+    )
+
+
+def test_Nearest_remove_missing():
+    """testing the NaN fallback of the Nearest class"""
+    src = np.arange(5.0)[:, np.newaxis]
+    trg = np.array([[0.1], [2.2], [3.9]])
+    vals = np.array([[np.nan, 1.0], [1.0, np.nan], [2.0, np.nan], [3.0, 3.0], [4, 4]])
+    ip = ipol.Nearest(src, trg, remove_missing=2)
+    res = ip(vals)
+    np.testing.assert_equal(res, np.array([[1.0, 1.0], [2.0, 3.0], [4.0, 4.0]]))
+    res = ip(vals, maxdist=0.5)
+    np.testing.assert_equal(res, np.array([[np.nan, 1.0], [2.0, np.nan], [4, 4]]))
+
+
 def test_Linear_1(ipol_data):
     """testing the basic behaviour of the Linear class"""
     ip = ipol.Linear(ipol_data.src_lin, ipol_data.trg_lin)
@@ -169,6 +228,34 @@ def test_Linear_1(ipol_data):
     assert np.allclose(res, np.array([3.0, 2.0, 2.5, 1.0]))
 
 
+def test_Linear_remove_missing():
+    """testing cached triangulations of the Linear class"""
+    from scipy.interpolate import LinearNDInterpolator
+
+    rng = np.random.default_rng(42)
+    src = rng.uniform(0, 10, (200, 2))
+    trg = rng.uniform(-1, 11, (500, 2))
+    vals = rng.normal(size=(200, 3))
+    vals[::7, 1] = np.nan
+    vals[::5, 2] = np.nan
+    ip = ipol.Linear(src, trg, remove_missing=True)
+    res = ip(vals, fill_value=-1.0)
+    assert res.shape == (500, 3)
+    for i in range(3):
+        valid = ~np.isnan(vals[:, i])
+        ref = LinearNDInterpolator(src[valid], vals[valid, i], fill_value=-1.0)
+        np.testing.assert_allclose(res[:, i], ref(trg))
+    assert len(ip._cache) == 2
+    # cached triangulation is reused
+    np.testing.assert_allclose(ip(vals[:, 1], fill_value=-1.0), res[:, 1])
+    assert len(ip._cache) == 2
+
+    # without remove_missing NaN propagates
+    ip = ipol.Linear(src, trg)
+    ref = LinearNDInterpolator(src, vals[:, 1])
+    np.testing.assert_allclose(ip(vals[:, 1]), ref(trg))
+
+
 def test_OrdinaryKriging_1(ipol_data):
     """testing the basic behaviour of the OrdinaryKriging class"""
 
@@ -257,6 +344,56 @@ def test_ExternalDriftKriging_3(ipol_data):
         ip(ipol_data.vals)
 
 
+def test_OrdinaryKriging_chunksize():
+    rng = np.random.default_rng(42)
+    src = rng.uniform(0, 10, (20, 2))
+    trg = rng.uniform(0, 10, (50, 2))
+    vals = rng.normal(size=(20, 2))
+    ip = ipol.OrdinaryKriging(src, trg, "1.0 Exp(5.0)", nnearest=6)
+    ip2 = ipol.OrdinaryKriging(src, trg, "1.0 Exp(5.0)", nnearest=6, chunksize=7)
+    assert ip.weights.shape == (50, 7)
+    assert ip.estimation_variance.shape == (50,)
+    np.testing.assert_allclose(ip.weights, ip2.weights)
+    np.testing.assert_allclose(ip(vals), ip2(vals))
+
+    # compare with single kriging system
+    ix, dists = ip.ix[3], ip.dists[3]
+    matrix = np.ones((7, 7))
+    matrix[:-1, :-1] = ip.cov_func(
+        np.linalg.norm(src[ix, None] - src[None, ix], axis=-1)
+    )
+    matrix[-1, -1] = 0.0
+    rhs = np.concatenate([ip.cov_func(dists), [1.0]])
+    weights = np.linalg.solve(matrix, rhs)
+    np.testing.assert_allclose(ip.weights[3], weights)
+    np.testing.assert_allclose(
+        ip.estimation_variance[3], ip.cov_func(0.0) - np.sum(weights * rhs)
+    )
+
+    # singular kriging systems
+    src = np.array([[0.0, 0.0], [0.0, 0.0], [4.0, 0.0]])
+    with pytest.raises(np.linalg.LinAlgError):
+        ipol.OrdinaryKriging(src, trg, "1.0 Exp(5.0)", nnearest=3)
+
+
+def test_ExternalDriftKriging_singular(ipol_data):
+    src = np.array([[0.0, 0.0], [0.0, 0.0], [4.0, 0.0], [8.0, 0.0]])
+    trg = np.array([[0.0, 0.0], [7.0, 0.0]])
+    ip = ipol.ExternalDriftKriging(
+        src,
+        trg,
+        "1.0 Exp(5.0)",
+        nnearest=2,
+        src_drift=np.array([0.0, 0.0, 1.0, 2.0]),
+        trg_drift=np.array([0.0, 2.0]),
+    )
+    res = ip(np.array([1.0, 1.0, 2.0, 3.0]))
+    np.testing.assert_allclose(res[1], 3.0)
+    assert np.all(np.isnan(ip.weights[0]))
+    assert np.isnan(ip.estimation_variance[0])
+    assert not np.any(np.isnan(ip.weights[1]))
+
+
 def test_MissingErrors(ipol_data):
     with pytest.raises(ipol.MissingSourcesError):
         ipol.Nearest(np.array([]), ipol_data.trg)
@@ -7,8 +7,11 @@ from dataclasses import dataclass
 
 import numpy as np
 import pytest
+import xarray as xr
 
-from wradlib import qual
+from wradlib import georef, qual, util
+
+from . import requires_dask, requires_gdal
 
 
 def test_get_bb_ratio():
@@ -60,6 +63,70 @@ def test_pulse_volume():
     )
 
 
+@requires_gdal
+@pytest.mark.parametrize("blocksize", [50, 120])
+def test_dem_beam_block_frac(blocksize):
+    # flat terrain in the west, mountains in the east of the radar
+    data = np.zeros((200, 300), dtype=np.int16)
+    data[:, 160:] = 3000
+    x, y = np.meshgrid(np.linspace(5.0, 8.0, 301), np.linspace(52.0, 50.0, 201))
+    dem = georef.create_raster_dataset(
+        data, np.stack([x, y], axis=-1), crs=georef.epsg_to_osr(4326)
+    )
+    site = (6.5, 51.0, 100.0)
+    r = np.arange(0.0, 60000.0, 500.0)
+    az = np.arange(0.0, 360.0)
+    elev = [0.5, 1.5]
+    # blocksize 120 gives blocks with as many rays as range bins
+    res = list(
+        qual.dem_beam_block_frac(r, az, elev, site, dem=dem, blocksize=blocksize)
+    )
+    assert len(res) == 2
+
+    for el, (pbb, cbb) in zip(elev, res):
+        assert pbb.shape == cbb.shape == (360, 120)
+        assert np.all(np.diff(cbb, axis=-1) >= 0)
+        np.testing.assert_array_equal(cbb[90, -1], 1.0)
+        np.testing.assert_array_equal(cbb[270], 0.0)
+        # same as processing the full sweep at once
+        xyz, aeqd = georef.spherical_to_xyz(r, az, el, site, squeeze=True)
+        coords = georef.reproject(xyz, src_crs=aeqd, trg_crs=georef.epsg_to_osr(4326))
+        terrain = georef.sample_raster_values(dem, coords[..., :2])
+        beamradius = util.half_power_radius(r, 1.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            full = qual.beam_block_frac(terrain, coords[..., 2], beamradius)
+        np.testing.assert_allclose(pbb, full)
+
+
+@requires_gdal
+def test_dem_beam_block_frac_srtm(monkeypatch):
+    extents = []
+
+    def get_srtm(extent, **kwargs):
+        # flat terrain slightly exceeding the requested extent
+        extents.append(extent)
+        x0, x1 = extent[0] - 0.01, extent[1] + 0.01
+        y0, y1 = extent[2] - 0.01, extent[3] + 0.01
+        x, y = np.meshgrid(np.linspace(x0, x1, 101), np.linspace(y1, y0, 101))
+        return georef.create_raster_dataset(
+            np.zeros((100, 100), dtype=np.int16),
+            np.stack([x, y], axis=-1),
+            crs=georef.epsg_to_osr(4326),
+        )
+
+    monkeypatch.setattr("wradlib.io.dem.get_srtm", get_srtm)
+    # sector scan north east of the site
+    site = (6.5, 51.0, 100.0)
+    r = np.arange(0.0, 60000.0, 500.0)
+    az = np.arange(30.0, 60.0)
+    ((pbb, cbb),) = qual.dem_beam_block_frac(r, az, 0.5, site)
+    lonmin, lonmax, latmin, latmax = extents[0]
+    assert lonmin <= site[0] <= lonmax
+    assert latmin <= site[1] <= latmax
+    assert pbb.shape == (30, 120)
+    assert not np.isnan(pbb).any()
+
+
 @pytest.fixture
 def bb_data():
     @dataclass(init=False, repr=False, eq=False)
@@ -107,3 +174,30 @@ def test_cum_beam_block_frac(bb_data):
     """
     cbb = qual.cum_beam_block_frac(bb_data.sample_pbb)
     assert np.allclose(cbb, bb_data.sample_cbb)
+
+
+def test_cum_beam_block_frac_stack(bb_data):
+    pbb = np.stack([bb_data.sample_pbb, bb_data.sample_pbb[:, ::-1]])
+    pbb[:, :, 1] = np.nan
+    cbb = qual.cum_beam_block_frac(pbb)
+    res = np.array([0.1, 0.1, 0.3, 0.3, 0.3, 0.4, 0.4])
+    np.testing.assert_allclose(cbb[0], np.broadcast_to(res, (2, 7)))
+    res = np.array([0.1, 0.1, 0.2, 0.2, 0.3, 0.3, 0.3])
+    np.testing.assert_allclose(cbb[1], np.broadcast_to(res, (2, 7)))
+
+    da = xr.DataArray(pbb, dims=["elevation", "azimuth", "range"])
+    out = da.wrl.qual.cum_beam_block_frac()
+    assert out.dims == da.dims
+    np.testing.assert_allclose(out.values, cbb)
+
+
+@requires_dask
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int16])
+def test_cum_beam_block_frac_dask(bb_data, dtype):
+    da = xr.DataArray(
+        bb_data.sample_pbb.astype(dtype), dims=["azimuth", "range"]
+    ).chunk(azimuth=1)
+    out = da.wrl.qual.cum_beam_block_frac()
+    res = out.compute()
+    assert out.dtype == res.dtype == res.data.dtype
+    np.testing.assert_allclose(res.values, qual.cum_beam_block_frac(da.values))
@@ -4,6 +4,8 @@
 
 import datetime as dt
 import os
+import subprocess
+import sys
 from dataclasses import dataclass
 
 import numpy as np
@@ -83,6 +85,39 @@ def test_import_optional():
     mod = util.import_optional("h8x")
     with pytest.raises(AttributeError):
         mod.test()
+    assert not util.has_import(mod)
+
+
+def test_import_optional_lazy():
+    mod = util.import_optional("wradlib.tests._h8x_never_imported")
+    assert isinstance(mod, util.LazyModule)
+    assert "wradlib.tests._h8x_never_imported" not in sys.modules
+    assert not util.has_import(mod)
+    # already imported modules are returned directly
+    assert util.import_optional("numpy") is np
+
+
+def test_import_wradlib(record_property):
+    # import wradlib in a fresh interpreter and record loaded modules
+    code = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        "import wradlib\n"
+        "print(time.perf_counter() - t0)\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    record_property("import_time", float(out[0]))
+    modules = set(out[1].split())
+    record_property("import_modules", len(modules))
+    heavy = ["osgeo", "matplotlib", "cartopy", "h5py", "netCDF4", "xradar"]
+    assert not modules & set(heavy)
+    # subpackages are only imported on access
+    assert "wradlib.xarray" in modules
+    assert "wradlib.georef" not in modules
+    assert "wradlib.io" not in modules
 
 
 def test_roll2d_polar():
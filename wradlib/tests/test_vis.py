@@ -19,7 +19,7 @@ from . import (
     requires_secrets,
 )
 
-if not isinstance(mpl, util.OptionalModuleStub):
+if util.has_import(mpl):
     mpl.use("Agg")
 
 pl = util.import_optional("matplotlib.pyplot")
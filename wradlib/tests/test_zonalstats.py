@@ -2,6 +2,7 @@
 # Copyright (c) 2011-2023, wradlib developers.
 # Distributed under the MIT License. See LICENSE.txt for more info.
 
+import os
 import tempfile
 from dataclasses import dataclass
 
@@ -500,6 +501,16 @@ def test_ZonalStatsBase_w(stats_base):
     np.testing.assert_equal(zdp.ix, np.array([[0], [1]]))
 
 
+@requires_geos
+@requires_gdal
+def test_ZonalStatsBase_matrix(stats_base):
+    # leftover spatial filter on the source layer
+    geom = georef.numpy_to_ogr(stats_base.box5, "Polygon")
+    assert len(stats_base.zdp.src.get_data_by_geom(geom)) == 1
+    zdp = zonalstats.ZonalStatsBase(stats_base.zdp)
+    assert zdp.matrix.shape == (2, 2)
+
+
 @requires_geos
 @requires_gdal
 def test_ZonalStatsBase__check_vals(stats_base):
@@ -522,6 +533,102 @@ def test_ZonalStatsBase_var(stats_base):
     np.testing.assert_equal(zdp.var(np.arange(10, 21, 10)), np.array([0, 0]))
 
 
+def test_ZonalStatsBase_stats():
+    ix = [np.array([0, 1, 2]), np.array([], dtype=int), np.array([2, 4])]
+    w = [np.array([1.0, 2.0, 1.0]), np.array([]), np.array([0.5, 1.5])]
+    zdp = zonalstats.ZonalStatsBase(ix=ix, w=w)
+    assert zdp.matrix.shape == (3, 5)
+    np.testing.assert_equal(zdp.check_empty(), [False, True, False])
+
+    vals = np.array([1.0, 2.0, 3.0, 100.0, 5.0])
+    np.testing.assert_allclose(zdp.mean(vals), [2.0, np.nan, 4.5])
+    np.testing.assert_allclose(zdp.var(vals), [0.5, np.nan, 0.75])
+    np.testing.assert_allclose(zdp.sum(vals), [8.0, np.nan, 9.0])
+    np.testing.assert_allclose(zdp.min(vals), [1.0, np.nan, 3.0])
+    np.testing.assert_allclose(zdp.max(vals), [3.0, np.nan, 5.0])
+    np.testing.assert_equal(zdp.count(vals), [3, 0, 2])
+
+    # stack of time steps
+    stack = np.stack([vals, vals * 2, vals * 3], axis=-1)
+    stack[0, 1] = np.nan
+    mean = zdp.mean(stack)
+    assert mean.shape == (3, 3)
+    np.testing.assert_allclose(mean[:, 2], zdp.mean(vals * 3))
+    np.testing.assert_allclose(zdp.var(stack)[:, 0], zdp.var(vals))
+    assert np.isnan(mean[0, 1])
+    np.testing.assert_equal(zdp.count(stack)[0], [3, 2, 3])
+    assert zdp.max(stack).shape == (3, 3)
+
+    with pytest.raises(ValueError, match="cannot be subscripted"):
+        zdp.mean(np.arange(4.0))
+
+
+def test_ZonalStatsBase_dump_weights():
+    ix = [np.array([0, 1, 2]), np.array([], dtype=int), np.array([2, 4])]
+    w = [np.array([1.0, 2.0, 1.0]), np.array([]), np.array([0.5, 1.5])]
+    zdp = zonalstats.ZonalStatsBase(ix=ix, w=w)
+    vals = np.array([1.0, 2.0, 3.0, 100.0, 5.0])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zdp.dump_weights(tmpdir)
+        matrix = zonalstats.load_zonal_weights(tmpdir)
+        assert not matrix.data.flags.writeable
+        zdp2 = zonalstats.ZonalStatsBase(matrix=matrix)
+        assert zdp2.zdata is None
+        np.testing.assert_allclose(zdp2.mean(vals), zdp.mean(vals))
+        for ix1, ix2, w1, w2 in zip(ix, zdp2.ix, w, zdp2.w):
+            np.testing.assert_equal(ix2, ix1)
+            np.testing.assert_equal(w2, w1)
+        del matrix, zdp2
+
+
+def test_get_zonal_cache_key():
+    src = np.arange(20.0).reshape(10, 2)
+    trg = np.arange(40.0).reshape(2, 10, 2)
+    key = zonalstats.get_zonal_cache_key(src, trg)
+    assert key == zonalstats.get_zonal_cache_key(src.copy(), trg.copy())
+    assert key != zonalstats.get_zonal_cache_key(src, trg, buf=1.0)
+    assert key != zonalstats.get_zonal_cache_key(src, trg[::-1])
+    assert key != zonalstats.get_zonal_cache_key(trg, src)
+    poly = zonalstats.get_zonal_cache_key(src, trg, zdclass=zonalstats.ZonalDataPoly)
+    point = zonalstats.get_zonal_cache_key(src, trg, zdclass=zonalstats.ZonalDataPoint)
+    assert len({key, poly, point}) == 3
+    assert key == zonalstats.get_zonal_cache_key(src, trg, silent=True)
+    assert key != zonalstats.get_zonal_cache_key(src, trg, mode="ogr")
+
+
+@requires_geos
+@requires_gdal
+@pytest.mark.parametrize("zsclass", ["Poly", "Point"])
+def test_ZonalStats_cache(stats_base, monkeypatch, zsclass):
+    zsclass = getattr(zonalstats, f"ZonalStats{zsclass}")
+    src = stats_base.src
+    kwargs = dict(trg=stats_base.trg, crs=stats_base.crs, silent=True)
+    if zsclass is zonalstats.ZonalStatsPoint:
+        # box centers lie on the target corners
+        src = src[:, :-1].mean(axis=1)
+        kwargs["buf"] = 1000.0
+    vals = np.array([1.0, 2.0])
+    ref = zsclass(src, **kwargs).mean(vals)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # cache directory is created on first use
+        cache = os.path.join(tmpdir, "cache")
+        zs1 = zsclass(src, cache=cache, **kwargs)
+        assert len(os.listdir(cache)) == 1
+
+        # second build loads weights without intersecting geometries
+        def fail(*args, **kwargs):
+            raise AssertionError("weights recomputed")
+
+        with monkeypatch.context() as m:
+            m.setattr(zonalstats.ZonalDataBase, "__init__", fail)
+            zs2 = zsclass(src, cache=cache, **kwargs)
+        assert len(os.listdir(cache)) == 1
+        for zs in [zs1, zs2]:
+            assert not zs.matrix.data.flags.writeable
+            np.testing.assert_allclose(zs.mean(vals), ref)
+        del zs, zs1, zs2
+
+
 @pytest.fixture
 def zonal_data():
     @dataclass(init=False, repr=False, eq=False)
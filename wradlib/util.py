@@ -36,6 +36,7 @@ import datetime as dt
 import importlib
 import inspect
 import os
+import sys
 import warnings
 from functools import singledispatch
 
@@ -44,7 +45,8 @@ import xarray as xr
 from scipy import ndimage, signal
 from scipy.spatial import KDTree
 
-from wradlib import georef, version
+import wradlib
+from wradlib import version
 
 
 class OptionalModuleStub:
@@ -89,9 +91,12 @@ def import_optional(module, dep=None):
     Returns
     -------
     mod : object
-          if module is present, returns the module object, on ImportError
-          returns an instance of `OptionalModuleStub` which will raise an
-          AttributeError as soon as any attribute is accessed.
+          if module is already imported, returns the module object, otherwise
+          returns a `LazyModule` proxy which imports the module on first
+          attribute access. If the module is not installed, accessing any
+          attribute raises an AttributeError (see `OptionalModuleStub`).
+          Use :func:`~wradlib.util.has_import` to check whether the module
+          is available.
 
     Examples
     --------
@@ -118,14 +123,49 @@ def import_optional(module, dep=None):
     Please refer to https://docs.wradlib.org/en/stable/installation.html#optional-dependencies
     for further instructions.
     """
-    try:
-        mod = importlib.import_module(module)
-    except ImportError:
-        mod = OptionalModuleStub(module, dep=dep)
-
+    # already imported modules are returned as is
+    mod = sys.modules.get(module)
+    if mod is None:
+        mod = LazyModule(module, dep=dep)
     return mod
 
 
+class LazyModule:
+    """Proxy for an optional module, which is imported on first attribute
+    access.
+
+    If the module is not installed, attribute access behaves like
+    :class:`OptionalModuleStub`.
+    """
+
+    def __init__(self, name, dep=None):
+        self.__dict__.update(_name=name, _dep=dep, _mod=None)
+
+    def _load(self):
+        mod = self.__dict__["_mod"]
+        if mod is None:
+            try:
+                mod = importlib.import_module(self._name)
+            except ImportError:
+                mod = OptionalModuleStub(self._name, dep=self._dep)
+            self.__dict__["_mod"] = mod
+        return mod
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self.__dict__["_mod"] is None:
+            return f"<lazy module {self._name!r}>"
+        return repr(self._load())
+
+
 def warn(message, category=None, stacklevel=3):
     """Emit user level warning"""
     warnings.warn(message, category, stacklevel=stacklevel)
@@ -184,6 +224,22 @@ def _idvalid(data, *, isinvalid=None, minval=None, maxval=None):
     Invalid values are NaN and Inf. Other invalid values can be passed using
     the isinvalid keyword argument.
 
+    Parameters
+    ----------
+    data : :class:`numpy:numpy.ndarray`
+    isinvalid : list
+        list of what is considered an invalid value
+
+    """
+    valid = _isvalid(data, isinvalid=isinvalid, minval=minval, maxval=maxval)
+    return np.where(valid)[0]
+
+
+def _isvalid(data, *, isinvalid=None, minval=None, maxval=None):
+    """Returns boolean mask of valid entries in an array
+
+    See :func:`_idvalid` for the meaning of the parameters.
+
     Parameters
     ----------
     data : :class:`numpy:numpy.ndarray`
@@ -193,15 +249,14 @@ def _idvalid(data, *, isinvalid=None, minval=None, maxval=None):
     """
     if isinvalid is None:
         isinvalid = [-99.0, 99, -9999.0, -9999]
-    ix = np.ma.masked_invalid(data).mask
-    for el in isinvalid:
-        ix = np.logical_or(ix, np.ma.masked_where(data == el, data).mask)
+    mask = np.ma.getmaskarray(data)
+    data = np.ma.getdata(data)
+    valid = ~mask & np.isfinite(data) & ~np.isin(data, isinvalid)
     if minval is not None:
-        ix = np.logical_or(ix, np.ma.masked_less(data, minval).mask)
+        valid &= ~(data < minval)
     if maxval is not None:
-        ix = np.logical_or(ix, np.ma.masked_greater(data, maxval).mask)
-
-    return np.where(np.logical_not(ix))[0]
+        valid &= ~(data > maxval)
+    return valid
 
 
 def meshgrid_n(*arrs):
@@ -1112,6 +1167,8 @@ def _open_file(name):
 
 
 def has_import(module):
+    if isinstance(module, LazyModule):
+        module = module._load()
     return not isinstance(module, OptionalModuleStub)
 
 
@@ -1263,7 +1320,7 @@ def cross_section_ppi(
     ds["sweep_mode"] = ds["sweep_mode"].min()
 
     # Georeference the data
-    ds = ds.pipe(georef.georeference, crs=crs)
+    ds = ds.pipe(wradlib.georef.georeference, crs=crs)
 
     try:
         return ds.sel(azimuth=azimuth, method=method, tolerance=tolerance)
@@ -21,9 +21,9 @@ __doc__ = __doc__.format("\n   ".join(__all__))
 from pprint import pprint
 
 import numpy as np
-from scipy import spatial, stats
+from scipy import stats
 
-from wradlib import util
+from wradlib import ipol, util
 from wradlib.georef import polar
 
 
@@ -78,9 +78,10 @@ class PolarNeighbours:
         self.binx = bin_coords[..., 0].ravel()
         self.biny = bin_coords[..., 1].ravel()
         # compute the KDTree
-        tree = spatial.KDTree(list(zip(self.binx, self.biny)))
+        tree = ipol.get_kdtree(np.column_stack((self.binx, self.biny)))
         # query the tree for nearest neighbours
-        self.dist, self.ix = tree.query(list(zip(x, y)), k=nnear)
+        trg = np.column_stack((np.ravel(x), np.ravel(y)))
+        self.dist, self.ix = ipol.query_kdtree(tree, trg, k=nnear)
 
     def extract(self, vals):
         """Extracts the values from an array of shape (azimuth angles, \
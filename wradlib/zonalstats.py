@@ -48,6 +48,8 @@ __all__ = [
     "ZonalStatsBase",
     "ZonalStatsPoly",
     "ZonalStatsPoint",
+    "get_zonal_cache_key",
+    "load_zonal_weights",
     "mask_from_bbox",
     "get_bbox",
     "grid_centers_to_vertices",
@@ -55,11 +57,13 @@ __all__ = [
 ]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import hashlib
 import os
+import shutil
 import tempfile
 
 import numpy as np
-from scipy import spatial
+from scipy import sparse, spatial
 
 from wradlib import georef, io
 from wradlib.util import has_import, import_optional, warn
@@ -319,6 +323,52 @@ class ZonalDataBase:
         """Retrieve index and weight from dst DataSource"""
         raise NotImplementedError
 
+    def _get_dst_columns(self, *, props=None):
+        """Retrieve target and source index and geometry properties of all
+        intersections in one pass over the dst DataSource
+
+        Keyword Arguments
+        -----------------
+        props : list
+            Property Names to retrieve
+
+        Returns
+        -------
+        trg_index : :class:`numpy:numpy.ndarray`
+            target indices
+        src_index : :class:`numpy:numpy.ndarray`
+            source indices
+        props : list
+            list of property arrays
+        """
+        attrs, props = self.dst.get_attrs_and_props(
+            attrs=["trg_index", "src_index"], props=[] if props is None else props
+        )
+        trg_index = np.array(attrs[0], dtype=np.intp)
+        src_index = np.array(attrs[1], dtype=np.intp)
+        return trg_index, src_index, [np.array(prop) for prop in props]
+
+    def _group_by_target(self, trg_index, *values):
+        """Group values of intersections by their target index
+
+        Parameters
+        ----------
+        trg_index : :class:`numpy:numpy.ndarray`
+            target indices
+        values : :class:`numpy:numpy.ndarray`
+            arrays of the same length as trg_index
+
+        Returns
+        -------
+        ret : tuple
+            lists of arrays, one array per target polygon, for each of values
+        """
+        cnt = self.trg.ds.GetLayer().GetFeatureCount()
+        # stable sort keeps intersection order within each target
+        order = np.argsort(trg_index, kind="stable")
+        splits = np.cumsum(np.bincount(trg_index, minlength=cnt))[:-1]
+        return tuple(np.split(np.asarray(v)[order], splits) for v in values)
+
     def _get_intersection(self, *, trg=None, idx=None, buf=0.0):
         """Just a toy function if you want to inspect the intersection
         points/polygons of an arbitrary target or a target by index.
@@ -388,24 +438,15 @@ class ZonalDataPoly(ZonalDataBase):
     def _get_idx_weights(self):
         """Retrieve index and weight from dst DataSource
 
-        Iterates over all trg DataSource Polygons
+        Reads all intersections at once and groups them by target polygon
 
         Returns
         -------
         ret : tuple
             (index, weight) arrays
         """
-        trg = self.trg.ds.GetLayer()
-        cnt = trg.GetFeatureCount()
-        ret = [[] for _ in range(2)]
-        for index in range(cnt):
-            arr, w = self.dst.get_attrs_and_props(
-                attrs=["src_index"], props=["Area"], filt=("trg_index", index)
-            )
-            arr.append(w[0])
-            for i, k in enumerate(arr):
-                ret[i].append(np.array(k))
-        return tuple(ret)
+        trg_index, src_index, (area,) = self._get_dst_columns(props=["Area"])
+        return self._group_by_target(trg_index, src_index, area)
 
 
 class ZonalDataPoint(ZonalDataBase):
@@ -439,22 +480,17 @@ class ZonalDataPoint(ZonalDataBase):
     def _get_idx_weights(self):
         """Retrieve index and weight from dst DataSource
 
-        Iterates over all trg DataSource Polygons
+        Reads all intersections at once and groups them by target polygon
 
         Returns
         -------
         ret : tuple
             (index, weight) arrays
         """
-        trg = self.trg.ds.GetLayer()
-        cnt = trg.GetFeatureCount()
-        ret = [[] for _ in range(2)]
-        for index in range(cnt):
-            arr = self.dst.get_attributes(["src_index"], filt=("trg_index", index))
-            arr.append([1.0 / len(arr[0])] * len(arr[0]))
-            for i, k in enumerate(arr):
-                ret[i].append(np.array(k))
-        return tuple(ret)
+        trg_index, src_index, _ = self._get_dst_columns()
+        cnt = self.trg.ds.GetLayer().GetFeatureCount()
+        counts = np.bincount(trg_index, minlength=cnt)
+        return self._group_by_target(trg_index, src_index, 1.0 / counts[trg_index])
 
 
 class ZonalStatsBase:
@@ -467,23 +503,39 @@ class ZonalStatsBase:
     If no source points or polygons can be associated to a target polygon (e.g.
     no intersection), the zonal statistic for that target will be NaN.
 
+    The relation of source indices and weights is held as sparse matrix in
+    compressed sparse row format (targets x sources). All statistics are
+    evaluated for 1-d values of shape (nsrc, ) or a stack of values of shape
+    (nsrc, ntime) in one call.
+
     Parameters
     ----------
     src : :class:`wradlib.zonalstats.ZonalDataPoly` or str
         ZonalDataPoly object or filename pointing to ZonalDataPoly ESRI
         shapefile containing necessary ZonalData.
         ZonalData is available as ``zdata``-property inside class instance.
+    ix : sequence
+        sequence of source index arrays, one per target
+    w : sequence
+        sequence of weight arrays, one per target
+    matrix : :class:`scipy:scipy.sparse.csr_array`
+        sparse (ntrg, nsrc) weight matrix, e.g. from
+        :func:`~wradlib.zonalstats.load_zonal_weights`
 
     Examples
     --------
     See :ref:`/notebooks/zonalstats/zonalstats.ipynb#ZonalStats`.
     """
 
-    def __init__(self, src=None, ix=None, w=None):
+    def __init__(self, src=None, ix=None, w=None, *, matrix=None):
         self._ix = None
         self._w = None
+        self._matrix = None
 
-        if src is not None:
+        if matrix is not None:
+            self._zdata = None
+            self._matrix = matrix
+        elif src is not None:
             if isinstance(src, ZonalDataBase):
                 if not src.count_intersections:
                     raise ValueError(
@@ -509,27 +561,76 @@ class ZonalStatsBase:
 
     @property
     def ix(self):
+        if self._ix is None and self._matrix is not None:
+            self._ix = np.array(
+                np.split(self._matrix.indices, self._matrix.indptr[1:-1]), dtype=object
+            )
         return self._ix
 
     @ix.setter
     def ix(self, value):
         self._ix = value
+        self._matrix = None
 
     @property
     def w(self):
+        if self._w is None and self._matrix is not None:
+            self._w = np.array(
+                np.split(self._matrix.data, self._matrix.indptr[1:-1]), dtype=object
+            )
         return self._w
 
     @w.setter
     def w(self, value):
         self._w = value
+        self._matrix = None
+
+    @property
+    def matrix(self):
+        """Returns sparse (ntrg, nsrc) weight matrix in CSR format"""
+        if self._matrix is None:
+            self._matrix = self._make_matrix()
+        return self._matrix
+
+    def dump_weights(self, dirname):
+        """Output sparse weight matrix to directory of numpy files
+
+        The directory can be opened memory-mapped with
+        :func:`~wradlib.zonalstats.load_zonal_weights`.
+
+        Parameters
+        ----------
+        dirname : str
+            path to directory, will be created
+        """
+        mat = self.matrix
+        os.makedirs(dirname, exist_ok=True)
+        np.save(os.path.join(dirname, "shape.npy"), np.array(mat.shape))
+        np.save(os.path.join(dirname, "indptr.npy"), mat.indptr)
+        np.save(os.path.join(dirname, "indices.npy"), mat.indices)
+        np.save(os.path.join(dirname, "data.npy"), mat.data)
+
+    def _make_matrix(self):
+        """Create sparse weight matrix from source indices and weights."""
+        ix = [np.atleast_1d(i) for i in self.ix]
+        w = [np.atleast_1d(i) for i in self.w]
+        indptr = np.zeros(len(ix) + 1, dtype=np.intp)
+        np.cumsum([len(i) for i in ix], out=indptr[1:])
+        indices = np.concatenate(ix + [np.zeros(0)]).astype(np.intp)
+        data = np.concatenate(w + [np.zeros(0)]).astype(float)
+        if self.zdata is not None:
+            lyr = self.zdata.src.ds.GetLayerByName("src")
+            lyr.ResetReading()
+            lyr.SetSpatialFilter(None)
+            nsrc = lyr.GetFeatureCount()
+        else:
+            nsrc = indices.max() + 1 if len(indices) else 0
+        return sparse.csr_array((data, indices, indptr), shape=(len(ix), nsrc))
 
     def check_empty(self):
         """ """
-        isempty = np.repeat(False, len(self.w))
-        for i, weights in enumerate(self.w):
-            if np.sum(weights) == 0 or np.isnan(np.sum(weights)):
-                isempty[i] = True
-        return isempty
+        wsum = self.matrix.sum(axis=1)
+        return (wsum == 0) | np.isnan(wsum)
 
     def _check_ix_w(self, ix, w):
         """TODO Basic check of target attributes (sequence of values)."""
@@ -554,18 +655,35 @@ class ZonalStatsBase:
             if len(vals) != src_len:
                 raise ValueError(f"Argument `vals` must be of length {src_len}.")
         else:
-            imax = 0
-            for i in self.ix:
-                mx = np.nanmax(i)
-                if imax < mx:
-                    imax = mx
-            if len(vals) <= imax:
+            if len(vals) < self.matrix.shape[1]:
                 raise ValueError(
                     "Argument `vals` cannot be subscripted with current index values."
                 )
 
         return vals
 
+    def _get_vals(self, vals):
+        """Check values and reshape to (nsrc, ntime)."""
+        vals = np.asanyarray(self._check_vals(vals))
+        return vals[: self.matrix.shape[1]].reshape(self.matrix.shape[1], -1)
+
+    def _reduce(self, ufunc, vals):
+        """Reduce values of (ntrg x nsrc) matrix entries of each target with
+        given ufunc."""
+        mat = self.matrix
+        out = np.full((mat.shape[0], vals.shape[1]), np.nan)
+        valid = np.diff(mat.indptr) > 0
+        if np.any(valid):
+            out[valid] = ufunc.reduceat(vals, mat.indptr[:-1][valid], axis=0)
+        return out
+
+    def _output(self, out, vals, name=None):
+        """Reshape output to target shape, set target attributes."""
+        out = out.reshape((len(out),) + np.shape(vals)[1:])
+        if name is not None and self.zdata is not None and out.ndim == 1:
+            self.zdata.trg.set_attribute(name, out)
+        return out
+
     def mean(self, vals):
         """Evaluate (weighted) zonal mean for values given at the source \
         points.
@@ -573,23 +691,22 @@ class ZonalStatsBase:
         Parameters
         ----------
         vals : :class:`numpy:numpy.ndarray`
-            1-d array of type float with the same length as self.src
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
             Values at the source element for which to compute zonal statistics
 
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of shape (ntrg, ) or (ntrg, ntime)
         """
-        self._check_vals(vals)
+        v = self._get_vals(vals)
         self.isempty = self.check_empty()
-        out = np.zeros(len(self.ix)) * np.nan
-        out[~self.isempty] = np.array(
-            [
-                np.average(vals[self.ix[i].astype(int)], weights=self.w[i])
-                for i in np.arange(len(self.ix))[~self.isempty]
-            ]
-        )
-        if self.zdata is not None:
-            self.zdata.trg.set_attribute("mean", out)
-
-        return out
+        wsum = self.matrix.sum(axis=1)
+        out = self.matrix @ v
+        out[self.isempty] = np.nan
+        out[~self.isempty] /= wsum[~self.isempty, np.newaxis]
+        return self._output(out, vals, name="mean")
 
     def var(self, vals):
         """Evaluate (weighted) zonal variance for values given at the source \
@@ -598,27 +715,108 @@ class ZonalStatsBase:
         Parameters
         ----------
         vals : :class:`numpy:numpy.ndarray`
-            1-d  array of type float with the same length as self.src
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
             Values at the source element for which to compute
             zonal statistics
 
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of shape (ntrg, ) or (ntrg, ntime)
         """
-        self._check_vals(vals)
-        mean = self.mean(vals)
-        out = np.zeros(len(self.ix)) * np.nan
-        out[~self.isempty] = np.array(
-            [
-                np.average(
-                    (vals[self.ix[i].astype(int)] - mean[i]) ** 2, weights=self.w[i]
-                )
-                for i in np.arange(len(self.ix))[~self.isempty]
-            ]
-        )
+        v = self._get_vals(vals)
+        mean = self.mean(vals).reshape(-1, v.shape[1])
+        mat = self.matrix
+        rows = np.repeat(np.arange(mat.shape[0]), np.diff(mat.indptr))
+        dev = mat.data[:, np.newaxis] * (v[mat.indices] - mean[rows]) ** 2
+        out = self._reduce(np.add, dev)
+        out[self.isempty] = np.nan
+        out[~self.isempty] /= mat.sum(axis=1)[~self.isempty, np.newaxis]
+        return self._output(out, vals, name="var")
+
+    def sum(self, vals):
+        """Evaluate (weighted) zonal sum for values given at the source \
+        points.
 
-        if self.zdata is not None:
-            self.zdata.trg.set_attribute("var", out)
+        For areal weights this is the integral of the values over the
+        target polygon.
 
-        return out
+        Parameters
+        ----------
+        vals : :class:`numpy:numpy.ndarray`
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
+            Values at the source element for which to compute zonal statistics
+
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of shape (ntrg, ) or (ntrg, ntime)
+        """
+        v = self._get_vals(vals)
+        out = self.matrix @ v
+        out[self.check_empty()] = np.nan
+        return self._output(out, vals)
+
+    def min(self, vals):
+        """Evaluate zonal minimum for values given at the source points.
+
+        Parameters
+        ----------
+        vals : :class:`numpy:numpy.ndarray`
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
+            Values at the source element for which to compute zonal statistics
+
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of shape (ntrg, ) or (ntrg, ntime)
+        """
+        v = self._get_vals(vals)
+        return self._output(self._reduce(np.minimum, v[self.matrix.indices]), vals)
+
+    def max(self, vals):
+        """Evaluate zonal maximum for values given at the source points.
+
+        Parameters
+        ----------
+        vals : :class:`numpy:numpy.ndarray`
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
+            Values at the source element for which to compute zonal statistics
+
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of shape (ntrg, ) or (ntrg, ntime)
+        """
+        v = self._get_vals(vals)
+        return self._output(self._reduce(np.maximum, v[self.matrix.indices]), vals)
+
+    def count(self, vals):
+        """Evaluate number of valid (non-NaN) source values within each zone.
+
+        Parameters
+        ----------
+        vals : :class:`numpy:numpy.ndarray`
+            array of type float with shape (nsrc, ) or (nsrc, ntime) with nsrc
+            the length of self.src
+            Values at the source element for which to compute zonal statistics
+
+        Returns
+        -------
+        out : :class:`numpy:numpy.ndarray`
+            array of int with shape (ntrg, ) or (ntrg, ntime)
+        """
+        v = self._get_vals(vals)
+        mat = self.matrix
+        ones = sparse.csr_array(
+            (np.ones_like(mat.data, dtype=np.intp), mat.indices, mat.indptr),
+            shape=mat.shape,
+        )
+        return self._output(ones @ (~np.isnan(v)).astype(np.intp), vals)
 
 
 class ZonalStatsPoly(ZonalStatsBase):
@@ -632,17 +830,28 @@ class ZonalStatsPoly(ZonalStatsBase):
 
     Keyword arguments
     -----------------
+    cache : str
+        path to cache directory. Index/weight relations are stored there
+        keyed by source and target geometries and ZonalData arguments
+        (see :func:`~wradlib.zonalstats.get_zonal_cache_key`) and are loaded
+        memory-mapped, if already available.
+    **kwargs : dict
+        keyword arguments of :class:`~wradlib.zonalstats.ZonalDataPoly`
 
     Examples
     --------
     See :ref:`/notebooks/zonalstats/zonalstats.ipynb#ZonalStats`
     """
 
-    def __init__(self, src=None, **kwargs):
+    def __init__(self, src=None, *, cache=None, **kwargs):
+        if cache is not None and src is not None:
+            matrix = _get_cached_weights(ZonalDataPoly, src, cache, **kwargs)
+            super().__init__(matrix=matrix)
+            return
         if src is not None:
             if not isinstance(src, ZonalDataPoly):
                 src = ZonalDataPoly(src, **kwargs)
-        super().__init__(src, **kwargs)
+        super().__init__(src)
 
 
 class ZonalStatsPoint(ZonalStatsBase):
@@ -656,17 +865,142 @@ class ZonalStatsPoint(ZonalStatsBase):
 
     Keyword arguments
     -----------------
+    cache : str
+        path to cache directory. Index/weight relations are stored there
+        keyed by source and target geometries and ZonalData arguments
+        (see :func:`~wradlib.zonalstats.get_zonal_cache_key`) and are loaded
+        memory-mapped, if already available.
+    **kwargs : dict
+        keyword arguments of :class:`~wradlib.zonalstats.ZonalDataPoint`
 
     Examples
     --------
     See :ref:`/notebooks/zonalstats/zonalstats.ipynb#ZonalStats`
     """
 
-    def __init__(self, src, **kwargs):
+    def __init__(self, src, *, cache=None, **kwargs):
+        if cache is not None and src is not None:
+            matrix = _get_cached_weights(ZonalDataPoint, src, cache, **kwargs)
+            super().__init__(matrix=matrix)
+            return
         if src is not None:
             if not isinstance(src, ZonalDataPoint):
                 src = ZonalDataPoint(src, **kwargs)
-        super().__init__(src, **kwargs)
+        super().__init__(src)
+
+
+def _update_geometry_hash(sha, obj):
+    """Update hash object with geometries of numpy array or vector data."""
+    if isinstance(obj, ZonalDataBase):
+        raise TypeError(
+            "Cache key can't be derived from ZonalData object, "
+            "provide source and target geometries."
+        )
+    try:
+        arr = np.ascontiguousarray(obj, dtype=np.float64)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.dtype != object:
+        sha.update(str(arr.shape).encode())
+        sha.update(arr.tobytes())
+        return
+    if not isinstance(obj, io.VectorSource):
+        obj = io.VectorSource(obj)
+    lyr = obj.ds.GetLayer()
+    lyr.ResetReading()
+    lyr.SetAttributeFilter(None)
+    lyr.SetSpatialFilter(None)
+    for feat in lyr:
+        sha.update(feat.GetGeometryRef().ExportToWkb())
+    lyr.ResetReading()
+
+
+def get_zonal_cache_key(src, trg, *, buf=0.0, crs=None, zdclass=None, **kwargs):
+    """Return cache key of index/weight relation of source and target geometries
+
+    Parameters
+    ----------
+    src : sequence or str or :class:`~wradlib.io.VectorSource`
+        source points (shape Nx2) or polygons (shape NxMx2) or vector data
+    trg : sequence or str or :class:`~wradlib.io.VectorSource`
+        target polygons or vector data
+    buf : float
+        buffer applied to the target polygons
+    crs : :py:class:`gdal:osgeo.osr.SpatialReference`
+        spatial reference of source and target
+    zdclass : type
+        :class:`~wradlib.zonalstats.ZonalDataBase` subclass creating the
+        index/weight relation, e.g. :class:`~wradlib.zonalstats.ZonalDataPoly`
+    **kwargs : dict
+        further keyword arguments of the ZonalData class
+
+    Returns
+    -------
+    key : str
+        sha256 hex digest
+    """
+    sha = hashlib.sha256()
+    if zdclass is not None:
+        sha.update(zdclass.__name__.encode())
+    _update_geometry_hash(sha, src)
+    sha.update(b"trg")
+    _update_geometry_hash(sha, trg)
+    sha.update(repr(float(buf)).encode())
+    if crs is not None:
+        sha.update(crs.ExportToWkt().encode())
+    # progress bar doesn't change the weights
+    kwargs.pop("silent", None)
+    for name, value in sorted(kwargs.items()):
+        sha.update(name.encode())
+        if hasattr(value, "ExportToWkt"):
+            value = value.ExportToWkt()
+        sha.update(repr(value).encode())
+    return sha.hexdigest()
+
+
+def load_zonal_weights(dirname, *, mmap_mode="r"):
+    """Load sparse index/weight relation from directory of numpy files
+
+    As written by :meth:`~wradlib.zonalstats.ZonalStatsBase.dump_weights`.
+    By default the arrays are memory-mapped read-only and can be shared
+    across processes.
+
+    Parameters
+    ----------
+    dirname : str
+        path to directory
+    mmap_mode : str
+        memory-map mode, see :func:`numpy:numpy.load`, defaults to "r"
+
+    Returns
+    -------
+    matrix : :class:`scipy:scipy.sparse.csr_array`
+        sparse (ntrg, nsrc) weight matrix
+    """
+    shape = tuple(np.load(os.path.join(dirname, "shape.npy")))
+    arrs = [
+        np.load(os.path.join(dirname, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in ["data", "indices", "indptr"]
+    ]
+    return sparse.csr_array(tuple(arrs), shape=shape, copy=False)
+
+
+def _get_cached_weights(zdclass, src, cache, **kwargs):
+    """Load weight matrix from cache, create and store if not available."""
+    key = get_zonal_cache_key(src, zdclass=zdclass, **kwargs)
+    dirname = os.path.join(cache, key)
+    if not os.path.exists(dirname):
+        zstats = ZonalStatsBase(zdclass(src, **kwargs))
+        # write to temporary directory and rename, concurrent writers
+        # may have finished first
+        os.makedirs(cache, exist_ok=True)
+        tmpdir = tempfile.mkdtemp(dir=cache)
+        zstats.dump_weights(tmpdir)
+        try:
+            os.rename(tmpdir, dirname)
+        except OSError:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+    return load_zonal_weights(dirname)
 
 
 def numpy_to_pathpatch(arr):